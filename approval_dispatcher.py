@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Approval Dispatcher - GOLD TIER
+Personal AI Employee Hackathon 0
+
+Single entry point for files moved into Vault/Approved/.
+
+Each approved file is routed by its frontmatter once (via the vault index)
+and claimed with an atomic rename into Vault/In_Progress/<route>/ before any
+consumer touches it. A rename can only succeed once, so two posters or the
+reasoner can never act on the same file.
+
+Routes:
+    email_reply, whatsapp_reply, linkedin_draft, facebook, twitter,
+    instagram, payment - and 'default' for everything else
+
+Consumer pattern:
+    dispatcher = ApprovalDispatcher(vault_path)
+    for claimed in dispatcher.claim('twitter'):
+        if post(claimed):
+            dispatcher.complete(claimed)     # -> Done/
+        else:
+            dispatcher.release(claimed)      # -> back to Approved/
+
+A standalone consumer's claim() scans Approved/ itself. In the orchestrator
+every consumer shares one dispatcher built with central=True: the
+orchestrator calls feed() on a timer - one scan of Approved/ for every
+route a consumer has asked for - and claim() / run_handlers() only drain
+the route's queue.
+
+A claim is stamped with the time it was taken (its mtime). Claims older
+than `claim_timeout` were left behind by a consumer that crashed or hung,
+and are returned to Approved/ automatically (checked at most once a
+minute); --recover returns every claim at once.
+
+Usage:
+    python approval_dispatcher.py Vault              # show routing of Approved/
+    python approval_dispatcher.py Vault --recover    # return all claims
+"""
+
+import os
+import time
+import queue
+import logging
+import argparse
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+import sys
+
+from vault_index import VaultIndex
+
+# Fix Windows console encoding
+if sys.platform == 'win32':
+    os.system('chcp 65001 > nul')
+
+
+ROUTES = (
+    'email_reply',
+    'whatsapp_reply',
+    'linkedin_draft',
+    'facebook',
+    'twitter',
+    'instagram',
+    'payment',
+)
+DEFAULT_ROUTE = 'default'
+CLAIM_TIMEOUT = 3600.0  # Seconds before an unfinished claim counts as abandoned
+RECOVER_INTERVAL = 60.0  # Seconds between automatic stale-claim checks
+
+# Type prefixes per route - checked in order, so exact reply types win
+_TYPE_PREFIXES = (
+    ('email_reply', 'email_reply'),
+    ('whatsapp_reply', 'whatsapp_reply'),
+    ('linkedin', 'linkedin_draft'),
+    ('facebook', 'facebook'),
+    ('twitter', 'twitter'),
+    ('instagram', 'instagram'),
+    ('payment', 'payment'),
+)
+
+
+def route_for(header: Dict[str, Any]) -> str:
+    """
+    Pick the route for an approved file from its frontmatter.
+    
+    Args:
+        header: Parsed frontmatter
+    
+    Returns:
+        Route name (DEFAULT_ROUTE if no handler type matches)
+    """
+    file_type = str(header.get('type', '')).lower()
+    platform = str(header.get('platform', '')).lower()
+    action = str(header.get('action', '')).lower()
+    
+    for prefix, route in _TYPE_PREFIXES:
+        if file_type.startswith(prefix) or platform.startswith(prefix):
+            return route
+    if file_type == 'approval_request' and action == 'payment':
+        return 'payment'
+    return DEFAULT_ROUTE
+
+
+class ApprovalDispatcher:
+    """Routes approved files to per-type queues and claims them atomically."""
+    
+    def __init__(
+        self,
+        vault_path: Path,
+        index: Optional[VaultIndex] = None,
+        central: bool = False,
+        claim_timeout: float = CLAIM_TIMEOUT
+    ):
+        """
+        Initialize dispatcher.
+        
+        Args:
+            vault_path: Path to Obsidian vault
+            index: Shared vault index (created if not given)
+            central: Queues are filled by feed(); claim() does not scan
+            claim_timeout: Seconds before a claim is returned to Approved/
+        """
+        self.vault_path = Path(vault_path)
+        self.approved = self.vault_path / 'Approved'
+        self.done = self.vault_path / 'Done'
+        self.claims = self.vault_path / 'In_Progress'
+        self.index = index or VaultIndex(self.vault_path)
+        self.central = central
+        self.claim_timeout = claim_timeout
+        self.logger = logging.getLogger(self.__class__.__name__)
+        
+        self.approved.mkdir(parents=True, exist_ok=True)
+        self.done.mkdir(parents=True, exist_ok=True)
+        
+        # Claimed files waiting for their consumer, one queue per route
+        self.queues: Dict[str, queue.Queue] = {
+            route: queue.Queue() for route in ROUTES + (DEFAULT_ROUTE,)
+        }
+        # Routes some consumer has asked for - the only ones feed() claims
+        self.subscribed: Set[str] = set()
+        self._lock = threading.Lock()
+        self._recovered_at = 0.0
+    
+    def _claim_folder(self, route: str) -> Path:
+        """Folder holding files claimed for a route."""
+        folder = self.claims / route
+        folder.mkdir(parents=True, exist_ok=True)
+        return folder
+    
+    def _claim_file(self, path: Path, route: str) -> Optional[Path]:
+        """
+        Atomically take ownership of an approved file.
+        
+        Returns:
+            Claimed path, or None if another consumer got there first
+        """
+        dest = self._claim_folder(route) / path.name
+        if dest.exists():
+            self.logger.warning(f"Already claimed, skipping: {path.name}")
+            return None
+        try:
+            os.rename(path, dest)
+            # The claim time, for stale-claim recovery
+            os.utime(dest)
+        except FileNotFoundError:
+            return None
+        self.index.remove_file(path)
+        return dest
+    
+    def dispatch(self, routes: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """
+        Route Approved/ in a single pass, claiming and queueing matching files.
+        
+        Args:
+            routes: Routes to claim for (default: all). Files for other
+                routes are left in Approved/ for their own consumer.
+        
+        Returns:
+            Number of files claimed per route
+        """
+        wanted = set(routes) if routes is not None else set(self.queues)
+        counts: Dict[str, int] = {}
+        if not wanted:
+            return counts
+        
+        with self._lock:
+            self.recover_stale(wanted)
+            for record in self.index.find_records('Approved'):
+                route = route_for(record['frontmatter'])
+                if route not in wanted:
+                    continue
+                claimed = self._claim_file(record['path'], route)
+                if claimed is None:
+                    continue
+                self.queues[route].put(claimed)
+                counts[route] = counts.get(route, 0) + 1
+                self.logger.info(f"Claimed {record['name']} for {route}")
+        
+        return counts
+    
+    def feed(self) -> Dict[str, int]:
+        """
+        One scan of Approved/ for every subscribed route (central dispatcher).
+        
+        Returns:
+            Number of files claimed per route
+        """
+        return self.dispatch(set(self.subscribed))
+    
+    def _take(self, routes: Iterable[str]):
+        """Subscribe to routes and, unless fed centrally, scan for them now."""
+        routes = set(routes)
+        self.subscribed.update(routes)
+        if not self.central:
+            self.dispatch(routes)
+    
+    def _next(self, route: str) -> Optional[Path]:
+        """Next queued claim for a route that is still claimed, or None."""
+        while True:
+            try:
+                claimed = self.queues[route].get_nowait()
+            except queue.Empty:
+                return None
+            # A stale claim returned to Approved/ may be queued twice
+            if claimed.exists():
+                return claimed
+    
+    def claim(self, route: str) -> List[Path]:
+        """
+        Claim all approved files for one route.
+        
+        Args:
+            route: Route name (see ROUTES)
+        
+        Returns:
+            Claimed file paths (now under In_Progress/<route>/)
+        """
+        self._take([route])
+        claimed: List[Path] = []
+        while True:
+            path = self._next(route)
+            if path is None:
+                return claimed
+            if path not in claimed:
+                claimed.append(path)
+    
+    def complete(self, claimed: Path, folder: str = 'Done') -> Path:
+        """Move a processed claim to its final folder (default: Done)."""
+        dest = self.vault_path / folder / claimed.name
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(claimed, dest)
+        self.index.update_file(dest)
+        return dest
+    
+    def release(self, claimed: Path) -> Path:
+        """Give a claim back to Approved/ (e.g. after a failed post)."""
+        dest = self.approved / claimed.name
+        os.replace(claimed, dest)
+        self.index.update_file(dest)
+        return dest
+    
+    def recover(self, routes: Optional[Iterable[str]] = None, max_age: float = 0.0) -> int:
+        """
+        Return claims left behind by a crashed consumer to Approved/.
+        
+        With max_age=0 every claim is returned - only do that when no
+        consumer for the routes is running.
+        
+        Args:
+            routes: Routes to recover (default: all)
+            max_age: Only return claims taken at least this many seconds ago
+        
+        Returns:
+            Number of files returned
+        """
+        count = 0
+        now = time.time()
+        for route in routes or self.queues:
+            folder = self.claims / route
+            if not folder.is_dir():
+                continue
+            for claimed in folder.glob('*.md'):
+                try:
+                    if max_age and now - claimed.stat().st_mtime < max_age:
+                        continue
+                    self.release(claimed)
+                except FileNotFoundError:
+                    continue  # Completed or released meanwhile
+                self.logger.info(f"Recovered stale claim: {route}/{claimed.name}")
+                count += 1
+        return count
+    
+    def recover_stale(self, routes: Optional[Iterable[str]] = None) -> int:
+        """
+        Return claims older than `claim_timeout` (at most once a minute).
+        
+        Args:
+            routes: Routes to check (default: all)
+        
+        Returns:
+            Number of files returned
+        """
+        now = time.monotonic()
+        if now - self._recovered_at < RECOVER_INTERVAL:
+            return 0
+        self._recovered_at = now
+        return self.recover(routes, max_age=self.claim_timeout)
+    
+    def run_handlers(self, handlers: Dict[str, Callable[[Path], bool]]) -> Dict[str, int]:
+        """
+        Claim (or, when fed centrally, take queued claims) and run
+        in-process handlers on the claimed files.
+        
+        A handler returning True completes the claim (unless it already
+        moved the file itself); False or an exception releases it.
+        
+        Args:
+            handlers: Route name -> callable(claimed_path) -> bool
+        
+        Returns:
+            Number of files claimed per route
+        """
+        counts: Dict[str, int] = {}
+        self._take(handlers.keys())
+        
+        for route, handler in handlers.items():
+            while True:
+                claimed = self._next(route)
+                if claimed is None:
+                    break
+                counts[route] = counts.get(route, 0) + 1
+                try:
+                    ok = handler(claimed)
+                except Exception as e:
+                    self.logger.error(f"Handler for {route} failed on {claimed.name}: {e}")
+                    ok = False
+                if not claimed.exists():
+                    continue
+                if ok:
+                    self.complete(claimed)
+                else:
+                    self.release(claimed)
+        
+        return counts
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Approval Dispatcher')
+    parser.add_argument('vault', type=str, help='Path to Obsidian vault')
+    parser.add_argument('--recover', action='store_true',
+                        help='Return every claim in In_Progress/<route>/ to Approved/')
+    args = parser.parse_args()
+    
+    dispatcher = ApprovalDispatcher(Path(args.vault))
+    
+    if args.recover:
+        print(f"Recovered {dispatcher.recover()} stale claim(s)")
+    
+    print("\n" + "="*60)
+    print("APPROVED FILE ROUTING")
+    print("="*60)
+    
+    records = dispatcher.index.find_records('Approved')
+    for record in records:
+        print(f"  {route_for(record['frontmatter']):<16} {record['name']}")
+    if not records:
+        print("  (Approved/ is empty)")
+    
+    print("\n" + "="*60 + "\n")
@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Approval Engine - GOLD TIER
+Personal AI Employee Hackathon 0
+
+Policy fast path for Vault/Pending_Approval/.
+
+Each pending item is classified by its frontmatter (same routing as the
+approval dispatcher) into an action - payment, invoice_create, email_send,
+whatsapp_send, social_post - and checked against the human_in_the_loop
+rules in mcp_config.json / Company_Handbook.md:
+
+    - amount below the auto_approve_under limit for its kind -> auto-approve
+    - action not in sensitive_actions                         -> auto-approve
+    - human_in_the_loop disabled                              -> auto-approve
+    - anything else (including unknown actions)               -> wait for a human
+
+Auto-approved items are renamed straight into Vault/Approved/ and logged to
+the audit trail. Items still pending after approval_timeout_hours are
+moved to Vault/Rejected/ by sweep().
+
+Time-to-action (file written -> approved) is logged with every decision,
+so --report can compare the median for human approvals alone (before)
+with the median over all approvals (after). Only the first arrival of a
+file in Approved/ counts: names are kept in Vault/.state/approvals_recorded,
+so a claim given back by ApprovalDispatcher.release() is not logged again.
+
+Usage:
+    engine = ApprovalEngine(vault_path, RuleEngine(handbook, config))
+    engine.process(draft_path)      # right after writing a draft
+    engine.sweep()                  # periodic: auto-approve + expire
+    
+    python approval_engine.py Vault             # dry run over Pending_Approval/
+    python approval_engine.py Vault --apply     # auto-approve and expire now
+    python approval_engine.py Vault --report    # median time-to-action
+"""
+
+import os
+import re
+import time
+import logging
+import argparse
+import threading
+import statistics
+from collections import deque
+from pathlib import Path
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+import sys
+
+from approval_dispatcher import route_for
+from audit_logger import get_audit_logger
+from frontmatter_reader import read_frontmatter
+from handbook_rules import RuleEngine
+from seen_store import SeenStore
+from vault_index import VaultIndex
+
+# Fix Windows console encoding
+if sys.platform == 'win32':
+    os.system('chcp 65001 > nul')
+
+
+ACTOR = 'approval_engine'
+
+# Dispatcher route -> sensitive action name in mcp_config.json
+ROUTE_ACTIONS = {
+    'email_reply': 'email_send',
+    'whatsapp_reply': 'whatsapp_send',
+    'linkedin_draft': 'social_post',
+    'facebook': 'social_post',
+    'twitter': 'social_post',
+    'instagram': 'social_post',
+    'payment': 'payment',
+}
+
+_AMOUNT = re.compile(r'[\d,]+(?:\.\d+)?')
+
+
+def action_for(header: Dict[str, Any]) -> Optional[str]:
+    """Sensitive-action name for a pending item (None if unknown)."""
+    file_type = str(header.get('type', '')).lower()
+    action = str(header.get('action', '')).lower()
+    if file_type.startswith('invoice') or action.startswith('invoice'):
+        return 'invoice_create'
+    return ROUTE_ACTIONS.get(route_for(header))
+
+
+def amount_for(header: Dict[str, Any]) -> Optional[float]:
+    """Numeric amount from an 'amount' field such as '$1,250.00' (None if absent)."""
+    value = header.get('amount')
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    match = _AMOUNT.search(str(value or ''))
+    if not match:
+        return None
+    try:
+        return float(match.group().replace(',', ''))
+    except ValueError:
+        return None
+
+
+class ApprovalEngine:
+    """Auto-approves items that policy allows and expires stale ones."""
+    
+    def __init__(
+        self,
+        vault_path: Path,
+        rules: RuleEngine,
+        index: Optional[VaultIndex] = None,
+        audit: Any = None
+    ):
+        """
+        Initialize engine.
+        
+        Args:
+            vault_path: Path to Obsidian vault
+            rules: Handbook / mcp_config.json rule engine
+            index: Shared vault index (created if not given)
+            audit: AuditLogger (the default vault logger if not given)
+        """
+        self.vault_path = Path(vault_path)
+        self.pending = self.vault_path / 'Pending_Approval'
+        self.approved = self.vault_path / 'Approved'
+        self.rejected = self.vault_path / 'Rejected'
+        self.rules = rules
+        self.index = index or VaultIndex(self.vault_path)
+        self.audit = audit or get_audit_logger(str(self.vault_path))
+        self.logger = logging.getLogger(self.__class__.__name__)
+        
+        for folder in (self.pending, self.approved, self.rejected):
+            folder.mkdir(parents=True, exist_ok=True)
+        
+        # Names already recorded (auto-approved, or their first arrival in
+        # Approved/) - released claims and restarts do not count them again
+        self._recorded = SeenStore(self.vault_path / '.state', 'approvals_recorded')
+        self._lock = threading.Lock()
+        self.time_to_action: Dict[str, deque] = {'auto': deque(maxlen=10000), 'human': deque(maxlen=10000)}
+    
+    def decide(self, header: Dict[str, Any]) -> Tuple[bool, str, Optional[str]]:
+        """
+        Apply the approval policy to an item's frontmatter.
+        
+        Returns:
+            (auto_approve, reason, action)
+        """
+        rules = self.rules.get()
+        action = action_for(header)
+        if not rules.hitl_enabled:
+            return True, 'human_in_the_loop disabled', action
+        
+        amount = amount_for(header)
+        kind = 'invoice' if action == 'invoice_create' else action
+        limit = rules.auto_approve_under.get(kind) if kind else None
+        if limit is not None and amount is not None and amount < limit:
+            return True, f'{kind} under ${limit:g}', action
+        
+        if action is None:
+            return False, 'unknown action', action
+        if rules.is_sensitive(action):
+            return False, f'{action} is a sensitive action', action
+        return True, f'{action} is not a sensitive action', action
+    
+    def process(self, path: Path, header: Optional[Dict[str, Any]] = None) -> Optional[Path]:
+        """
+        Auto-approve one pending item if policy allows.
+        
+        Args:
+            path: File in Pending_Approval/
+            header: Its frontmatter, if already parsed
+        
+        Returns:
+            New path in Approved/, or None if it still needs a human
+        """
+        if header is None:
+            try:
+                header = read_frontmatter(path)
+            except FileNotFoundError:
+                return None
+        
+        auto, reason, action = self.decide(header)
+        if not auto:
+            return None
+        
+        dest = self.approved / path.name
+        try:
+            written = path.stat().st_mtime
+            if dest.exists():
+                return None
+            os.rename(path, dest)
+        except FileNotFoundError:
+            return None  # Moved by a human (or another engine) first
+        self.index.move_file(path, dest)
+        
+        waited = max(0.0, time.time() - written)
+        with self._lock:
+            self._recorded.add(path.name)
+            self.time_to_action['auto'].append(waited)
+        self.audit.log_action(
+            action_type='approval_auto',
+            actor=ACTOR,
+            target=path.name,
+            parameters={'action': action, 'amount': header.get('amount')},
+            approval_status='auto',
+            approved_by='auto',
+            result='success',
+            metadata={'reason': reason, 'time_to_action_s': round(waited, 3)}
+        )
+        self.logger.info(f"Auto-approved {path.name} ({reason})")
+        return dest
+    
+    def record_approved(self, path: Path):
+        """
+        Note an item that arrived in Approved/ (time-to-action metrics).
+        
+        Only the first arrival of a name counts: items this engine moved
+        were already recorded, and a claim released back to Approved/ was
+        recorded when it first arrived. Anything else was approved by a human.
+        """
+        try:
+            waited = max(0.0, time.time() - path.stat().st_mtime)
+        except FileNotFoundError:
+            return
+        with self._lock:
+            if not self._recorded.add(path.name):
+                return
+            self.time_to_action['human'].append(waited)
+        self.audit.log_action(
+            action_type='approval_human',
+            actor=ACTOR,
+            target=path.name,
+            approval_status='approved',
+            approved_by='human',
+            result='success',
+            metadata={'time_to_action_s': round(waited, 3)}
+        )
+    
+    def sweep(self) -> Dict[str, int]:
+        """
+        Auto-approve eligible pending items and expire stale ones.
+        
+        Returns:
+            Counts of 'auto_approved', 'expired' and 'waiting' items
+        """
+        counts = {'auto_approved': 0, 'expired': 0, 'waiting': 0}
+        timeout = timedelta(hours=self.rules.get().approval_timeout_hours).total_seconds()
+        now = time.time()
+        
+        for record in self.index.find_records('Pending_Approval', refresh=True):
+            path = record['path']
+            if self.process(path, record['frontmatter']):
+                counts['auto_approved'] += 1
+            elif now - record['mtime_ns'] / 1e9 > timeout:
+                if self._expire(path, now - record['mtime_ns'] / 1e9):
+                    counts['expired'] += 1
+            else:
+                counts['waiting'] += 1
+        
+        if counts['auto_approved'] or counts['expired']:
+            self.logger.info(
+                f"Approval sweep: {counts['auto_approved']} auto-approved, "
+                f"{counts['expired']} expired, {counts['waiting']} waiting"
+            )
+        return counts
+    
+    def _expire(self, path: Path, age: float) -> bool:
+        """Move a stale pending item to Rejected/."""
+        dest = self.rejected / path.name
+        try:
+            if dest.exists():
+                return False
+            os.rename(path, dest)
+        except FileNotFoundError:
+            return False
+        self.index.move_file(path, dest)
+        self.audit.log_action(
+            action_type='approval_expired',
+            actor=ACTOR,
+            target=path.name,
+            approval_status='expired',
+            approved_by='system',
+            result='success',
+            metadata={'age_hours': round(age / 3600, 2)}
+        )
+        self.logger.info(f"Expired approval after {age / 3600:.1f}h: {path.name}")
+        return True
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Median time-to-action for human-only vs all approvals (seconds)."""
+        with self._lock:
+            return _median_report(list(self.time_to_action['human']), list(self.time_to_action['auto']))
+    
+    def close(self):
+        """Close the recorded-approvals store."""
+        self._recorded.close()
+    
+    def log_stats(self):
+        """Log median time-to-action (if anything was approved)."""
+        stats = self.get_stats()
+        if stats['human_count'] or stats['auto_count']:
+            self.logger.info(
+                f"Time-to-action: median {_format_seconds(stats['median_before_s'])} human-only "
+                f"({stats['human_count']}), {_format_seconds(stats['median_after_s'])} with "
+                f"{stats['auto_count']} auto-approved"
+            )
+
+
+def _median_report(human: List[float], auto: List[float]) -> Dict[str, Any]:
+    both = human + auto
+    return {
+        'human_count': len(human),
+        'auto_count': len(auto),
+        'median_before_s': statistics.median(human) if human else None,
+        'median_after_s': statistics.median(both) if both else None
+    }
+
+
+def report_from_audit(vault_path: Path, days: int = 7) -> Dict[str, Any]:
+    """Median time-to-action from the audit trail of the last `days` days."""
+    audit = get_audit_logger(str(vault_path))
+    human: List[float] = []
+    auto: List[float] = []
+    for offset in range(days):
+        date = (datetime.now() - timedelta(days=offset)).strftime('%Y-%m-%d')
+        for entry in audit.get_logs_for_date(date, actor=ACTOR):
+            waited = (entry.get('metadata') or {}).get('time_to_action_s')
+            if waited is None:
+                continue
+            if entry.get('action_type') == 'approval_human':
+                human.append(waited)
+            elif entry.get('action_type') == 'approval_auto':
+                auto.append(waited)
+    return _median_report(human, auto)
+
+
+def _format_seconds(value: Optional[float]) -> str:
+    if value is None:
+        return 'n/a'
+    return f'{value / 3600:.1f}h' if value >= 3600 else f'{value:.1f}s'
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    
+    parser = argparse.ArgumentParser(description='Approval policy engine')
+    parser.add_argument('vault', nargs='?', default=str(Path(__file__).parent / 'Vault'),
+                        help='Vault folder (default: ./Vault)')
+    parser.add_argument('--config', default=str(Path(__file__).parent / 'mcp_config.json'),
+                        help='MCP config file (default: ./mcp_config.json)')
+    parser.add_argument('--apply', action='store_true', help='Auto-approve and expire now')
+    parser.add_argument('--report', action='store_true', help='Median time-to-action from the audit log')
+    parser.add_argument('--days', type=int, default=7, help='Days of audit log for --report')
+    args = parser.parse_args()
+    
+    vault = Path(args.vault)
+    rules = RuleEngine(vault / 'Company_Handbook.md', Path(args.config))
+    
+    print("\n" + "="*60)
+    print("APPROVAL ENGINE")
+    print("="*60)
+    
+    if args.report:
+        stats = report_from_audit(vault, args.days)
+        print(f"\n  Human approvals:  {stats['human_count']}")
+        print(f"  Auto approvals:   {stats['auto_count']}")
+        print(f"  Median time-to-action before (human only): {_format_seconds(stats['median_before_s'])}")
+        print(f"  Median time-to-action after (all):         {_format_seconds(stats['median_after_s'])}")
+    elif args.apply:
+        engine = ApprovalEngine(vault, rules)
+        print(f"\n  {engine.sweep()}")
+        engine.close()
+    else:
+        engine = ApprovalEngine(vault, rules)
+        for record in engine.index.find_records('Pending_Approval', refresh=True):
+            auto, reason, action = engine.decide(record['frontmatter'])
+            print(f"  {'AUTO ' if auto else 'HUMAN'}  {record['name']:<45} {reason}")
+    
+    print("\n" + "="*60 + "\n")
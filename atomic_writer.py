@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Atomic Writer - GOLD TIER
+Personal AI Employee Hackathon 0
+
+Write-then-rename helpers for every file placed in a watched vault folder.
+
+Content is written to a hidden temp file in the destination directory,
+fsynced, then renamed over the final name. A rename within one directory is
+atomic, so watchers and scanners only ever see either no file or the
+complete file - never a half-written one. The temp name starts with '.' and
+ends in '.tmp', which every vault consumer already ignores.
+
+Usage:
+    from atomic_writer import atomic_copy, atomic_write_text
+    
+    atomic_write_text(vault / 'Needs_Action' / 'EMAIL_123.md', content)
+    atomic_copy(inbox / 'report.pdf', vault / 'Needs_Action' / 'FILE_report.pdf')
+"""
+
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Union
+import sys
+
+# Fix Windows console encoding
+if sys.platform == 'win32':
+    os.system('chcp 65001 > nul')
+
+
+def _temp_path(path: Path) -> Path:
+    """Hidden temp name in the same directory (unique per process/thread)."""
+    return path.with_name(f'.{path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+
+
+def _fsync_directory(directory: Path):
+    """Persist the rename itself (POSIX only - Windows cannot open directories)."""
+    if os.name == 'nt':
+        return
+    fd = os.open(str(directory), os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def atomic_write_bytes(path: Union[str, Path], data: bytes, fsync: bool = True) -> Path:
+    """
+    Atomically replace a file's contents.
+    
+    Args:
+        path: Destination file
+        data: Bytes to write
+        fsync: Flush file and directory to disk before returning
+    
+    Returns:
+        Destination path
+    """
+    path = Path(path)
+    tmp_path = _temp_path(path)
+    
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except FileNotFoundError:
+            pass
+        raise
+    
+    if fsync:
+        _fsync_directory(path.parent)
+    return path
+
+
+def atomic_write_text(
+    path: Union[str, Path],
+    content: str,
+    encoding: str = 'utf-8',
+    fsync: bool = True
+) -> Path:
+    """
+    Atomically replace a text file's contents.
+    
+    Args:
+        path: Destination file
+        content: Text to write
+        encoding: Text encoding (default: utf-8)
+        fsync: Flush file and directory to disk before returning
+    
+    Returns:
+        Destination path
+    """
+    return atomic_write_bytes(path, content.encode(encoding), fsync=fsync)
+
+
+def atomic_copy(source: Union[str, Path], path: Union[str, Path], fsync: bool = True) -> Path:
+    """
+    Atomically copy a file (contents and timestamps) to its destination.
+    
+    Args:
+        source: File to copy
+        path: Destination file
+        fsync: Flush file and directory to disk before returning
+    
+    Returns:
+        Destination path
+    """
+    path = Path(path)
+    tmp_path = _temp_path(path)
+    
+    try:
+        shutil.copy2(source, tmp_path)
+        if fsync:
+            with open(tmp_path, 'rb+') as f:
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except FileNotFoundError:
+            pass
+        raise
+    
+    if fsync:
+        _fsync_directory(path.parent)
+    return path
@@ -5,7 +5,14 @@ Comprehensive Audit Logger - GOLD TIER
 Personal AI Employee Hackathon 0
 
 Logs all actions taken by the AI Employee for compliance, debugging, and transparency.
-Stores logs in Vault/Logs/YYYY-MM-DD.json format with 90-day retention.
+Stores logs in Vault/Logs/YYYY-MM-DD.jsonl (one JSON object per line) with 90-day
+retention. Each action is a single append, so logging cost does not grow with the
+size of the day's log. Legacy YYYY-MM-DD.json array files are still read and can
+be converted with `python audit_logger.py <vault_path> --migrate`.
+
+Per-day counters are kept in Vault/Logs/rollups/YYYY-MM-DD.json, updated on every
+write and sealed once the day is over, so statistics never re-parse raw logs.
+Rebuild them from history with `python audit_logger.py <vault_path> --rebuild-rollups`.
 
 Usage:
     from audit_logger import AuditLogger
@@ -20,16 +27,27 @@ Usage:
         approved_by="human",
         result="success"
     )
+    
+    # Keep disk I/O off the hot path: entries are queued and written in
+    # batches by a background thread (flushed on exit / SIGTERM)
+    logger = AuditLogger(vault_path, async_writes=True, overflow_policy="spill")
 """
 
+import atexit
 import json
 import logging
+import queue
+import signal
+import threading
+import time
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator, List
 import sys
 import os
 
+from atomic_writer import atomic_write_text
+
 # Fix Windows console encoding
 if sys.platform == 'win32':
     os.system('chcp 65001 > nul')
@@ -38,26 +56,101 @@ if sys.platform == 'win32':
 class AuditLogger:
     """Comprehensive audit logger for AI Employee actions."""
     
-    def __init__(self, vault_path: str, retention_days: int = 90):
+    # Storage formats for daily log files
+    FORMAT_JSONL = 'jsonl'  # Append-only, one entry per line (default)
+    FORMAT_JSON = 'json'    # Legacy: whole day as one JSON array
+    
+    # What the async writer does when its queue is full
+    OVERFLOW_BLOCK = 'block'              # Caller waits for space
+    OVERFLOW_DROP_OLDEST = 'drop_oldest'  # Discard the oldest queued entry
+    OVERFLOW_SPILL = 'spill'              # Caller writes the queue and the entry to disk itself
+    
+    _STOP = object()  # Queue sentinel that stops the writer thread
+    
+    ROLLUP_ERROR_SAMPLES = 20  # Latest errors kept per daily rollup
+    
+    def __init__(
+        self,
+        vault_path: str,
+        retention_days: int = 90,
+        storage_format: str = FORMAT_JSONL,
+        fsync: bool = False,
+        async_writes: bool = False,
+        queue_size: int = 10000,
+        batch_size: int = 200,
+        flush_interval: float = 1.0,
+        overflow_policy: str = OVERFLOW_BLOCK
+    ):
         """
         Initialize audit logger.
         
         Args:
             vault_path: Path to Obsidian vault
             retention_days: Number of days to retain logs (default: 90)
+            storage_format: 'jsonl' (append-only) or 'json' (legacy array)
+            fsync: fsync the log file after every write (default: False)
+            async_writes: Queue entries and write them from a background thread
+            queue_size: Maximum number of queued entries in async mode
+            batch_size: Flush as soon as this many entries are queued
+            flush_interval: Flush at least this often, in seconds
+            overflow_policy: 'block', 'drop_oldest' or 'spill' when the queue is full
         """
+        if storage_format not in (self.FORMAT_JSONL, self.FORMAT_JSON):
+            raise ValueError(f"Unknown storage format: {storage_format}")
+        if overflow_policy not in (
+            self.OVERFLOW_BLOCK, self.OVERFLOW_DROP_OLDEST, self.OVERFLOW_SPILL
+        ):
+            raise ValueError(f"Unknown overflow policy: {overflow_policy}")
+        
         self.vault_path = Path(vault_path)
         self.logs_folder = self.vault_path / 'Logs'
+        self.rollups_folder = self.logs_folder / 'rollups'
         self.retention_days = retention_days
+        self.storage_format = storage_format
+        self.fsync = fsync
+        
+        # Async writer configuration
+        self.async_writes = async_writes
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.overflow_policy = overflow_policy
+        self._write_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._writer_stats = {
+            'queue_depth': 0,
+            'max_queue_depth': 0,
+            'enqueued': 0,
+            'written': 0,
+            'dropped': 0,
+            'spilled': 0,
+            'flushes': 0,
+            'last_flush_ms': 0.0,
+            'max_flush_ms': 0.0,
+            'total_flush_ms': 0.0
+        }
+        self._queue: Optional[queue.Queue] = None
+        self._writer_thread: Optional[threading.Thread] = None
+        self._flush_requested = threading.Event()
+        # Held while queueing; close() sets _closing under it before queueing _STOP
+        self._enqueue_lock = threading.Lock()
+        # Held by the writer from taking a batch until it is written (and by spills)
+        self._order_lock = threading.Lock()
+        self._spill_pending = threading.Event()
+        self._closing = False
+        self._closed = False
         
         # Create logs folder if not exists
         self.logs_folder.mkdir(parents=True, exist_ok=True)
+        self.rollups_folder.mkdir(parents=True, exist_ok=True)
         
         # Setup logging
         self._setup_logging()
         
         # Clean old logs on initialization
         self._cleanup_old_logs()
+        
+        if self.async_writes:
+            self._start_writer(queue_size)
     
     def _setup_logging(self):
         """Setup Python logging to file and console."""
@@ -90,11 +183,90 @@ class AuditLogger:
     def _get_today_log_file(self) -> Path:
         """Get path to today's log file."""
         today = datetime.now().strftime('%Y-%m-%d')
-        return self.logs_folder / f'{today}.json'
+        return self._get_log_file(today)
+    
+    def _get_log_file(self, date: str) -> Path:
+        """Get path to the log file written for a date."""
+        return self.logs_folder / f'{date}.{self.storage_format}'
+    
+    def _get_log_files_for_date(self, date: str) -> List[Path]:
+        """Get existing log files for a date (legacy array file first)."""
+        candidates = [
+            self.logs_folder / f'{date}.json',
+            self.logs_folder / f'{date}.jsonl'
+        ]
+        return [f for f in candidates if f.exists()]
     
-    def _load_today_log(self) -> list:
-        """Load today's log entries."""
-        log_file = self._get_today_log_file()
+    def _iter_log_file(self, log_file: Path) -> Iterator[Dict[str, Any]]:
+        """
+        Stream entries from a single log file.
+        
+        JSONL files are parsed line by line; corrupt lines are skipped.
+        Legacy JSON array files are parsed in one go.
+        """
+        try:
+            if log_file.suffix == '.jsonl':
+                with open(log_file, 'r', encoding='utf-8') as f:
+                    for line_no, line in enumerate(f, 1):
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            yield json.loads(line)
+                        except json.JSONDecodeError:
+                            self.logger.warning(
+                                f"Skipping corrupt line {line_no} in {log_file.name}"
+                            )
+            else:
+                content = log_file.read_text(encoding='utf-8')
+                yield from json.loads(content)
+        except (json.JSONDecodeError, Exception) as e:
+            self.logger.error(f"Could not parse log file: {e}")
+    
+    def _iter_logs_for_date(self, date: str) -> Iterator[Dict[str, Any]]:
+        """Stream all entries for a date across legacy and JSONL files."""
+        for log_file in self._get_log_files_for_date(date):
+            yield from self._iter_log_file(log_file)
+    
+    def _append_entries(self, log_file: Path, entries: List[Dict[str, Any]]) -> int:
+        """Append entries to a JSONL file with a single write. Returns bytes written."""
+        data = ''.join(
+            json.dumps(entry, ensure_ascii=False, default=str) + '\n'
+            for entry in entries
+        ).encode('utf-8')
+        with open(log_file, 'ab') as f:
+            f.write(data)
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        return len(data)
+    
+    def _write_entries(self, entries: List[Dict[str, Any]]):
+        """Write entries to their daily log files (grouped by timestamp date)."""
+        by_date: Dict[str, List[Dict[str, Any]]] = {}
+        for entry in entries:
+            by_date.setdefault(entry['timestamp'][:10], []).append(entry)
+        
+        with self._write_lock:
+            for date, day_entries in by_date.items():
+                log_file = self._get_log_file(date)
+                pre_size = log_file.stat().st_size if log_file.exists() else 0
+                if self.storage_format == self.FORMAT_JSONL:
+                    # Single append - cost does not depend on log size
+                    written = self._append_entries(log_file, day_entries)
+                    exclusive = log_file.stat().st_size == pre_size + written
+                else:
+                    # Legacy read-modify-write of the whole day
+                    existing = self._load_log_file(log_file)
+                    existing.extend(day_entries)
+                    self._save_log_file(log_file, existing)
+                    written, exclusive = 0, False
+                self._update_rollup(
+                    date, log_file, pre_size, pre_size + written, day_entries, exclusive
+                )
+    
+    def _load_log_file(self, log_file: Path) -> list:
+        """Load a day's log entries (legacy JSON array format)."""
         if log_file.exists():
             try:
                 content = log_file.read_text(encoding='utf-8')
@@ -104,11 +276,418 @@ class AuditLogger:
                 return []
         return []
     
-    def _save_today_log(self, entries: list):
-        """Save log entries to today's log file."""
-        log_file = self._get_today_log_file()
+    def _save_log_file(self, log_file: Path, entries: list):
+        """Save a day's log entries (legacy JSON array format)."""
         with open(log_file, 'w', encoding='utf-8') as f:
             json.dump(entries, f, indent=2, ensure_ascii=False, default=str)
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+    
+    def _get_rollup_file(self, date: str) -> Path:
+        """Get path to the rollup sidecar for a date."""
+        return self.rollups_folder / f'{date}.json'
+    
+    def _empty_rollup(self, date: str) -> Dict[str, Any]:
+        """Create an empty rollup for a date."""
+        return {
+            "date": date,
+            "sealed": False,
+            "sources": {},  # raw log file name -> bytes covered by this rollup
+            "total_actions": 0,
+            "by_result": {},
+            "by_action_type": {},
+            "by_actor": {},
+            "errors": 0,
+            "error_samples": []
+        }
+    
+    def _add_to_rollup(self, rollup: Dict[str, Any], entry: Dict[str, Any]):
+        """Count a log entry into a rollup, keeping the latest error samples."""
+        self._count_entry(rollup, entry)
+        if entry.get('error'):
+            rollup['error_samples'].append({
+                "timestamp": entry.get('timestamp'),
+                "action_type": entry.get('action_type', 'unknown'),
+                "actor": entry.get('actor', 'unknown'),
+                "target": entry.get('target'),
+                "error": entry.get('error')
+            })
+            del rollup['error_samples'][:-self.ROLLUP_ERROR_SAMPLES]
+    
+    def _load_rollup(self, date: str) -> Optional[Dict[str, Any]]:
+        """Load a rollup sidecar, or None if missing or unreadable."""
+        rollup_file = self._get_rollup_file(date)
+        if not rollup_file.exists():
+            return None
+        try:
+            return json.loads(rollup_file.read_text(encoding='utf-8'))
+        except (json.JSONDecodeError, Exception) as e:
+            self.logger.warning(f"Could not parse rollup {rollup_file.name}: {e}")
+            return None
+    
+    def _save_rollup(self, rollup: Dict[str, Any]):
+        """Atomically write a rollup sidecar."""
+        rollup['updated'] = datetime.now().isoformat()
+        rollup_file = self._get_rollup_file(rollup['date'])
+        # Derived data - rebuildable from the logs, so no fsync
+        atomic_write_text(
+            rollup_file,
+            json.dumps(rollup, ensure_ascii=False, default=str),
+            fsync=False
+        )
+    
+    def _read_jsonl_tail(self, log_file: Path, offset: int) -> tuple:
+        """
+        Parse complete lines of a JSONL file from a byte offset.
+        
+        Returns:
+            (entries, new_offset) - a trailing partial line is left for later
+        """
+        with open(log_file, 'rb') as f:
+            f.seek(offset)
+            data = f.read()
+        
+        end = data.rfind(b'\n') + 1
+        entries = []
+        for line in data[:end].splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                self.logger.warning(f"Skipping corrupt line in {log_file.name}")
+        return entries, offset + end
+    
+    def _rebuild_rollup(self, date: str) -> Dict[str, Any]:
+        """Build a rollup for a date from its raw log files."""
+        rollup = self._empty_rollup(date)
+        for log_file in self._get_log_files_for_date(date):
+            if log_file.suffix == '.jsonl':
+                entries, offset = self._read_jsonl_tail(log_file, 0)
+            else:
+                entries = list(self._iter_log_file(log_file))
+                offset = log_file.stat().st_size
+            for entry in entries:
+                self._add_to_rollup(rollup, entry)
+            rollup['sources'][log_file.name] = offset
+        return rollup
+    
+    def _refresh_rollup(self, date: str, ignore_seal: bool = False) -> Dict[str, Any]:
+        """
+        Bring a rollup in line with its raw log files and save it if changed.
+        
+        Sealed rollups are returned as-is. Grown JSONL files are caught up
+        by parsing only the new tail; any other change triggers a rebuild.
+        Rollups for days before today are sealed. A day without log files
+        gets an empty rollup that is not saved - reading stats never leaves
+        sidecars behind for days nothing was logged.
+        """
+        log_files = self._get_log_files_for_date(date)
+        if not log_files:
+            return self._empty_rollup(date)
+        
+        rollup = self._load_rollup(date)
+        if rollup is not None and rollup.get('sealed') and not ignore_seal:
+            return rollup
+        
+        current = {f.name: f.stat().st_size for f in log_files}
+        changed = False
+        
+        if rollup is None:
+            rollup = self._rebuild_rollup(date)
+            changed = True
+        elif rollup['sources'] != current:
+            covered = rollup['sources']
+            can_catch_up = set(covered) <= set(current) and all(
+                (name.endswith('.jsonl') and size >= covered.get(name, 0))
+                or size == covered.get(name)
+                for name, size in current.items()
+            )
+            if can_catch_up:
+                for name, size in current.items():
+                    offset = covered.get(name, 0)
+                    if size != offset:
+                        entries, covered[name] = self._read_jsonl_tail(
+                            self.logs_folder / name, offset
+                        )
+                        for entry in entries:
+                            self._add_to_rollup(rollup, entry)
+            else:
+                rollup = self._rebuild_rollup(date)
+            changed = True
+        
+        if date < datetime.now().strftime('%Y-%m-%d') and not rollup.get('sealed'):
+            rollup['sealed'] = True
+            changed = True
+        
+        if changed:
+            self._save_rollup(rollup)
+        return rollup
+    
+    def _update_rollup(
+        self,
+        date: str,
+        log_file: Path,
+        pre_size: int,
+        post_size: int,
+        entries: List[Dict[str, Any]],
+        exclusive: bool
+    ):
+        """
+        Update a day's rollup after writing entries to its log file.
+        
+        When nobody else wrote to the file and the rollup covers exactly the
+        bytes before this write, the entries are merged directly. Otherwise
+        the rollup is refreshed from disk.
+        """
+        try:
+            rollup = self._load_rollup(date)
+            if rollup is None and pre_size == 0 and len(self._get_log_files_for_date(date)) == 1:
+                rollup = self._empty_rollup(date)
+            
+            if (exclusive and rollup is not None and not rollup.get('sealed')
+                    and rollup['sources'].get(log_file.name, 0) == pre_size):
+                for entry in entries:
+                    self._add_to_rollup(rollup, entry)
+                rollup['sources'][log_file.name] = post_size
+                self._save_rollup(rollup)
+            else:
+                self._refresh_rollup(date, ignore_seal=True)
+        except Exception as e:
+            self.logger.warning(f"Could not update rollup for {date}: {e}")
+    
+    def get_daily_rollup(self, date: str) -> Dict[str, Any]:
+        """
+        Get the counters for a single day from its rollup sidecar.
+        
+        Args:
+            date: Date in YYYY-MM-DD format
+            
+        Returns:
+            Rollup dictionary (total_actions, by_result, by_action_type,
+            by_actor, errors, error_samples, sealed)
+        """
+        self.flush()
+        with self._write_lock:
+            return self._refresh_rollup(date)
+    
+    def rebuild_rollups(self) -> int:
+        """
+        Rebuild rollup sidecars for every day with raw logs.
+        
+        Returns:
+            Number of rollups rebuilt
+        """
+        self.flush()
+        dates = set()
+        for log_file in self.logs_folder.glob('*.json*'):
+            try:
+                datetime.strptime(log_file.stem, '%Y-%m-%d')
+                dates.add(log_file.stem)
+            except ValueError:
+                pass
+        
+        today = datetime.now().strftime('%Y-%m-%d')
+        with self._write_lock:
+            for date in sorted(dates):
+                rollup = self._rebuild_rollup(date)
+                rollup['sealed'] = date < today
+                self._save_rollup(rollup)
+        
+        self.logger.info(f"Rebuilt {len(dates)} rollup(s)")
+        return len(dates)
+    
+    def _start_writer(self, queue_size: int):
+        """Start the background writer thread and register shutdown flushes."""
+        self._queue = queue.Queue(maxsize=max(1, queue_size))
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop,
+            name='AuditLogWriter',
+            daemon=True
+        )
+        self._writer_thread.start()
+        
+        atexit.register(self.close)
+        
+        # SIGTERM skips atexit by default, so flush before exiting
+        if threading.current_thread() is threading.main_thread():
+            previous = signal.getsignal(signal.SIGTERM)
+            
+            def _on_sigterm(signum, frame):
+                self.close()
+                if callable(previous):
+                    previous(signum, frame)
+                else:
+                    sys.exit(128 + signum)
+            
+            try:
+                signal.signal(signal.SIGTERM, _on_sigterm)
+            except (ValueError, OSError):
+                pass
+    
+    def _writer_loop(self):
+        """Drain the queue to disk in batches, by size or by time."""
+        stopping = False
+        
+        while not stopping:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            
+            with self._order_lock:
+                batch = []
+                taken = 1
+                deadline = time.monotonic() + self.flush_interval
+                
+                while True:
+                    if item is self._STOP:
+                        stopping = True
+                        break
+                    batch.append(item)
+                    if len(batch) >= self.batch_size:
+                        break
+                    
+                    # On an explicit flush or a waiting spill, take what is queued without waiting
+                    remaining = deadline - time.monotonic()
+                    try:
+                        if self._flush_requested.is_set() or self._spill_pending.is_set() or remaining <= 0:
+                            item = self._queue.get_nowait()
+                        else:
+                            item = self._queue.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                    taken += 1
+                
+                if batch:
+                    self._flush_batch(batch)
+                for _ in range(taken):
+                    self._queue.task_done()
+    
+    def _flush_batch(self, batch: List[Dict[str, Any]]):
+        """Write one batch and record flush latency."""
+        start = time.perf_counter()
+        try:
+            self._write_entries(batch)
+        except Exception as e:
+            self.logger.error(f"Could not write {len(batch)} audit entries: {e}")
+            return
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        
+        stats = self._writer_stats
+        with self._stats_lock:
+            stats['written'] += len(batch)
+            stats['flushes'] += 1
+            stats['last_flush_ms'] = elapsed_ms
+            stats['max_flush_ms'] = max(stats['max_flush_ms'], elapsed_ms)
+            stats['total_flush_ms'] += elapsed_ms
+    
+    def _enqueue(self, entry: Dict[str, Any]):
+        """Queue an entry for the writer thread, applying the overflow policy."""
+        stats = self._writer_stats
+        
+        with self._enqueue_lock:
+            if self._closing:
+                # _STOP may already be queued - anything behind it would be lost
+                self._write_entries([entry])
+                return
+            
+            if self.overflow_policy == self.OVERFLOW_BLOCK:
+                self._queue.put(entry)
+            else:
+                try:
+                    self._queue.put_nowait(entry)
+                except queue.Full:
+                    if self.overflow_policy == self.OVERFLOW_SPILL:
+                        self._spill(entry)
+                        with self._stats_lock:
+                            stats['spilled'] += 1
+                        return
+                    
+                    # Drop oldest: make room, then queue the new entry. _STOP is
+                    # only queued once _closing is set, so it is never evicted.
+                    try:
+                        self._queue.get_nowait()
+                        self._queue.task_done()
+                        with self._stats_lock:
+                            stats['dropped'] += 1
+                    except queue.Empty:
+                        pass
+                    self._queue.put(entry)
+        
+        with self._stats_lock:
+            stats['enqueued'] += 1
+            stats['max_queue_depth'] = max(stats['max_queue_depth'], self._queue.qsize())
+    
+    def _spill(self, entry: Dict[str, Any]):
+        """
+        Write everything queued, then `entry`, on the caller's thread.
+        
+        Queued entries are older than `entry`, and entries the writer has
+        already taken are older still - so wait until the writer has
+        written those, then write the rest in order.
+        """
+        self._spill_pending.set()
+        try:
+            while True:
+                with self._order_lock:
+                    # Taken but not yet written by the writer (read in this order:
+                    # a get() in between then shows up as in flight)
+                    unfinished = self._queue.unfinished_tasks
+                    if unfinished <= self._queue.qsize():
+                        drained = []
+                        while True:
+                            try:
+                                drained.append(self._queue.get_nowait())
+                            except queue.Empty:
+                                break
+                        try:
+                            self._write_entries(drained + [entry])
+                        finally:
+                            for _ in drained:
+                                self._queue.task_done()
+                        with self._stats_lock:
+                            self._writer_stats['written'] += len(drained)
+                        return
+                time.sleep(0.001)
+        finally:
+            self._spill_pending.clear()
+    
+    def flush(self):
+        """Block until every queued entry has been written (async mode)."""
+        if self._queue is None or self._closed:
+            return
+        self._flush_requested.set()
+        self._queue.join()
+        self._flush_requested.clear()
+    
+    def close(self):
+        """Flush pending entries and stop the writer thread."""
+        if self._queue is None:
+            return
+        with self._enqueue_lock:
+            if self._closing:
+                return
+            # From here on log_action writes synchronously
+            self._closing = True
+        self._flush_requested.set()
+        self._queue.put(self._STOP)
+        self._writer_thread.join(timeout=10)
+        self._closed = True
+    
+    def get_writer_stats(self) -> Dict[str, Any]:
+        """Get async writer counters (queue depth, drops, flush latency)."""
+        with self._stats_lock:
+            stats = dict(self._writer_stats)
+        stats['mode'] = 'async' if self.async_writes else 'sync'
+        stats['overflow_policy'] = self.overflow_policy
+        stats['queue_depth'] = self._queue.qsize() if self._queue else 0
+        stats['avg_flush_ms'] = (
+            stats['total_flush_ms'] / stats['flushes'] if stats['flushes'] else 0.0
+        )
+        return stats
     
     def log_action(
         self,
@@ -156,14 +735,11 @@ class AuditLogger:
             "metadata": metadata or {}
         }
         
-        # Load today's logs
-        entries = self._load_today_log()
-        
-        # Add new entry
-        entries.append(entry)
-        
-        # Save back
-        self._save_today_log(entries)
+        if self.async_writes and not self._closed:
+            # Hand off to the writer thread - no disk I/O on the caller's path
+            self._enqueue(entry)
+        else:
+            self._write_entries([entry])
         
         # Log to Python logger
         status_icon = "✅" if result == "success" else "❌" if result == "failure" else "⚠️"
@@ -192,25 +768,20 @@ class AuditLogger:
         Returns:
             List of matching log entries
         """
-        log_file = self.logs_folder / f'{date}.json'
-        if not log_file.exists():
-            return []
+        # Make sure queued entries are on disk before reading
+        self.flush()
         
-        try:
-            content = log_file.read_text(encoding='utf-8')
-            entries = json.loads(content)
-        except (json.JSONDecodeError, Exception) as e:
-            self.logger.error(f"Could not parse log file: {e}")
-            return []
+        filtered = []
         
-        # Apply filters
-        filtered = entries
-        if action_type:
-            filtered = [e for e in filtered if e.get('action_type') == action_type]
-        if actor:
-            filtered = [e for e in filtered if e.get('actor') == actor]
-        if result:
-            filtered = [e for e in filtered if e.get('result') == result]
+        # Apply filters while streaming
+        for entry in self._iter_logs_for_date(date):
+            if action_type and entry.get('action_type') != action_type:
+                continue
+            if actor and entry.get('actor') != actor:
+                continue
+            if result and entry.get('result') != result:
+                continue
+            filtered.append(entry)
         
         return filtered
     
@@ -249,55 +820,83 @@ class AuditLogger:
         """
         Get action statistics for the last N days.
         
+        Reads the per-day rollup sidecars, so the cost is one small file per
+        day regardless of how many actions were logged.
+        
         Args:
             days: Number of days to analyze
             
         Returns:
             Dictionary with statistics
         """
-        logs = self.get_recent_logs(days)
-        
         stats = {
             "period_days": days,
-            "total_actions": len(logs),
+            "total_actions": 0,
             "by_result": {},
             "by_action_type": {},
             "by_actor": {},
             "errors": 0,
-            "success_rate": 0.0
+            "success_rate": 0.0,
+            "recent_errors": []
         }
         
-        for entry in logs:
-            # Count by result
-            result = entry.get('result', 'unknown')
-            stats['by_result'][result] = stats['by_result'].get(result, 0) + 1
-            
-            # Count by action type
-            action_type = entry.get('action_type', 'unknown')
-            stats['by_action_type'][action_type] = stats['by_action_type'].get(action_type, 0) + 1
-            
-            # Count by actor
-            actor = entry.get('actor', 'unknown')
-            stats['by_actor'][actor] = stats['by_actor'].get(actor, 0) + 1
+        today = datetime.now()
+        
+        for i in range(days):
+            date = (today - timedelta(days=i)).strftime('%Y-%m-%d')
+            rollup = self.get_daily_rollup(date)
             
-            # Count errors
-            if entry.get('error'):
-                stats['errors'] += 1
+            stats['total_actions'] += rollup['total_actions']
+            stats['errors'] += rollup['errors']
+            for key in ('by_result', 'by_action_type', 'by_actor'):
+                for name, count in rollup[key].items():
+                    stats[key][name] = stats[key].get(name, 0) + count
+            stats['recent_errors'].extend(rollup['error_samples'])
+        
+        stats['recent_errors'].sort(key=lambda x: x.get('timestamp') or '', reverse=True)
+        del stats['recent_errors'][self.ROLLUP_ERROR_SAMPLES:]
         
         # Calculate success rate
         if stats['total_actions'] > 0:
             success_count = stats['by_result'].get('success', 0)
             stats['success_rate'] = (success_count / stats['total_actions']) * 100
         
+        # Writer health: queue depth, drops, flush latency
+        stats['writer'] = self.get_writer_stats()
+        
         return stats
     
+    @staticmethod
+    def _count_entry(stats: Dict[str, Any], entry: Dict[str, Any]):
+        """Add a single log entry to a statistics dictionary."""
+        stats['total_actions'] += 1
+        
+        # Count by result
+        result = entry.get('result', 'unknown')
+        stats['by_result'][result] = stats['by_result'].get(result, 0) + 1
+        
+        # Count by action type
+        action_type = entry.get('action_type', 'unknown')
+        stats['by_action_type'][action_type] = stats['by_action_type'].get(action_type, 0) + 1
+        
+        # Count by actor
+        actor = entry.get('actor', 'unknown')
+        stats['by_actor'][actor] = stats['by_actor'].get(actor, 0) + 1
+        
+        # Count errors
+        if entry.get('error'):
+            stats['errors'] += 1
+    
     def _cleanup_old_logs(self):
         """Delete logs older than retention period."""
         cutoff = datetime.now() - timedelta(days=self.retention_days)
         
         try:
-            for log_file in self.logs_folder.glob('*.json'):
-                # Extract date from filename (YYYY-MM-DD.json)
+            log_files = list(self.logs_folder.glob('*.json*'))
+            log_files += list(self.rollups_folder.glob('*.json'))
+            
+            for log_file in log_files:
+                # Extract date from filename (YYYY-MM-DD.json / .jsonl)
                 try:
                     date_str = log_file.stem
                     file_date = datetime.strptime(date_str, '%Y-%m-%d')
@@ -320,6 +919,9 @@ class AuditLogger:
         """
         Export logs to a file for external analysis.
         
+        Entries are streamed to the output file. A `.jsonl` output path
+        produces JSON lines; anything else produces a JSON array.
+        
         Args:
             start_date: Start date (YYYY-MM-DD)
             end_date: End date (YYYY-MM-DD)
@@ -328,25 +930,106 @@ class AuditLogger:
         Returns:
             Path to exported file
         """
-        all_entries = []
+        self.flush()
+        
+        output = Path(output_path)
+        as_jsonl = output.suffix == '.jsonl'
+        count = 0
         
-        # Collect all logs in date range
         current = datetime.strptime(start_date, '%Y-%m-%d')
         end = datetime.strptime(end_date, '%Y-%m-%d')
         
-        while current <= end:
-            date_str = current.strftime('%Y-%m-%d')
-            entries = self.get_logs_for_date(date_str)
-            all_entries.extend(entries)
-            current += timedelta(days=1)
-        
-        # Write to output file
-        output = Path(output_path)
         with open(output, 'w', encoding='utf-8') as f:
-            json.dump(all_entries, f, indent=2, ensure_ascii=False, default=str)
+            if not as_jsonl:
+                f.write('[')
+            
+            # Stream all logs in date range
+            while current <= end:
+                date_str = current.strftime('%Y-%m-%d')
+                for entry in self._iter_logs_for_date(date_str):
+                    if as_jsonl:
+                        f.write(json.dumps(entry, ensure_ascii=False, default=str) + '\n')
+                    else:
+                        f.write(',\n' if count else '\n')
+                        f.write(json.dumps(entry, indent=2, ensure_ascii=False, default=str))
+                    count += 1
+                current += timedelta(days=1)
+            
+            if not as_jsonl:
+                f.write('\n]\n' if count else ']\n')
         
-        self.logger.info(f"Exported {len(all_entries)} logs to {output_path}")
+        self.logger.info(f"Exported {count} logs to {output_path}")
         return output
+    
+    def migrate_to_jsonl(self) -> Dict[str, int]:
+        """
+        Convert legacy YYYY-MM-DD.json array files to JSONL.
+        
+        Entries are merged into the matching .jsonl file (legacy entries
+        first), the new file is written next to it and renamed into place,
+        then the legacy file is removed.
+        
+        Writers in this process wait on the write lock for the whole
+        migration. Lines other processes append meanwhile are copied until
+        the live file stops growing, right before the rename - still, run
+        it with the other components stopped.
+        
+        Returns:
+            Dictionary with 'files' and 'entries' converted
+        """
+        migrated = {'files': 0, 'entries': 0}
+        # Queued entries wait too and are appended to the new file afterwards
+        with self._write_lock:
+            for legacy_file in sorted(self.logs_folder.glob('*.json')):
+                entries = self._migrate_file(legacy_file)
+                if entries is not None:
+                    migrated['files'] += 1
+                    migrated['entries'] += entries
+        return migrated
+    
+    def _migrate_file(self, legacy_file: Path) -> Optional[int]:
+        """Merge one legacy file into its .jsonl (caller holds the write lock)."""
+        try:
+            datetime.strptime(legacy_file.stem, '%Y-%m-%d')
+        except ValueError:
+            # Not a date-formatted file, skip
+            return None
+        
+        try:
+            entries = json.loads(legacy_file.read_text(encoding='utf-8'))
+            if not isinstance(entries, list):
+                raise ValueError("expected a JSON array")
+        except Exception as e:
+            self.logger.error(f"Could not migrate {legacy_file.name}: {e}")
+            return None
+        
+        jsonl_file = legacy_file.with_suffix('.jsonl')
+        tmp_file = legacy_file.with_suffix('.jsonl.tmp')
+        
+        with open(tmp_file, 'wb') as f:
+            for entry in entries:
+                f.write((json.dumps(entry, ensure_ascii=False, default=str) + '\n').encode('utf-8'))
+            # Copy the live file until it stops growing (appends from other processes)
+            copied = 0
+            while True:
+                try:
+                    with open(jsonl_file, 'rb') as live:
+                        live.seek(copied)
+                        tail = live.read()
+                except FileNotFoundError:
+                    tail = b''
+                if not tail:
+                    break
+                f.write(tail)
+                copied += len(tail)
+            f.flush()
+            os.fsync(f.fileno())
+        
+        tmp_file.replace(jsonl_file)
+        legacy_file.unlink()
+        
+        self.logger.info(f"Migrated {legacy_file.name}: {len(entries)} entries")
+        return len(entries)
 
 
 # Convenience functions for quick logging
@@ -381,13 +1064,28 @@ if __name__ == '__main__':
     import sys
     
     if len(sys.argv) < 2:
-        print("Usage: python audit_logger.py <vault_path>")
+        print("Usage: python audit_logger.py <vault_path> [--migrate | --rebuild-rollups]")
         print("Example: python audit_logger.py C:\\Code-journy\\Quator-4\\Hackahton-0\\Vault")
         sys.exit(1)
     
     vault_path = sys.argv[1]
     logger = AuditLogger(vault_path)
     
+    if '--rebuild-rollups' in sys.argv[2:]:
+        count = logger.rebuild_rollups()
+        print(f"\n[OK] Rebuilt {count} daily rollup(s) in {logger.rollups_folder}\n")
+        sys.exit(0)
+    
+    if '--migrate' in sys.argv[2:]:
+        print("\n" + "="*60)
+        print("AUDIT LOG MIGRATION (JSON -> JSONL)")
+        print("="*60)
+        
+        migrated = logger.migrate_to_jsonl()
+        print(f"\n[OK] Migrated {migrated['files']} file(s), {migrated['entries']} entries")
+        print("\n" + "="*60 + "\n")
+        sys.exit(0)
+    
     # Test logging
     print("\n" + "="*60)
     print("AUDIT LOGGER TEST")
@@ -411,6 +1109,7 @@ if __name__ == '__main__':
     print(f"\n[STATS] Today's Statistics:")
     print(f"   Total Actions: {stats['total_actions']}")
     print(f"   Success Rate: {stats['success_rate']:.1f}%")
+    print(f"   Writer Mode: {stats['writer']['mode']}")
     
     print("\n" + "="*60)
     print("AUDIT LOGGER READY")
@@ -4,13 +4,53 @@ import logging
 from pathlib import Path
 from abc import ABC, abstractmethod
 
+from seen_store import SeenStore
+from atomic_writer import atomic_write_text
+from task_pipeline import backpressure_active
+from poll_scheduler import AdaptiveScheduler
+
 class BaseWatcher(ABC):
-    def __init__(self, vault_path: str, check_interval: int = 60):
+    STATS_EVERY = 20  # Log scheduler stats every N polls
+
+    def __init__(self, vault_path: str, check_interval: int = 60, scheduler=None, ingest=None):
         self.vault_path = Path(vault_path)
         self.needs_action = self.vault_path / 'Needs_Action'
         self.check_interval = check_interval
+        # Anything with record(items, latency) -> delay and format_stats() (see poll_scheduler.py)
+        self.scheduler = scheduler or AdaptiveScheduler(check_interval)
+        # Optional IngestQueue shared with an in-process reasoner (see ingest_queue.py)
+        self.ingest = ingest
         self.logger = logging.getLogger(self.__class__.__name__)
 
+    def open_seen_store(self, name: str) -> SeenStore:
+        '''Persistent set of already-handled item IDs (Vault/.state/<name>.*)'''
+        return SeenStore(self.vault_path / '.state', name)
+
+    def write_action_file(self, filepath: Path, content: str):
+        '''Write an action file - through the ingest queue when one is attached.
+        Either way it is on disk on return, so seen ids may be committed after.'''
+        if self.ingest is not None:
+            self.ingest.put(filepath.name, content, source=self.__class__.__name__)
+        else:
+            atomic_write_text(filepath, content)
+
+    def reasoner_backlogged(self) -> bool:
+        '''True while the reasoner is behind - skip polling until it drains'''
+        if self.ingest is not None and self.ingest.paused:
+            self.logger.info(f'Ingest queue above high watermark ({len(self.ingest)} waiting) - skipping this poll')
+            return True
+        if backpressure_active(self.vault_path / '.state'):
+            self.logger.info('Reasoner backlogged - skipping this poll')
+            return True
+        return False
+
+    def record_poll(self, items: int, started: float) -> float:
+        '''Report one poll (items found, perf_counter() at its start); returns seconds to sleep'''
+        delay = self.scheduler.record(items, time.perf_counter() - started)
+        if self.scheduler.polls % self.STATS_EVERY == 0:
+            self.logger.info(f'Polling: {self.scheduler.format_stats()}')
+        return delay
+
     @abstractmethod
     def check_for_updates(self) -> list:
         '''Return list of new items to process'''
@@ -21,13 +61,28 @@ class BaseWatcher(ABC):
         '''Create .md file in Needs_Action folder'''
         pass
 
+    def poll_once(self) -> float:
+        '''One poll; returns seconds to sleep before the next (used by run() and the orchestrator)'''
+        if self.reasoner_backlogged():
+            return self.check_interval
+        started = time.perf_counter()
+        items = []
+        try:
+            items = self.check_for_updates()
+            for item in items:
+                self.create_action_file(item)
+        except Exception as e:
+            self.logger.error(f'Error: {e}')
+        return self.record_poll(len(items), started)
+
+    def close(self):
+        '''Release resources held between polls (browser sessions etc.)'''
+        pass
+
     def run(self):
         self.logger.info(f'Starting {self.__class__.__name__}')
-        while True:
-            try:
-                items = self.check_for_updates()
-                for item in items:
-                    self.create_action_file(item)
-            except Exception as e:
-                self.logger.error(f'Error: {e}')
-            time.sleep(self.check_interval)
+        try:
+            while True:
+                time.sleep(self.poll_once())
+        finally:
+            self.close()
@@ -9,30 +9,185 @@ Analyzes completed tasks, revenue, bottlenecks, and provides proactive suggestio
 
 Schedule: Every Sunday at 11:00 PM (via cron/Task Scheduler)
 
+Per-day audit log aggregates are cached in Vault/Briefings/.briefing_cache.json,
+keyed by file size and mtime, and Done/In_Progress are read through the vault
+index (vault_index.py), so a run only re-reads what changed since the previous
+one. This keeps hourly runs cheap.
+
 Usage:
     python ceo_briefing.py Vault
+    python ceo_briefing.py Vault 7 --full-rebuild   # ignore the cache
     
 Or import as module:
     from ceo_briefing import generate_briefing
     generate_briefing(vault_path, days=7)
 """
 
+import re
 import json
 import logging
+import time
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List
 import sys
 import os
 
+from atomic_writer import atomic_write_text
+from frontmatter_reader import FrontmatterReader
+from vault_index import VaultIndex
+
 # Fix Windows console encoding
 if sys.platform == 'win32':
     os.system('chcp 65001 > nul')
 
 
+# Ralph's progress line - the only iteration counter older task files update
+ITERATION_LINE = re.compile(r'^- Iteration: (\d+) /', re.MULTILINE)
+
+
+class LogAggregator:
+    """
+    Base class for briefing sections fed by the shared audit log scan.
+    
+    Subclasses implement empty_state(), accumulate(), merge_state() and
+    result(). State must be JSON-serializable so per-day partial results
+    can be cached and merged on later runs. The scan only reads the daily
+    log partitions between start and end, and only feeds entries whose
+    timestamp falls inside the aggregator's own window.
+    """
+    
+    name = 'base'  # Key for cached per-day state
+    
+    def __init__(self, start: datetime, end: datetime):
+        self.start = start
+        self.end = end
+        self._start_iso = start.isoformat()
+        self._end_iso = end.isoformat()
+        self.state = self.empty_state()
+    
+    def covers(self, timestamp: str) -> bool:
+        """Check whether an entry timestamp falls inside this window."""
+        if not timestamp:
+            return True
+        return self._start_iso <= timestamp <= self._end_iso
+    
+    def covers_day(self, day) -> bool:
+        """Check whether a whole calendar day falls inside this window."""
+        day_start = datetime.combine(day, datetime.min.time())
+        day_end = datetime.combine(day, datetime.max.time())
+        return self.start <= day_start and day_end <= self.end
+    
+    def empty_state(self) -> Any:
+        """Return a fresh, empty state."""
+        raise NotImplementedError
+    
+    def accumulate(self, state: Any, entry: Dict[str, Any]):
+        """Add one audit log entry to a state."""
+        raise NotImplementedError
+    
+    def merge_state(self, state: Any):
+        """Merge a (cached) partial state into this aggregator."""
+        raise NotImplementedError
+    
+    def add(self, entry: Dict[str, Any]):
+        """Consume one audit log entry."""
+        self.accumulate(self.state, entry)
+    
+    def result(self) -> Any:
+        """Return the aggregated result."""
+        raise NotImplementedError
+
+
+class AuditStatsAggregator(LogAggregator):
+    """Counts actions by type and result, collecting errors."""
+    
+    name = 'audit_stats'
+    
+    def empty_state(self) -> Dict[str, Any]:
+        return {
+            'total_actions': 0,
+            'by_type': {},
+            'success_count': 0,
+            'failure_count': 0,
+            'errors': []
+        }
+    
+    def accumulate(self, state: Dict[str, Any], entry: Dict[str, Any]):
+        state['total_actions'] += 1
+        
+        action_type = entry.get('action_type', 'unknown')
+        state['by_type'][action_type] = state['by_type'].get(action_type, 0) + 1
+        
+        result = entry.get('result', 'unknown')
+        if result == 'success':
+            state['success_count'] += 1
+        elif result in ('failure', 'error'):
+            state['failure_count'] += 1
+            if entry.get('error'):
+                state['errors'].append({
+                    'action': action_type,
+                    'error': entry.get('error'),
+                    'timestamp': entry.get('timestamp')
+                })
+    
+    def merge_state(self, state: Dict[str, Any]):
+        stats = self.state
+        for key in ('total_actions', 'success_count', 'failure_count'):
+            stats[key] += state[key]
+        for action_type, count in state['by_type'].items():
+            stats['by_type'][action_type] = stats['by_type'].get(action_type, 0) + count
+        stats['errors'].extend(state['errors'])
+    
+    def result(self) -> Dict[str, Any]:
+        stats = self.state
+        if stats['total_actions'] > 0:
+            stats['success_rate'] = (stats['success_count'] / stats['total_actions']) * 100
+        else:
+            stats['success_rate'] = 0.0
+        return stats
+
+
+class SubscriptionAggregator(LogAggregator):
+    """Finds subscription charges among transaction entries."""
+    
+    name = 'subscriptions'
+    
+    def __init__(self, start: datetime, end: datetime, patterns: Dict[str, str]):
+        self.patterns = patterns
+        super().__init__(start, end)
+    
+    def empty_state(self) -> List[Dict[str, Any]]:
+        return []
+    
+    def accumulate(self, state: List[Dict[str, Any]], entry: Dict[str, Any]):
+        if entry.get('action_type') != 'transaction':
+            return
+        
+        description = entry.get('parameters', {}).get('description', '').lower()
+        
+        for pattern, name in self.patterns.items():
+            if pattern in description:
+                state.append({
+                    'name': name,
+                    'amount': entry.get('parameters', {}).get('amount', 0),
+                    'date': entry.get('timestamp'),
+                    'description': description
+                })
+                break
+    
+    def merge_state(self, state: List[Dict[str, Any]]):
+        self.state.extend(state)
+    
+    def result(self) -> List[Dict[str, Any]]:
+        return self.state
+
+
 class CEOBriefingGenerator:
     """Generates weekly CEO briefings from business data."""
     
+    CACHE_VERSION = 3
+    
     def __init__(self, vault_path: str):
         """
         Initialize CEO Briefing Generator.
@@ -44,6 +199,15 @@ class CEOBriefingGenerator:
         self.briefings_folder = self.vault_path / 'Briefings'
         self.logs_folder = self.vault_path / 'Logs'
         self.done_folder = self.vault_path / 'Done'
+        self.cache_file = self.briefings_folder / '.briefing_cache.json'
+        
+        # Aggregate cache (loaded per briefing run) and per-section timings
+        self.cache: Optional[Dict[str, Any]] = None
+        self._cache_dirty = False
+        self.timings: Dict[str, float] = {}
+        
+        # Task folder scans are index queries - only changed files are re-read
+        self.index = VaultIndex(self.vault_path)
         
         # Create folders
         self.briefings_folder.mkdir(parents=True, exist_ok=True)
@@ -88,6 +252,62 @@ class CEOBriefingGenerator:
         console_handler.setFormatter(logging.Formatter('%(message)s'))
         self.logger.addHandler(console_handler)
     
+    def _iter_log_entries(self, log_file: Path):
+        """Yield entries from a JSONL or legacy JSON array audit log file."""
+        if log_file.suffix == '.jsonl':
+            with open(log_file, 'r', encoding='utf-8') as f:
+                for line_no, line in enumerate(f, 1):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        # A torn line (crash mid-append) must not hide the rest of the day
+                        self.logger.warning(f"Skipping corrupt line {line_no} in {log_file.name}")
+        else:
+            yield from json.loads(log_file.read_text(encoding='utf-8'))
+    
+    def _empty_cache(self) -> Dict[str, Any]:
+        """Create an empty aggregate cache."""
+        return {
+            'version': self.CACHE_VERSION,
+            'audit_days': {}  # date -> {fingerprint, states: {aggregator: state}}
+        }
+    
+    def _load_cache(self) -> Dict[str, Any]:
+        """Load the aggregate cache, starting fresh if missing or stale."""
+        if self.cache_file.exists():
+            try:
+                cache = json.loads(self.cache_file.read_text(encoding='utf-8'))
+                if cache.get('version') == self.CACHE_VERSION:
+                    return cache
+            except Exception as e:
+                self.logger.warning(f"Could not load briefing cache: {e}")
+        return self._empty_cache()
+    
+    def _save_cache(self):
+        """Atomically write the aggregate cache if it changed."""
+        if self.cache is None or not self._cache_dirty:
+            return
+        # Derived data - rebuildable, so no fsync
+        atomic_write_text(self.cache_file, json.dumps(self.cache, default=str), fsync=False)
+        self._cache_dirty = False
+    
+    @staticmethod
+    def _fingerprint(path: Path) -> List[int]:
+        """Cheap change detector for a file: [size, mtime_ns]."""
+        stat = path.stat()
+        return [stat.st_size, stat.st_mtime_ns]
+    
+    def _timed(self, section: str, func, *args, **kwargs):
+        """Run a briefing section and record its wall time."""
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.timings[section] = (time.perf_counter() - start) * 1000
+    
     def _get_period_dates(self, days: int = 7) -> tuple:
         """Get start and end dates for the briefing period."""
         end = datetime.now()
@@ -143,115 +363,135 @@ class CEOBriefingGenerator:
         if not self.done_folder.exists():
             return tasks
         
-        for file in self.done_folder.glob('*.md'):
-            try:
-                content = file.read_text(encoding='utf-8')
-                
-                # Extract type from frontmatter
-                task_type = 'unknown'
-                if 'type:' in content:
-                    import re
-                    match = re.search(r'type:\s*(\w+)', content)
-                    if match:
-                        task_type = match.group(1)
-                
-                tasks['total'] += 1
-                tasks['by_type'][task_type] = tasks['by_type'].get(task_type, 0) + 1
-                tasks['files'].append({
-                    'name': file.name,
-                    'type': task_type
-                })
-                
-            except Exception as e:
-                self.logger.debug(f"Could not parse done file: {file}")
+        for record in self.index.find_records('Done'):
+            task_type = record['type'] or 'unknown'
+            tasks['total'] += 1
+            tasks['by_type'][task_type] = tasks['by_type'].get(task_type, 0) + 1
+            tasks['files'].append({
+                'name': record['name'],
+                'type': task_type
+            })
         
         return tasks
     
-    def _analyze_audit_logs(self, days: int = 7) -> Dict[str, Any]:
-        """Analyze audit logs for action statistics."""
-        start, end = self._get_period_dates(days)
+    def _get_log_partitions(self, first: datetime, last: datetime) -> List[Path]:
+        """
+        Get the daily audit log files between two dates (inclusive).
         
-        stats = {
-            'total_actions': 0,
-            'by_type': {},
-            'success_count': 0,
-            'failure_count': 0,
-            'errors': []
-        }
+        Partitions are selected by their YYYY-MM-DD filename, so days
+        outside the period are never opened.
+        """
+        partitions = []
+        day = first.replace(hour=0, minute=0, second=0, microsecond=0)
+        
+        while day.date() <= last.date():
+            date_str = day.strftime('%Y-%m-%d')
+            for suffix in ('.json', '.jsonl'):
+                log_file = self.logs_folder / f'{date_str}{suffix}'
+                if log_file.exists():
+                    partitions.append(log_file)
+            day += timedelta(days=1)
+        
+        return partitions
+    
+    def _scan_audit_logs(self, aggregators: List[LogAggregator]):
+        """
+        Stream the audit logs once, feeding every aggregator.
         
-        if not self.logs_folder.exists():
-            return stats
+        Only partitions inside the union of the aggregators' windows are
+        read. Adding a briefing section means adding an aggregator, not
+        another pass over the logs.
         
-        # Read all log files in period
-        for log_file in self.logs_folder.glob('*.json'):
-            try:
-                content = log_file.read_text(encoding='utf-8')
-                entries = json.loads(content)
-                
-                for entry in entries:
-                    stats['total_actions'] += 1
-                    
-                    action_type = entry.get('action_type', 'unknown')
-                    stats['by_type'][action_type] = stats['by_type'].get(action_type, 0) + 1
-                    
-                    result = entry.get('result', 'unknown')
-                    if result == 'success':
-                        stats['success_count'] += 1
-                    elif result in ('failure', 'error'):
-                        stats['failure_count'] += 1
-                        if entry.get('error'):
-                            stats['errors'].append({
-                                'action': action_type,
-                                'error': entry.get('error'),
-                                'timestamp': entry.get('timestamp')
-                            })
-                
-            except Exception as e:
-                self.logger.debug(f"Could not parse log file: {log_file}")
+        When a cache is loaded, days that lie entirely inside an
+        aggregator's window are served from cached per-day state as long as
+        the day's files are unchanged; only new or modified days (and the
+        partial days at the window edges) are parsed.
+        """
+        if not aggregators or not self.logs_folder.exists():
+            return
         
-        # Calculate success rate
-        if stats['total_actions'] > 0:
-            stats['success_rate'] = (stats['success_count'] / stats['total_actions']) * 100
-        else:
-            stats['success_rate'] = 0.0
+        first = min(a.start for a in aggregators)
+        last = max(a.end for a in aggregators)
         
-        return stats
+        partitions: Dict[str, List[Path]] = {}
+        for log_file in self._get_log_partitions(first, last):
+            partitions.setdefault(log_file.stem, []).append(log_file)
+        
+        cached_days = self.cache['audit_days'] if self.cache is not None else None
+        
+        for date_str, files in partitions.items():
+            day = datetime.strptime(date_str, '%Y-%m-%d').date()
+            active = [a for a in aggregators if a.start.date() <= day <= a.end.date()]
+            if not active:
+                continue
+            
+            # Whole days can be cached; edge days are filtered per entry
+            whole = [a for a in active if cached_days is not None and a.covers_day(day)]
+            partial = [a for a in active if a not in whole]
+            missing = []
+            
+            if whole:
+                fingerprint = {f.name: self._fingerprint(f) for f in files}
+                day_cache = cached_days.get(date_str)
+                if day_cache is None or day_cache['fingerprint'] != fingerprint:
+                    day_cache = {'fingerprint': fingerprint, 'states': {}}
+                    cached_days[date_str] = day_cache
+                    self._cache_dirty = True
+                
+                for aggregator in whole:
+                    if aggregator.name in day_cache['states']:
+                        aggregator.merge_state(day_cache['states'][aggregator.name])
+                    else:
+                        missing.append(aggregator)
+            
+            if not missing and not partial:
+                continue
+            
+            states = {a.name: a.empty_state() for a in missing}
+            complete = True
+            
+            for log_file in files:
+                try:
+                    for entry in self._iter_log_entries(log_file):
+                        timestamp = entry.get('timestamp') or ''
+                        for aggregator in missing:
+                            aggregator.accumulate(states[aggregator.name], entry)
+                        for aggregator in partial:
+                            if aggregator.covers(timestamp):
+                                aggregator.add(entry)
+                except Exception as e:
+                    complete = False
+                    self.logger.debug(f"Could not parse log file: {log_file}")
+            
+            for aggregator in missing:
+                aggregator.merge_state(states[aggregator.name])
+                if complete:
+                    day_cache['states'][aggregator.name] = states[aggregator.name]
+                    self._cache_dirty = True
+        
+        # Forget days whose log files have been removed (retention)
+        if cached_days is not None:
+            for date_str in list(cached_days):
+                if not any(
+                    (self.logs_folder / f'{date_str}{suffix}').exists()
+                    for suffix in ('.json', '.jsonl')
+                ):
+                    del cached_days[date_str]
+                    self._cache_dirty = True
+    
+    def _analyze_audit_logs(self, days: int = 7) -> Dict[str, Any]:
+        """Analyze audit logs for action statistics."""
+        start, end = self._get_period_dates(days)
+        aggregator = AuditStatsAggregator(start, end)
+        self._scan_audit_logs([aggregator])
+        return aggregator.result()
     
     def _identify_subscriptions(self, days: int = 30) -> List[Dict[str, Any]]:
         """Identify subscription expenses from logs."""
         start, end = self._get_period_dates(days)
-        
-        subscriptions = []
-        
-        if not self.logs_folder.exists():
-            return subscriptions
-        
-        # Look for subscription-related transactions
-        for log_file in self.logs_folder.glob('*.json'):
-            try:
-                content = log_file.read_text(encoding='utf-8')
-                entries = json.loads(content)
-                
-                for entry in entries:
-                    if entry.get('action_type') != 'transaction':
-                        continue
-                    
-                    description = entry.get('parameters', {}).get('description', '').lower()
-                    
-                    for pattern, name in self.subscription_patterns.items():
-                        if pattern in description:
-                            subscriptions.append({
-                                'name': name,
-                                'amount': entry.get('parameters', {}).get('amount', 0),
-                                'date': entry.get('timestamp'),
-                                'description': description
-                            })
-                            break
-                
-            except Exception as e:
-                pass
-        
-        return subscriptions
+        aggregator = SubscriptionAggregator(start, end, self.subscription_patterns)
+        self._scan_audit_logs([aggregator])
+        return aggregator.result()
     
     def _identify_bottlenecks(self, days: int = 7) -> List[Dict[str, Any]]:
         """Identify bottlenecks from task processing times."""
@@ -259,30 +499,29 @@ class CEOBriefingGenerator:
         
         # This would require more sophisticated analysis
         # For now, check for tasks that took multiple iterations
-        in_progress = self.vault_path / 'In_Progress'
-        
-        if in_progress.exists():
-            for file in in_progress.glob('TASK_*.md'):
-                try:
-                    content = file.read_text(encoding='utf-8')
-                    
-                    # Check iteration count
-                    import re
-                    match = re.search(r'Iteration:\s*(\d+)', content)
-                    if match:
-                        iterations = int(match.group(1))
-                        if iterations > 3:
-                            bottlenecks.append({
-                                'task': file.stem,
-                                'iterations': iterations,
-                                'reason': f'Task stuck at iteration {iterations}'
-                            })
-                    
-                except Exception:
-                    pass
+        for record in self.index.find_records('In_Progress', name_prefix='TASK_'):
+            iterations = record['frontmatter'].get('iteration')
+            if not isinstance(iterations, int) or iterations == 0:
+                # Files written before the header was kept current still say 0
+                iterations = self._body_iteration(record['path'])
+            if iterations > 3:
+                bottlenecks.append({
+                    'task': record['path'].stem,
+                    'iterations': iterations,
+                    'reason': f'Task stuck at iteration {iterations}'
+                })
         
         return bottlenecks
     
+    @staticmethod
+    def _body_iteration(path: Path) -> int:
+        """Iteration count from the task's '- Iteration: N / max' line (0 if none)."""
+        try:
+            match = ITERATION_LINE.search(path.read_text(encoding='utf-8'))
+        except OSError:
+            return 0
+        return int(match.group(1)) if match else 0
+    
     def _generate_proactive_suggestions(
         self,
         tasks: Dict[str, Any],
@@ -324,7 +563,8 @@ class CEOBriefingGenerator:
     def generate_briefing(
         self,
         days: int = 7,
-        output_file: Optional[Path] = None
+        output_file: Optional[Path] = None,
+        full_rebuild: bool = False
     ) -> Path:
         """
         Generate the CEO Briefing document.
@@ -332,23 +572,43 @@ class CEOBriefingGenerator:
         Args:
             days: Number of days to analyze (default: 7)
             output_file: Optional output file path
+            full_rebuild: Ignore the aggregate cache and recompute everything
             
         Returns:
             Path to generated briefing
         """
         self.logger.info(f"Generating CEO Briefing for last {days} days...")
         
+        self.timings = {}
+        self.index.reader = FrontmatterReader()
+        self.cache = self._empty_cache() if full_rebuild else self._load_cache()
+        self._cache_dirty = full_rebuild
+        
         # Gather data
         start, end = self._get_period_dates(days)
-        business_goals = self._load_business_goals()
-        tasks = self._count_completed_tasks(days)
-        audit_stats = self._analyze_audit_logs(days)
-        subscriptions = self._identify_subscriptions(30)
-        bottlenecks = self._identify_bottlenecks(days)
+        business_goals = self._timed('business_goals', self._load_business_goals)
+        tasks = self._timed('completed_tasks', self._count_completed_tasks, days)
+        
+        # One pass over the audit logs feeds every log-based section
+        audit_aggregator = AuditStatsAggregator(start, end)
+        subscription_aggregator = SubscriptionAggregator(
+            end - timedelta(days=30), end, self.subscription_patterns
+        )
+        self._timed(
+            'audit_logs', self._scan_audit_logs,
+            [audit_aggregator, subscription_aggregator]
+        )
+        audit_stats = audit_aggregator.result()
+        subscriptions = subscription_aggregator.result()
+        
+        bottlenecks = self._timed('bottlenecks', self._identify_bottlenecks, days)
         suggestions = self._generate_proactive_suggestions(
             tasks, audit_stats, subscriptions, bottlenecks
         )
         
+        self._timed('save_cache', self._save_cache)
+        self.cache = None
+        
         # Calculate revenue (placeholder - would integrate with accounting)
         revenue_this_week = 0  # Would calculate from transactions
         revenue_mtd = 0
@@ -536,45 +796,61 @@ Overall business health: **{'Good' if tasks['total'] > 5 else 'Needs Attention'}
             output_file = self.briefings_folder / filename
         
         # Write briefing
-        output_file.write_text(content, encoding='utf-8')
+        atomic_write_text(output_file, content)
         
         self.logger.info(f"CEO Briefing generated: {output_file}")
         self.logger.info(f"  - Period: {period_start} to {period_end}")
         self.logger.info(f"  - Tasks completed: {tasks['total']}")
         self.logger.info(f"  - Actions analyzed: {audit_stats['total_actions']}")
+        self.logger.info(
+            "  - Timings: " + ', '.join(
+                f"{section} {ms:.1f}ms" for section, ms in self.timings.items()
+            )
+        )
+        self.logger.info(
+            f"  - Frontmatter reads: {self.index.reader.files_read} files, "
+            f"{self.index.reader.bytes_read:,} bytes"
+        )
         
         return output_file
 
 
 # Convenience function
-def generate_briefing(vault_path: str, days: int = 7) -> Path:
+def generate_briefing(vault_path: str, days: int = 7, full_rebuild: bool = False) -> Path:
     """Generate a CEO briefing."""
     generator = CEOBriefingGenerator(vault_path)
-    return generator.generate_briefing(days=days)
+    return generator.generate_briefing(days=days, full_rebuild=full_rebuild)
 
 
 if __name__ == '__main__':
     # Test the CEO Briefing Generator
     import sys
     
-    if len(sys.argv) < 2:
-        print("Usage: python ceo_briefing.py <vault_path> [days]")
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    full_rebuild = '--full-rebuild' in sys.argv[1:]
+    
+    if len(args) < 1:
+        print("Usage: python ceo_briefing.py <vault_path> [days] [--full-rebuild]")
         print("Example: python ceo_briefing.py Vault 7")
         sys.exit(1)
     
-    vault_path = sys.argv[1]
-    days = int(sys.argv[2]) if len(sys.argv) > 2 else 7
+    vault_path = args[0]
+    days = int(args[1]) if len(args) > 1 else 7
     
     print("\n" + "="*60)
     print("CEO BRIEFING GENERATOR")
     print("="*60)
     
     generator = CEOBriefingGenerator(vault_path)
-    briefing_file = generator.generate_briefing(days=days)
+    briefing_file = generator.generate_briefing(days=days, full_rebuild=full_rebuild)
     
     print(f"\n[OK] Briefing generated: {briefing_file}")
     print(f"     Location: {briefing_file.absolute()}")
     
+    print("\n[TIMING] Per-section time:")
+    for section, ms in generator.timings.items():
+        print(f"   {section}: {ms:.1f} ms")
+    
     print("\n" + "="*60)
     print("CEO BRIEFING READY")
     print("="*60 + "\n")
@@ -230,7 +230,7 @@ def main():
     print_check("Vault/Logs/ folder", logs_exists)
     
     # Check for log files
-    log_count = count_files(logs_folder, '*.json')
+    log_count = count_files(logs_folder, '*.json*')
     print_check(f"Log files present", log_count > 0, f"{log_count} files")
     
     audit_complete = audit_exists and logs_exists
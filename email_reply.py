@@ -20,6 +20,9 @@ from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
 import logging
 
+from approval_dispatcher import ApprovalDispatcher
+from atomic_writer import atomic_write_text
+
 # Fix Windows console encoding for Unicode characters
 if sys.platform == 'win32':
     sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
@@ -35,7 +38,7 @@ logger = logging.getLogger(__name__)
 class EmailReplySender:
     """Send email replies via Gmail API."""
     
-    def __init__(self, vault_path: Path):
+    def __init__(self, vault_path: Path, dispatcher: ApprovalDispatcher = None):
         self.vault_path = vault_path
         self.approved_folder = vault_path / 'Approved'
         self.done_folder = vault_path / 'Done'
@@ -44,6 +47,7 @@ class EmailReplySender:
         # Ensure folders exist
         self.approved_folder.mkdir(parents=True, exist_ok=True)
         self.done_folder.mkdir(parents=True, exist_ok=True)
+        self.dispatcher = dispatcher or ApprovalDispatcher(vault_path)
         
         # Load credentials
         token_path = Path(__file__).parent / 'token.json'
@@ -59,17 +63,8 @@ class EmailReplySender:
         logger.info("Email Reply Sender initialized")
 
     def check_approved_replies(self) -> list:
-        """Check for approved email reply files."""
-        approved_files = []
-        
-        for f in self.approved_folder.glob('*.md'):
-            content = f.read_text()
-            
-            # Check if it's an email reply approval
-            if 'type: email_reply' in content or 'type:email_reply' in content:
-                approved_files.append(f)
-        
-        return approved_files
+        """Claim approved email reply files."""
+        return self.dispatcher.claim('email_reply')
 
     def parse_reply_file(self, filepath: Path) -> dict:
         """Parse email reply file and extract details."""
@@ -212,6 +207,9 @@ class EmailReplySender:
                 
                 for filepath in approved_files:
                     self.process_approved_reply(filepath)
+                    # Not sent - hand it back for the next run
+                    if filepath.exists():
+                        self.dispatcher.release(filepath)
             else:
                 print("No approved email replies found")
                 print()
@@ -286,7 +284,7 @@ status: pending_approval
     pending_folder.mkdir(parents=True, exist_ok=True)
     
     filepath = pending_folder / f'EMAIL_REPLY_{timestamp}.md'
-    filepath.write_text(draft_content, encoding='utf-8')
+    atomic_write_text(filepath, draft_content)
     
     logger.info(f"Created email reply draft: {filepath.name}")
     
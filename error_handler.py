@@ -29,6 +29,10 @@ import json
 import sys
 import os
 
+from atomic_writer import atomic_write_text
+from vault_index import VaultIndex
+from task_model import intern_value
+
 # Fix Windows console encoding
 if sys.platform == 'win32':
     os.system('chcp 65001 > nul')
@@ -68,6 +72,7 @@ class ErrorHandler:
         # Create folders
         self.errors_folder.mkdir(parents=True, exist_ok=True)
         self.quarantine_folder.mkdir(parents=True, exist_ok=True)
+        self.index = VaultIndex(self.vault_path)
         
         # Setup logging
         self._setup_logging()
@@ -111,7 +116,9 @@ class ErrorHandler:
             try:
                 content = history_file.read_text(encoding='utf-8')
                 data = json.loads(content)
-                self.error_counts = data.get('counts', {})
+                self.error_counts = {
+                    intern_value(key): count for key, count in data.get('counts', {}).items()
+                }
             except Exception as e:
                 self.logger.warning(f"Could not load error history: {e}")
     
@@ -290,10 +297,11 @@ Retry Count: {retry_count}
 Add resolution notes here...
 '''
         
-        error_file.write_text(content, encoding='utf-8')
+        atomic_write_text(error_file, content)
         
         # Update error counts
-        key = f"{actor}:{action}"
+        # Interned - the same few actor:action keys repeat in both dicts
+        key = intern_value(f"{actor}:{action}")
         self.error_counts[key] = self.error_counts.get(key, 0) + 1
         self.last_error_time[key] = timestamp
         self._save_error_history()
@@ -351,7 +359,7 @@ status: pending_review
 3. If safe, move back to original location
 4. If not safe, delete permanently
 '''
-        meta_path.write_text(meta_content, encoding='utf-8')
+        atomic_write_text(meta_path, meta_content)
         
         self.logger.warning(f"Quarantined file: {file_path} -> {quarantine_path}")
         
@@ -475,25 +483,17 @@ status: pending_review
             'top_errors': []
         }
         
-        # Read all error files
-        for error_file in self.errors_folder.glob('ERROR_*.md'):
+        # Error frontmatter comes from the vault index - report bodies are never read
+        for record in self.index.find_records('Errors', name_prefix='ERROR_'):
+            error_file = record['path']
             try:
-                content = error_file.read_text(encoding='utf-8')
-                
-                # Parse frontmatter
-                if '---' not in content:
+                data = record['frontmatter']
+                if not data:
                     continue
                 
-                frontmatter = content.split('---')[1]
-                data = {}
-                for line in frontmatter.strip().split('\n'):
-                    if ':' in line:
-                        key, value = line.split(':', 1)
-                        data[key.strip()] = value.strip()
-                
                 # Check date
                 if 'timestamp' in data:
-                    error_date = datetime.fromisoformat(data['timestamp'])
+                    error_date = datetime.fromisoformat(str(data['timestamp']))
                     if error_date < cutoff:
                         continue
                 
@@ -580,7 +580,7 @@ An automated action failed and requires human review.
 Check /Vault/Errors/ and /Vault/Logs/ for more information.
 '''
         
-        escalation_file.write_text(content, encoding='utf-8')
+        atomic_write_text(escalation_file, content)
         
         self.logger.critical(
             f"Escalated to human: {action} - {error}"
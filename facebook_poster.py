@@ -9,6 +9,8 @@ import sys, codecs, logging, argparse, time, re
 from pathlib import Path
 from datetime import datetime
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
+from approval_dispatcher import ApprovalDispatcher
+from atomic_writer import atomic_write_text
 
 if sys.platform == 'win32':
     sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
@@ -17,7 +19,7 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 logger = logging.getLogger(__name__)
 
 class FacebookPoster:
-    def __init__(self, vault_path: Path):
+    def __init__(self, vault_path: Path, dispatcher: ApprovalDispatcher = None):
         self.vault_path = vault_path
         self.approved = vault_path / 'Approved'
         self.done = vault_path / 'Done'
@@ -25,15 +27,11 @@ class FacebookPoster:
         self.session = vault_path.parent / 'facebook_session'
         for f in [self.approved, self.done, self.logs, self.session]:
             f.mkdir(parents=True, exist_ok=True)
+        self.dispatcher = dispatcher or ApprovalDispatcher(vault_path)
 
     def check_approved(self):
-        """Find approved Facebook posts."""
-        files = []
-        for f in self.approved.glob('*.md'):
-            content = f.read_text(encoding='utf-8').lower()
-            if 'type: facebook' in content or 'platform: facebook' in content:
-                files.append(f)
-        return files
+        """Claim approved Facebook posts (type or platform starts with facebook)."""
+        return self.dispatcher.claim('facebook')
 
     def parse_post(self, filepath: Path):
         """Parse post content from markdown file."""
@@ -561,8 +559,7 @@ class FacebookPoster:
         
         if ok:
             # Move to Done
-            (self.done / filepath.name).write_bytes(filepath.read_bytes())
-            filepath.unlink()
+            self.dispatcher.complete(filepath)
             self.log_post(filepath.name, data['content'], str(img) if img else None)
             print(f"  ✓ Moved to Done")
             return True
@@ -585,6 +582,9 @@ class FacebookPoster:
             print(f"Found {len(files)} Facebook post(s)")
             for f in files:
                 self.process(f, headless, image_arg)
+                # Not posted - hand it back for the next run
+                if f.exists():
+                    self.dispatcher.release(f)
         else:
             print("No approved Facebook posts found")
             print("\nTo create a Facebook post:")
@@ -611,7 +611,7 @@ if __name__ == '__main__':
         if args.text:
             print(f"Posting direct text: {args.text[:50]}...")
             temp_file = vault / 'Approved' / f'facebook_temp_{datetime.now().strftime("%Y%m%d_%H%M%S")}.md'
-            temp_file.write_text(f'''---
+            atomic_write_text(temp_file, f'''---
 type: facebook_post
 created: {datetime.now().strftime("%Y-%m-%d")}
 status: approved
@@ -622,7 +622,7 @@ platform: facebook
 
 ## Post Content
 {args.text}
-''', encoding='utf-8')
+''')
             poster.process(temp_file, args.headless, args.image)
         else:
             poster.run(headless=args.headless, image_arg=args.image)
@@ -13,10 +13,11 @@ Files dropped in /Vault/Inbox will be automatically processed.
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 from pathlib import Path
-import shutil
 import logging
 import time
 
+from atomic_writer import atomic_copy, atomic_write_text
+
 class DropFolderHandler(FileSystemEventHandler):
     def __init__(self, vault_path: str):
         super().__init__()
@@ -64,12 +65,13 @@ class DropFolderHandler(FileSystemEventHandler):
     def process_file(self, source: Path):
         """Process a dropped file and create action file."""
         try:
-            # Copy file to Needs_Action
+            # Copy file to Needs_Action (a dropped .md is itself a task file,
+            # so it must never be seen half-copied)
             dest = self.needs_action / f'FILE_{source.name}'
-            shutil.copy2(source, dest)
+            atomic_copy(source, dest)
             
-            # Create metadata file
-            meta_path = dest.with_suffix('.md')
+            # Create metadata file - META_ prefix, so it can never be the copy
+            meta_path = self.needs_action / f'META_{dest.stem}.md'
             self.create_metadata(source, dest, meta_path)
             
             self.logger.info(f"Processed file: {source.name} -> {meta_path.name}")
@@ -113,7 +115,7 @@ status: pending
 File was automatically detected in Inbox folder.
 '''
         
-        meta_path.write_text(content)
+        atomic_write_text(meta_path, content)
 
 
 class FileSystemWatcher:
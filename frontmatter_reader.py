@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Frontmatter Reader - GOLD TIER
+Personal AI Employee Hackathon 0
+
+Reads only the YAML-style frontmatter header of vault markdown files.
+Scanners that just need `type:`, `status:` or `iteration:` stop reading at the
+closing `---` fence instead of loading (and regex-scanning) the whole body.
+
+Usage:
+    from frontmatter_reader import read_frontmatter, FrontmatterReader
+    
+    header = read_frontmatter(Path('Vault/Done/EMAIL_123.md'))
+    print(header.get('type'))
+    
+    # Track how many bytes a scan actually reads
+    reader = FrontmatterReader()
+    for f in Path('Vault/Done').glob('*.md'):
+        reader.read(f)
+    print(reader.bytes_read)
+
+Benchmark:
+    python frontmatter_reader.py Vault/Done
+"""
+
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+import sys
+import os
+
+# Fix Windows console encoding
+if sys.platform == 'win32':
+    os.system('chcp 65001 > nul')
+
+
+DEFAULT_MAX_BYTES = 16 * 1024  # Never read more than this per file
+CHUNK_SIZE = 512               # Read size while looking for the closing fence
+
+_INT_RE = re.compile(r'^-?\d+$')
+_FLOAT_RE = re.compile(r'^-?\d+\.\d+$')
+
+
+def _coerce(value: str) -> Any:
+    """Convert a frontmatter value to int/float/bool where unambiguous."""
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in ('"', "'"):
+        return value[1:-1]
+    if _INT_RE.match(value):
+        return int(value)
+    if _FLOAT_RE.match(value):
+        return float(value)
+    lowered = value.lower()
+    if lowered == 'true':
+        return True
+    if lowered == 'false':
+        return False
+    return value
+
+
+def parse_frontmatter(text: str) -> Dict[str, Any]:
+    """
+    Parse frontmatter lines (without the fences) into a typed dict.
+    
+    Plain `key: value` pairs are supported. Indented lines following a
+    `key: |` or `key: >` block are joined into that key's value.
+    
+    Args:
+        text: Frontmatter text between the `---` fences
+    
+    Returns:
+        Dictionary of header fields
+    """
+    header: Dict[str, Any] = {}
+    block_key: Optional[str] = None
+    block_lines = []
+    
+    for line in text.split('\n'):
+        line = line.rstrip('\r')
+        
+        if block_key and (line.startswith(' ') or line.startswith('\t') or not line):
+            block_lines.append(line.strip())
+            continue
+        if block_key:
+            header[block_key] = '\n'.join(block_lines).strip()
+            block_key = None
+        
+        if ':' not in line or line.startswith(' '):
+            continue
+        
+        key, value = line.split(':', 1)
+        key = key.strip()
+        value = value.strip()
+        
+        if value in ('|', '>'):
+            block_key = key
+            block_lines = []
+        else:
+            header[key] = _coerce(value)
+    
+    if block_key:
+        header[block_key] = '\n'.join(block_lines).strip()
+    
+    return header
+
+
+class FrontmatterReader:
+    """Bounded frontmatter reader that keeps byte/file counters."""
+    
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, chunk_size: int = CHUNK_SIZE):
+        """
+        Initialize reader.
+        
+        Args:
+            max_bytes: Maximum bytes read from a single file
+            chunk_size: Bytes read per call while looking for the closing fence
+        """
+        self.max_bytes = max_bytes
+        self.chunk_size = chunk_size
+        self.bytes_read = 0
+        self.files_read = 0
+    
+    def read(self, path: Path) -> Dict[str, Any]:
+        """
+        Read the frontmatter header of a file.
+        
+        Reading stops at the closing `---` fence or after max_bytes.
+        Files without a leading `---` line return an empty dict.
+        
+        Args:
+            path: Path to markdown file
+        
+        Returns:
+            Dictionary of header fields
+        """
+        text, _ = self.read_header(path)
+        return parse_frontmatter(text) if text is not None else {}
+    
+    def read_header(self, path: Path) -> Tuple[Optional[str], int]:
+        """
+        Read the raw frontmatter text of a file, unparsed.
+        
+        Args:
+            path: Path to markdown file
+        
+        Returns:
+            (text between the fences or None, byte offset of the body or -1
+            if the closing fence was not found within max_bytes)
+        """
+        buffer = b''
+        self.files_read += 1
+        
+        # Unbuffered, so bytes_read is what was actually requested from the OS
+        with open(path, 'rb', buffering=0) as f:
+            while len(buffer) < self.max_bytes:
+                chunk = f.read(min(self.chunk_size, self.max_bytes - len(buffer)))
+                if not chunk:
+                    break
+                buffer += chunk
+                self.bytes_read += len(chunk)
+                
+                # Bail out early when there is no frontmatter at all
+                start = buffer.lstrip(b'\xef\xbb\xbf')
+                if len(start) >= 3 and not start.startswith(b'---'):
+                    return None, -1
+                
+                end = self._find_closing_fence(start)
+                if end is not None:
+                    header_start = start.find(b'\n') + 1
+                    # The fence line always ends in a newline here
+                    body_offset = len(buffer) - len(start) + start.find(b'\n', end + 1) + 1
+                    return start[header_start:end].decode('utf-8', errors='replace'), body_offset
+        
+        # No closing fence within the budget - use the complete lines we have
+        start = buffer.lstrip(b'\xef\xbb\xbf')
+        header_start = start.find(b'\n') + 1
+        if not start.startswith(b'---') or not header_start:
+            return None, -1
+        data = start[header_start:]
+        if len(buffer) >= self.max_bytes:
+            data = data[:data.rfind(b'\n') + 1]
+        return data.decode('utf-8', errors='replace'), -1
+    
+    @staticmethod
+    def _find_closing_fence(data: bytes) -> Optional[int]:
+        """Find the offset of the closing `---` line after the opening fence."""
+        pos = data.find(b'\n') + 1
+        while pos:
+            nl = data.find(b'\n', pos)
+            if nl == -1:
+                return None
+            if data[pos:nl].rstrip(b'\r') == b'---':
+                return pos - 1
+            pos = nl + 1
+        return None
+
+
+_default_reader = FrontmatterReader()
+
+
+def read_frontmatter(path: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> Dict[str, Any]:
+    """Read the frontmatter header of a file (bounded read)."""
+    if max_bytes == DEFAULT_MAX_BYTES:
+        return _default_reader.read(path)
+    return FrontmatterReader(max_bytes=max_bytes).read(path)
+
+
+if __name__ == '__main__':
+    # Benchmark: bytes read per scan, full read vs frontmatter-only
+    if len(sys.argv) < 2:
+        print("Usage: python frontmatter_reader.py <folder> [glob_pattern]")
+        print("Example: python frontmatter_reader.py Vault/Done '*.md'")
+        sys.exit(1)
+    
+    folder = Path(sys.argv[1])
+    pattern = sys.argv[2] if len(sys.argv) > 2 else '*.md'
+    files = list(folder.glob(pattern))
+    
+    print("\n" + "="*60)
+    print("FRONTMATTER READER BENCHMARK")
+    print("="*60)
+    print(f"Folder: {folder}  ({len(files)} files)")
+    
+    # Full read (what scanners did before)
+    full_bytes = 0
+    start = time.perf_counter()
+    for f in files:
+        full_bytes += len(f.read_bytes())
+    full_time = time.perf_counter() - start
+    
+    # Bounded frontmatter read
+    reader = FrontmatterReader()
+    start = time.perf_counter()
+    for f in files:
+        reader.read(f)
+    header_time = time.perf_counter() - start
+    
+    ratio = (full_bytes / reader.bytes_read) if reader.bytes_read else 0
+    print(f"\n  Full read:        {full_bytes:>12,} bytes  {full_time*1000:8.1f} ms")
+    print(f"  Frontmatter only: {reader.bytes_read:>12,} bytes  {header_time*1000:8.1f} ms")
+    print(f"  Bytes reduction:  {ratio:.1f}x")
+    
+    print("\n" + "="*60 + "\n")
@@ -0,0 +1,559 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gmail Sync - GOLD TIER
+Personal AI Employee Hackathon 0
+
+Incremental Gmail sync through the history API.
+
+The last seen `historyId` is kept in Vault/.state/gmail_sync.json. Each
+sync asks `users.history.list` only for what changed since then (messages
+added to - or marked - UNREAD), following every page. Without a stored id,
+or when Gmail answers 404 because the id is too old, it falls back to a
+full sync: the current historyId is taken from `users.getProfile` first,
+then every page of `messages.list(q='is:unread')` is read, so nothing that
+arrives during the listing is missed.
+
+The new historyId is only persisted by commit(), after the caller has
+handled the returned messages - a crash in between replays the same delta
+instead of losing mail.
+
+Message details are fetched with fetch_metadata(): `messages.get` calls
+are grouped into batch HTTP requests (`new_batch_http_request`, up to
+BATCH_SIZE per round trip) and ask for `format='metadata'` with only the
+needed headers and a `fields` mask, instead of one full-format round trip
+per message. Items that fail with a rate-limit or server error are retried
+in a later batch; latency per batch is logged.
+
+The service object is only used through the discovery client's call chain
+(`service.users().history().list(...).execute()`), so FakeGmailService
+below stands in for it in tests.
+
+Usage:
+    sync = GmailSync(service, vault / '.state')
+    for message in sync.sync():   # [{'id': ..., 'threadId': ...}]
+        handle(message)
+    sync.commit()
+
+Self-test / benchmark:
+    python gmail_sync.py
+    python gmail_sync.py --bench --count 500 --rtt-ms 40
+"""
+
+import json
+import time
+import logging
+import argparse
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import sys
+import os
+
+from atomic_writer import atomic_write_text
+
+# Fix Windows console encoding
+if sys.platform == 'win32':
+    os.system('chcp 65001 > nul')
+
+
+SYNC_STATE_FILE = 'gmail_sync.json'
+PAGE_SIZE = 500  # Gmail's maximum for both list calls
+BATCH_SIZE = 50  # Gmail accepts 100 per batch but throttles large ones
+METADATA_HEADERS = ['From', 'Subject']
+METADATA_FIELDS = 'id,threadId,labelIds,snippet,payload/headers'
+RETRY_STATUSES = {'429', '500', '502', '503', '504'}
+
+
+def _http_status(error: Exception) -> Optional[str]:
+    """HTTP status of an API client error, if it has one."""
+    resp = getattr(error, 'resp', None)
+    status = getattr(resp, 'status', None) or getattr(error, 'status_code', None)
+    return None if status is None else str(status)
+
+
+def _is_not_found(error: Exception) -> bool:
+    """True for an HTTP 404 from the API client (expired/invalid historyId)."""
+    return _http_status(error) == '404'
+
+
+class GmailSync:
+    """Tracks Gmail's historyId and returns new unread messages."""
+    
+    def __init__(
+        self,
+        service,
+        state_dir: Path,
+        query: str = 'is:unread',
+        label_id: str = 'UNREAD',
+        user_id: str = 'me'
+    ):
+        """
+        Initialize sync engine.
+        
+        Args:
+            service: Gmail API service (googleapiclient or FakeGmailService)
+            state_dir: Folder for the sync state (Vault/.state)
+            query: Search used by full syncs
+            label_id: Label a message must carry in history deltas
+            user_id: Gmail user
+        """
+        self.service = service
+        self.state_path = Path(state_dir) / SYNC_STATE_FILE
+        self.query = query
+        self.label_id = label_id
+        self.user_id = user_id
+        self.logger = logging.getLogger(self.__class__.__name__)
+        
+        self.history_id: Optional[str] = None
+        self._pending_history_id: Optional[str] = None
+        self._load_state()
+        
+        self.stats = {'history_syncs': 0, 'full_syncs': 0, 'expired': 0, 'requests': 0, 'messages': 0,
+                      'batches': 0, 'fetched': 0, 'fetch_failed': 0}
+        self.batch_latencies: List[float] = []
+        self.unfetched: List[str] = []  # Ids still rate-limited after the last fetch's retries
+    
+    def _load_state(self):
+        try:
+            data = json.loads(self.state_path.read_text(encoding='utf-8'))
+            self.history_id = data.get('history_id')
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.warning(f"Could not read sync state, doing a full sync: {e}")
+    
+    def commit(self):
+        """Persist the historyId reached by the last sync()."""
+        if self._pending_history_id is None or self._pending_history_id == self.history_id:
+            return
+        self.history_id = self._pending_history_id
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(self.state_path, json.dumps({
+            'history_id': self.history_id,
+            'updated': datetime.now().isoformat()
+        }))
+    
+    def reset(self):
+        """Forget the stored historyId - the next sync is a full one."""
+        self.history_id = None
+        self._pending_history_id = None
+        try:
+            self.state_path.unlink()
+        except FileNotFoundError:
+            pass
+    
+    def sync(self) -> List[Dict[str, Any]]:
+        """
+        Fetch messages that became unread since the last commit().
+        
+        Returns:
+            Message stubs ({'id', 'threadId'}), oldest first, no duplicates
+        
+        Raises:
+            Whatever the API raises (other than an expired historyId); nothing
+            is left for commit() then, so a failed sync never advances history
+        """
+        # A pending id belongs to the sync whose messages it covers - never
+        # let a later (possibly failed) sync commit it
+        self._pending_history_id = None
+        start = time.perf_counter()
+        if self.history_id is None:
+            messages = self._full_sync()
+        else:
+            try:
+                messages = self._history_sync()
+            except Exception as e:
+                if not _is_not_found(e):
+                    raise
+                self.stats['expired'] += 1
+                self.logger.warning(f"historyId {self.history_id} expired - falling back to a full sync")
+                messages = self._full_sync()
+        self.stats['messages'] += len(messages)
+        self.logger.debug(f"Sync returned {len(messages)} message(s) in {time.perf_counter() - start:.2f}s")
+        return messages
+    
+    def _execute(self, request) -> Dict[str, Any]:
+        self.stats['requests'] += 1
+        return request.execute()
+    
+    def _history_sync(self) -> List[Dict[str, Any]]:
+        """Read every history page since history_id."""
+        users = self.service.users()
+        found: Dict[str, Dict[str, Any]] = {}
+        page_token = None
+        latest = self.history_id
+        while True:
+            response = self._execute(users.history().list(
+                userId=self.user_id,
+                startHistoryId=self.history_id,
+                historyTypes=['messageAdded', 'labelAdded'],
+                maxResults=PAGE_SIZE,
+                pageToken=page_token
+            ))
+            for record in response.get('history', []):
+                added = [entry['message'] for entry in record.get('messagesAdded', [])]
+                added += [
+                    entry['message'] for entry in record.get('labelsAdded', [])
+                    if self.label_id in entry.get('labelIds', [])
+                ]
+                for message in added:
+                    if self.label_id in message.get('labelIds', [self.label_id]):
+                        found.setdefault(message['id'], {'id': message['id'], 'threadId': message.get('threadId')})
+            latest = response.get('historyId', latest)
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                break
+        self._pending_history_id = str(latest)
+        self.stats['history_syncs'] += 1
+        return list(found.values())
+    
+    def _full_sync(self) -> List[Dict[str, Any]]:
+        """List every page of the query; start history from before the listing."""
+        users = self.service.users()
+        profile = self._execute(users.getProfile(userId=self.user_id))
+        found: Dict[str, Dict[str, Any]] = {}
+        page_token = None
+        while True:
+            response = self._execute(users.messages().list(
+                userId=self.user_id,
+                q=self.query,
+                maxResults=PAGE_SIZE,
+                pageToken=page_token
+            ))
+            for message in response.get('messages', []):
+                found.setdefault(message['id'], message)
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                break
+        self._pending_history_id = str(profile['historyId'])
+        self.stats['full_syncs'] += 1
+        # messages.list is newest first
+        return list(reversed(list(found.values())))
+    
+    
+    def fetch_metadata(
+        self,
+        messages: List[Dict[str, Any]],
+        batch_size: int = BATCH_SIZE,
+        retries: int = 2
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch headers and snippet for many messages in batched round trips.
+        
+        Args:
+            messages: Stubs with an 'id' (as returned by sync())
+            batch_size: messages.get calls per batch request
+            retries: Extra rounds for items that hit rate limits or 5xx
+        
+        Returns:
+            Message resources ('id', 'threadId', 'snippet', 'payload'
+            with the METADATA_HEADERS), in input order; failures are
+            logged and left out (transient ones listed in self.unfetched)
+        """
+        pending = [m['id'] for m in messages]
+        fetched: Dict[str, Dict[str, Any]] = {}
+        latencies = []
+        for attempt in range(retries + 1):
+            retry: List[str] = []
+            for start in range(0, len(pending), batch_size):
+                chunk = pending[start:start + batch_size]
+                began = time.perf_counter()
+                retry += self._fetch_batch(chunk, fetched)
+                latencies.append(time.perf_counter() - began)
+            if not retry or attempt == retries:
+                break
+            pending = retry
+            self.logger.warning(f"Retrying {len(retry)} message fetch(es) after rate limiting")
+            time.sleep(min(2 ** attempt, 8))
+        
+        self.batch_latencies = latencies
+        self.unfetched = retry
+        self.stats['batches'] += len(latencies)
+        self.stats['fetched'] += len(fetched)
+        self.stats['fetch_failed'] += len(messages) - len(fetched)
+        if latencies:
+            self.logger.info(
+                f"Fetched {len(fetched)}/{len(messages)} message(s) in {len(latencies)} batch(es): "
+                f"{sum(latencies) * 1000 / len(latencies):.0f} ms avg, {max(latencies) * 1000:.0f} ms max per batch"
+            )
+        return [fetched[m['id']] for m in messages if m['id'] in fetched]
+    
+    def _fetch_batch(self, ids: List[str], fetched: Dict[str, Dict[str, Any]]) -> List[str]:
+        """One batch request; returns ids worth retrying."""
+        retry: List[str] = []
+        
+        def on_response(request_id, response, exception):
+            if exception is None:
+                fetched[request_id] = response
+                return
+            if _http_status(exception) in RETRY_STATUSES:
+                retry.append(request_id)
+            self.logger.error(f"Error fetching message {request_id}: {exception}")
+        
+        batch = self.service.new_batch_http_request(callback=on_response)
+        messages = self.service.users().messages()
+        for message_id in ids:
+            batch.add(messages.get(
+                userId=self.user_id,
+                id=message_id,
+                format='metadata',
+                metadataHeaders=METADATA_HEADERS,
+                fields=METADATA_FIELDS
+            ), request_id=message_id)
+        self.stats['requests'] += 1
+        batch.execute()
+        return retry
+
+
+class _Request:
+    """Deferred fake API call (mirrors googleapiclient's HttpRequest)."""
+    
+    def __init__(self, service: 'FakeGmailService', fn, *args, **kwargs):
+        self.service = service
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+    
+    def execute(self):
+        self.service.calls.append(self.fn.__name__)
+        time.sleep(self.service.rtt)
+        return self.fn(*self.args, **self.kwargs)
+
+
+class _Batch:
+    """Fake batch request: one round trip, one callback per added request."""
+    
+    def __init__(self, service: 'FakeGmailService', callback):
+        self.service = service
+        self.callback = callback
+        self.requests: List[Any] = []
+    
+    def add(self, request: _Request, callback=None, request_id: Optional[str] = None):
+        self.requests.append((request_id or str(len(self.requests)), request, callback or self.callback))
+    
+    def execute(self):
+        self.service.calls.append('batch')
+        time.sleep(self.service.rtt)
+        for request_id, request, callback in self.requests:
+            try:
+                response, error = request.fn(*request.args, **request.kwargs), None
+            except Exception as e:
+                response, error = None, e
+            callback(request_id, response, error)
+
+
+class FakeHttpError(Exception):
+    """Stand-in for googleapiclient.errors.HttpError."""
+    
+    def __init__(self, status: int, reason: str):
+        super().__init__(f"<HttpError {status} \"{reason}\">")
+        self.resp = type('Resp', (), {'status': status})()
+
+
+class FakeGmailService:
+    """
+    In-memory Gmail for tests: a mailbox, a history log and the call chain
+    GmailSync uses. Pages are small so pagination is exercised.
+    """
+    
+    def __init__(self, page_size: int = 3, rtt: float = 0.0):
+        self.page_size = page_size
+        self.rtt = rtt  # Simulated seconds per HTTP round trip
+        self.throttle: set = set()  # Message ids whose next get answers 429
+        self.mailbox: Dict[str, Dict[str, Any]] = {}
+        self.history_log: List[Dict[str, Any]] = []
+        self.history_id = 1000
+        self.oldest_history_id = 1000
+        self.calls: List[str] = []
+        self._next_id = 1
+    
+    # Mailbox changes
+    
+    def deliver(self, subject: str = 'Hello', sender: str = 'someone@example.com', unread: bool = True) -> str:
+        message_id = f'{self._next_id:016x}'
+        self._next_id += 1
+        labels = ['INBOX'] + (['UNREAD'] if unread else [])
+        self.mailbox[message_id] = {
+            'id': message_id, 'threadId': message_id, 'labelIds': labels,
+            'snippet': f'{subject} ...', 'headers': {'From': sender, 'Subject': subject}
+        }
+        self._record({'messagesAdded': [{'message': self._stub(message_id)}]})
+        return message_id
+    
+    def mark_read(self, message_id: str):
+        self.mailbox[message_id]['labelIds'].remove('UNREAD')
+        self._record({'labelsRemoved': [{'message': self._stub(message_id), 'labelIds': ['UNREAD']}]})
+    
+    def expire_history(self):
+        """Drop the history log - older startHistoryIds now return 404."""
+        self.history_log = []
+        self.oldest_history_id = self.history_id + 1
+    
+    def _stub(self, message_id: str) -> Dict[str, Any]:
+        message = self.mailbox[message_id]
+        return {'id': message_id, 'threadId': message['threadId'], 'labelIds': list(message['labelIds'])}
+    
+    def _record(self, change: Dict[str, Any]):
+        self.history_id += 1
+        self.history_log.append(dict(change, id=str(self.history_id)))
+    
+    # API call chain
+    
+    def users(self):
+        return self
+    
+    def history(self):
+        return _Resource(self, list=self._history_list)
+    
+    def messages(self):
+        return _Resource(self, list=self._messages_list, get=self._messages_get)
+    
+    def getProfile(self, userId: str):
+        return _Request(self, self._get_profile)
+    
+    def new_batch_http_request(self, callback=None):
+        return _Batch(self, callback)
+    
+    def _get_profile(self):
+        return {'emailAddress': 'me@example.com', 'historyId': str(self.history_id)}
+    
+    def _page(self, items: List[Any], page_token: Optional[str], max_results: int):
+        size = min(max_results or self.page_size, self.page_size)
+        start = int(page_token or 0)
+        page = items[start:start + size]
+        token = str(start + size) if start + size < len(items) else None
+        return page, token
+    
+    def _history_list(self, userId, startHistoryId, historyTypes=None, maxResults=None, pageToken=None, **_):
+        if int(startHistoryId) < self.oldest_history_id:
+            raise FakeHttpError(404, 'Requested entity was not found.')
+        records = [h for h in self.history_log if int(h['id']) > int(startHistoryId)]
+        page, token = self._page(records, pageToken, maxResults)
+        response = {'history': page, 'historyId': str(self.history_id)}
+        if token:
+            response['nextPageToken'] = token
+        return response
+    
+    def _messages_list(self, userId, q='', maxResults=None, pageToken=None, **_):
+        unread = [
+            {'id': m['id'], 'threadId': m['threadId']}
+            for m in reversed(list(self.mailbox.values()))
+            if 'is:unread' not in q or 'UNREAD' in m['labelIds']
+        ]
+        page, token = self._page(unread, pageToken, maxResults)
+        response = {'messages': page, 'resultSizeEstimate': len(unread)}
+        if token:
+            response['nextPageToken'] = token
+        return response
+    
+    def _messages_get(self, userId, id, format='full', metadataHeaders=None, fields=None, **_):
+        if id in self.throttle:
+            self.throttle.discard(id)
+            raise FakeHttpError(429, 'Rate Limit Exceeded')
+        if id not in self.mailbox:
+            raise FakeHttpError(404, 'Requested entity was not found.')
+        message = self.mailbox[id]
+        headers = [
+            {'name': name, 'value': value} for name, value in message['headers'].items()
+            if not metadataHeaders or name in metadataHeaders
+        ]
+        return {'id': id, 'threadId': message['threadId'], 'labelIds': list(message['labelIds']),
+                'snippet': message['snippet'], 'payload': {'headers': headers}}
+
+
+class _Resource:
+    """Fake API resource: each method returns a deferred request."""
+    
+    def __init__(self, service: FakeGmailService, **methods):
+        self._service = service
+        self._methods = methods
+    
+    def __getattr__(self, name):
+        fn = self._methods[name]
+        return lambda **kwargs: _Request(self._service, fn, **kwargs)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Gmail Sync self-test')
+    parser.add_argument('--bench', action='store_true', help='Compare per-message and batched fetches')
+    parser.add_argument('--count', type=int, default=500, help='Backlog size for --bench')
+    parser.add_argument('--rtt-ms', type=float, default=40.0, help='Simulated round trip for --bench')
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    
+    print("\n" + "="*60)
+    print("GMAIL SYNC " + ("BENCHMARK" if args.bench else "SELF-TEST") + " (fake service)")
+    print("="*60)
+    
+    if args.bench:
+        gmail = FakeGmailService(page_size=PAGE_SIZE, rtt=args.rtt_ms / 1000)
+        ids = [gmail.deliver(f'Backlog {n}') for n in range(args.count)]
+        with tempfile.TemporaryDirectory() as tmp:
+            sync = GmailSync(gmail, Path(tmp))
+            
+            start = time.perf_counter()
+            for message_id in ids:
+                gmail.users().messages().get(userId='me', id=message_id).execute()
+            sequential = time.perf_counter() - start
+            
+            start = time.perf_counter()
+            fetched = sync.fetch_metadata([{'id': i} for i in ids])
+            batched = time.perf_counter() - start
+        
+        print(f"\n  {args.count} messages, {args.rtt_ms:.0f} ms per round trip")
+        print(f"  one get per message:  {sequential:7.2f}s  ({args.count} requests)")
+        print(f"  batched metadata:     {batched:7.2f}s  ({sync.stats['batches']} requests, "
+              f"{len(fetched)} fetched)")
+        print(f"  speed-up:             {sequential / batched:7.1f}x")
+        print("\n" + "="*60 + "\n")
+        sys.exit(0)
+    
+    def check(label: str, ok: bool):
+        print(f"  [{'OK' if ok else 'FAIL'}] {label}")
+        if not ok:
+            sys.exit(1)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        gmail = FakeGmailService(page_size=3)
+        old = [gmail.deliver(f'Old {n}') for n in range(7)]
+        gmail.mark_read(old[0])
+        
+        sync = GmailSync(gmail, Path(tmp))
+        first = sync.sync()
+        check("first run is a paginated full sync of all unread mail",
+              [m['id'] for m in first] == old[1:] and sync.stats['full_syncs'] == 1)
+        sync.commit()
+        
+        new = [gmail.deliver(f'New {n}') for n in range(5)]
+        gmail.deliver('Already read', unread=False)
+        gmail.calls.clear()
+        delta = GmailSync(gmail, Path(tmp)).sync()
+        check("restart resumes from the stored historyId (history.list only)",
+              [m['id'] for m in delta] == new and set(gmail.calls) == {'_history_list'})
+        
+        sync = GmailSync(gmail, Path(tmp))
+        sync.sync()
+        check("uncommitted delta is replayed", [m['id'] for m in sync.sync()] == new)
+        sync.commit()
+        check("nothing new after commit", sync.sync() == [])
+        
+        gmail.expire_history()
+        late = gmail.deliver('After expiry')
+        recovered = sync.sync()
+        check("expired historyId falls back to a full sync",
+              sync.stats['expired'] == 1 and late in [m['id'] for m in recovered])
+        
+        wanted = new + [late]
+        gmail.throttle.add(new[2])
+        gmail.calls.clear()
+        details = sync.fetch_metadata([{'id': i} for i in wanted + ['missing']], batch_size=4)
+        check("batched fetch returns metadata in order, retrying the throttled item",
+              [m['id'] for m in details] == wanted and gmail.calls.count('batch') == 3)
+        headers = {h['name'] for m in details for h in m['payload']['headers']}
+        check("only the requested headers are returned", headers == set(METADATA_HEADERS))
+        print(f"\n  Stats: {sync.stats}")
+    
+    print("\n" + "="*60 + "\n")
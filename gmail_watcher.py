@@ -3,24 +3,32 @@
 Gmail Watcher - Monitors Gmail for unread, important messages
 and creates action files in Vault/Needs_Action folder.
 
+New mail is found incrementally through the Gmail history API (see
+gmail_sync.py): only changes since the historyId stored in
+Vault/.state/gmail_sync.json are fetched, with a paginated full sync when
+that id has expired. The stored id advances once every new message has
+its action file. Headers and snippets for new mail are fetched in batch
+requests with metadata-only field masks, not one full get per message.
+
 Usage: python gmail_watcher.py
 """
 
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
 from base_watcher import BaseWatcher
+from gmail_sync import GmailSync, METADATA_HEADERS, METADATA_FIELDS
 from datetime import datetime
 from pathlib import Path
 import sys
 import time
 
 class GmailWatcher(BaseWatcher):
-    def __init__(self, vault_path: str, credentials_path: str = None):
+    def __init__(self, vault_path: str, credentials_path: str = None, scheduler=None, ingest=None):
         # Default paths
         if credentials_path is None:
             credentials_path = Path(__file__).parent / 'credentials.json'
         
-        super().__init__(vault_path, check_interval=120)
+        super().__init__(vault_path, check_interval=120, scheduler=scheduler, ingest=ingest)
         
         # Load credentials
         self.credentials_path = Path(credentials_path)
@@ -34,53 +42,54 @@ class GmailWatcher(BaseWatcher):
         
         self.creds = Credentials.from_authorized_user_file(self.token_path)
         self.service = build('gmail', 'v1', credentials=self.creds)
-        self.processed_ids = set()
+        self.processed_ids = self.open_seen_store('gmail_processed_ids')
+        self.sync = GmailSync(self.service, self.vault_path / '.state')
         
-        # Load already processed IDs from existing files
-        self._load_processed_ids()
+        # First run only - later runs load the persisted store
+        if self.processed_ids.is_new:
+            self._load_processed_ids()
 
     def _load_processed_ids(self):
-        """Load already processed email IDs from Needs_Action folder."""
+        """Seed processed email IDs from Needs_Action folder and current unread mail."""
         # Only load from existing EMAIL_*.md files
-        for f in self.needs_action.glob('EMAIL_*.md'):
-            try:
-                email_id = f.stem.replace('EMAIL_', '')
-                self.processed_ids.add(email_id)
-            except:
-                pass
+        self.processed_ids.update(
+            f.stem.replace('EMAIL_', '') for f in self.needs_action.glob('EMAIL_*.md')
+        )
         
-        # Also mark existing unread emails as processed (avoid flooding on first run)
+        # Also mark existing unread emails as processed (avoid flooding on first run);
+        # the full sync also stores the historyId later polls start from
         try:
-            results = self.service.users().messages().list(
-                userId='me', q='is:unread', maxResults=100
-            ).execute()
-            messages = results.get('messages', [])
-            for msg in messages:
-                self.processed_ids.add(msg['id'])
+            messages = self.sync.sync()
+            self.processed_ids.update(msg['id'] for msg in messages)
+            self.sync.commit()
             if messages:
                 self.logger.info(f"Marked {len(messages)} existing unread emails as processed")
         except Exception as e:
             self.logger.error(f"Error loading existing emails: {e}")
 
     def check_for_updates(self) -> list:
-        """Check for new unread emails."""
-        try:
-            # Check ALL unread emails (not just important)
-            results = self.service.users().messages().list(
-                userId='me', q='is:unread'
-            ).execute()
-            messages = results.get('messages', [])
-            return [m for m in messages if m['id'] not in self.processed_ids]
-        except Exception as e:
-            self.logger.error(f"Error checking Gmail: {e}")
-            return []
+        """
+        Check for new unread emails (history delta since the last commit).
+        
+        Sync errors propagate so poll_once() skips commit() for this poll.
+        """
+        # Check ALL unread emails (not just important)
+        messages = self.sync.sync()
+        return [m for m in messages if m['id'] not in self.processed_ids]
 
     def create_action_file(self, message) -> Path:
-        """Create markdown action file for the email."""
+        """Create markdown action file for the email.
+        
+        `message` is either a resource from sync.fetch_metadata() or a bare
+        {'id': ...} stub, which is then fetched on its own.
+        """
         try:
-            msg = self.service.users().messages().get(
-                userId='me', id=message['id']
-            ).execute()
+            msg = message
+            if 'payload' not in msg:
+                msg = self.service.users().messages().get(
+                    userId='me', id=message['id'], format='metadata',
+                    metadataHeaders=METADATA_HEADERS, fields=METADATA_FIELDS
+                ).execute()
 
             # Extract headers
             headers = {h['name']: h['value'] for h in msg['payload']['headers']}
@@ -103,7 +112,7 @@ status: pending
 - [ ] Archive after processing
 '''
             filepath = self.needs_action / f'EMAIL_{message["id"]}.md'
-            filepath.write_text(content)
+            self.write_action_file(filepath, content)
             self.processed_ids.add(message['id'])
             
             self.logger.info(f"Created action file: {filepath.name}")
@@ -113,12 +122,42 @@ status: pending
             self.logger.error(f"Error creating action file: {e}")
             return None
 
+    def poll_once(self) -> float:
+        """
+        Check Gmail once and write action files for new mail.
+        
+        Returns:
+            Seconds to sleep before the next poll
+        """
+        if self.reasoner_backlogged():
+            return self.check_interval
+        try:
+            started = time.perf_counter()
+            items = self.check_for_updates()
+            failed = 0
+            if items:
+                print(f"[{datetime.now().strftime('%H:%M:%S')}] Found {len(items)} new email(s)")
+                messages = self.sync.fetch_metadata(items)
+                failed = len(self.sync.unfetched)  # Deleted mail is not retried
+                for message in messages:
+                    if self.create_action_file(message) is None:
+                        failed += 1
+            else:
+                print(f"[{datetime.now().strftime('%H:%M:%S')}] No new emails")
+            # Advance the stored historyId only when nothing needs a retry
+            if not failed:
+                self.sync.commit()
+            return self.record_poll(len(items), started)
+        except Exception as e:
+            self.logger.error(f'Error: {e}')
+            return self.check_interval
+
     def run(self):
         """Run the watcher loop."""
         self.logger.info('Starting GmailWatcher')
         print()
         print("Gmail Watcher is running...")
-        print(f"Checking every {self.check_interval} seconds")
+        print(f"Checking every {self.check_interval} seconds (adapts to traffic)")
         print(f"Vault: {self.vault_path}")
         print(f"Output: {self.needs_action}")
         print()
@@ -126,20 +165,18 @@ status: pending
         print("-" * 40)
         
         while True:
-            try:
-                items = self.check_for_updates()
-                if items:
-                    print(f"[{datetime.now().strftime('%H:%M:%S')}] Found {len(items)} new email(s)")
-                    for item in items:
-                        self.create_action_file(item)
-                else:
-                    print(f"[{datetime.now().strftime('%H:%M:%S')}] No new emails")
-            except Exception as e:
-                self.logger.error(f'Error: {e}')
-            time.sleep(self.check_interval)
+            time.sleep(self.poll_once())
 
 
 if __name__ == '__main__':
+    import argparse
+    from poll_scheduler import AdaptiveScheduler, FixedScheduler, parse_quiet_hours
+    
+    parser = argparse.ArgumentParser(description='Gmail Watcher')
+    parser.add_argument('--quiet-hours', metavar='START-END', help='Poll rarely between these hours, e.g. 23-7')
+    parser.add_argument('--fixed-interval', action='store_true', help='Always wait check_interval (no adaptive polling)')
+    args = parser.parse_args()
+    
     # Setup logging
     import logging
     logging.basicConfig(
@@ -155,5 +192,9 @@ if __name__ == '__main__':
         sys.exit(1)
     
     # Create and run watcher
-    watcher = GmailWatcher(str(vault_path))
+    if args.fixed_interval:
+        scheduler = FixedScheduler(120)
+    else:
+        scheduler = AdaptiveScheduler(120, quiet_hours=parse_quiet_hours(args.quiet_hours))
+    watcher = GmailWatcher(str(vault_path), scheduler=scheduler)
     watcher.run()
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Handbook Rules - GOLD TIER
+Personal AI Employee Hackathon 0
+
+Compiled approval rules from Company_Handbook.md and mcp_config.json.
+
+Sources:
+    Company_Handbook.md      Lines such as "Flag any payment over $500 for
+                             approval" or "Auto-approve payments under $25"
+    mcp_config.json          human_in_the_loop: auto_approve_under,
+                             sensitive_actions, approval_timeout_hours
+
+Both files are parsed once into a RuleSet of plain dict lookups, so
+evaluating a task costs a few dictionary reads. RuleEngine.get() checks
+the files' mtimes at most once per `check_interval`; when one changed the
+new RuleSet is built on a background thread and swapped in, and tasks keep
+using the previous rules until it is ready.
+
+Usage:
+    from handbook_rules import RuleEngine
+    
+    rules = RuleEngine(vault / 'Company_Handbook.md', Path('mcp_config.json'))
+    decision = rules.get().evaluate(['payment'], 750.0)
+    decision['requires_approval']   # True - "Payment over $500.0"
+    
+    python handbook_rules.py              # Show compiled rules
+    python handbook_rules.py --bench      # Evaluation throughput
+"""
+
+import re
+import json
+import time
+import logging
+import argparse
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import sys
+import os
+
+# Fix Windows console encoding
+if sys.platform == 'win32':
+    os.system('chcp 65001 > nul')
+
+
+DEFAULT_APPROVAL_THRESHOLD = 500.0  # Used when the handbook has no payment rule
+DEFAULT_TIMEOUT_HOURS = 24.0
+
+# Without a config every outbound action needs a human
+DEFAULT_SENSITIVE_ACTIONS = (
+    'payment', 'email_send', 'whatsapp_send', 'social_post', 'invoice_create', 'external_api_call'
+)
+
+# Most specific kind first - an invoice is also a payment
+AMOUNT_KINDS = ('invoice', 'payment')
+
+_NUMBER = r'\$\s*([\d,]+(?:\.\d+)?)'
+_KIND = r'(payment|invoice|transfer|expense|purchase)s?'
+_APPROVAL_LINE = re.compile(
+    rf'\b{_KIND}\b[^\n$]*?\b(?:over|above|exceeding|greater than|more than)\s*{_NUMBER}',
+    re.IGNORECASE
+)
+_APPROVAL_WORDS = re.compile(r'approv|flag|review|sign[- ]off', re.IGNORECASE)
+_AUTO_APPROVE_LINE = re.compile(
+    rf'auto[- ]?approve[^\n$]*?\b{_KIND}\b[^\n$]*?\b(?:under|below|less than)\s*{_NUMBER}',
+    re.IGNORECASE
+)
+
+
+def _kind(word: str) -> str:
+    """Normalize handbook wording to a rule kind ('transfer' -> 'payment')."""
+    word = word.lower()
+    return word if word in AMOUNT_KINDS else 'payment'
+
+
+class RuleSet:
+    """Immutable, compiled approval rules."""
+    
+    def __init__(
+        self,
+        approval_over: Dict[str, float],
+        auto_approve_under: Dict[str, float],
+        sensitive_actions: Iterable[str] = DEFAULT_SENSITIVE_ACTIONS,
+        approval_timeout_hours: float = DEFAULT_TIMEOUT_HOURS,
+        hitl_enabled: bool = True
+    ):
+        """
+        Initialize rule set.
+        
+        Args:
+            approval_over: Kind -> amount above which approval is required
+            auto_approve_under: Kind -> amount below which an item may be auto-approved
+            sensitive_actions: Actions that always need a human
+            approval_timeout_hours: Age after which a pending approval expires
+            hitl_enabled: Human-in-the-loop switch from mcp_config.json
+        """
+        self.approval_over = dict(approval_over)
+        self.approval_over.setdefault('payment', DEFAULT_APPROVAL_THRESHOLD)
+        self.auto_approve_under = dict(auto_approve_under)
+        self.sensitive_actions = frozenset(sensitive_actions)
+        self.approval_timeout_hours = approval_timeout_hours
+        self.hitl_enabled = hitl_enabled
+        
+        # Precomputed (kind, approval limit) in lookup order
+        self._kinds: Tuple[Tuple[str, float], ...] = tuple(
+            (kind, self.approval_over.get(kind, self.approval_over['payment']))
+            for kind in AMOUNT_KINDS
+        )
+    
+    def evaluate(self, kinds: Iterable[str], amount: Optional[float]) -> Dict[str, Any]:
+        """
+        Apply the amount rules to a task.
+        
+        Args:
+            kinds: Kinds detected in the task ('invoice', 'payment')
+            amount: Amount found in the task, if any
+        
+        Returns:
+            Dict with 'requires_approval', 'approval_reason' and the
+            matched 'kind'
+        """
+        for kind, limit in self._kinds:
+            if kind not in kinds:
+                continue
+            if amount is not None and amount > limit:
+                return {'requires_approval': True,
+                        'approval_reason': f'{kind.capitalize()} over ${limit}',
+                        'kind': kind}
+            return {'requires_approval': False, 'approval_reason': None, 'kind': kind}
+        return {'requires_approval': False, 'approval_reason': None, 'kind': None}
+    
+    def is_sensitive(self, action: str) -> bool:
+        """True if the action is on the always-ask list."""
+        return action in self.sensitive_actions
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'approval_over': self.approval_over,
+            'auto_approve_under': self.auto_approve_under,
+            'sensitive_actions': sorted(self.sensitive_actions),
+            'approval_timeout_hours': self.approval_timeout_hours,
+            'hitl_enabled': self.hitl_enabled
+        }
+
+
+def parse_handbook(text: str) -> Tuple[Dict[str, float], Dict[str, float]]:
+    """
+    Extract amount rules from handbook markdown.
+    
+    Returns:
+        (approval_over, auto_approve_under) keyed by kind; where a kind is
+        mentioned twice the strictest limit wins
+    """
+    approval_over: Dict[str, float] = {}
+    auto_approve_under: Dict[str, float] = {}
+    for line in text.splitlines():
+        auto = _AUTO_APPROVE_LINE.search(line)
+        if auto:
+            kind, limit = _kind(auto.group(1)), float(auto.group(2).replace(',', ''))
+            auto_approve_under[kind] = min(limit, auto_approve_under.get(kind, limit))
+            continue
+        rule = _APPROVAL_LINE.search(line)
+        if rule and _APPROVAL_WORDS.search(line):
+            kind, limit = _kind(rule.group(1)), float(rule.group(2).replace(',', ''))
+            approval_over[kind] = min(limit, approval_over.get(kind, limit))
+    return approval_over, auto_approve_under
+
+
+def load_rules(handbook_path: Optional[Path], config_path: Optional[Path]) -> RuleSet:
+    """
+    Build a RuleSet from the handbook and the human_in_the_loop config.
+    
+    Missing files are skipped. Handbook auto-approve limits override
+    mcp_config.json ones for the same kind.
+    """
+    approval_over: Dict[str, float] = {}
+    auto_approve_under: Dict[str, float] = {}
+    sensitive_actions: List[str] = list(DEFAULT_SENSITIVE_ACTIONS)
+    timeout_hours = DEFAULT_TIMEOUT_HOURS
+    enabled = True
+    
+    if config_path is not None and config_path.exists():
+        hitl = json.loads(config_path.read_text(encoding='utf-8')).get('human_in_the_loop', {})
+        auto_approve_under.update(
+            {kind: float(limit) for kind, limit in hitl.get('auto_approve_under', {}).items()}
+        )
+        sensitive_actions = hitl.get('sensitive_actions', sensitive_actions)
+        timeout_hours = float(hitl.get('approval_timeout_hours', DEFAULT_TIMEOUT_HOURS))
+        enabled = bool(hitl.get('enabled', True))
+    
+    if handbook_path is not None and handbook_path.exists():
+        handbook_over, handbook_auto = parse_handbook(handbook_path.read_text(encoding='utf-8'))
+        approval_over.update(handbook_over)
+        auto_approve_under.update(handbook_auto)
+    
+    return RuleSet(approval_over, auto_approve_under, sensitive_actions, timeout_hours, enabled)
+
+
+class RuleEngine:
+    """Serves the current RuleSet and reloads it when a source file changes."""
+    
+    def __init__(
+        self,
+        handbook_path: Optional[Path],
+        config_path: Optional[Path],
+        check_interval: float = 1.0
+    ):
+        """
+        Load rules.
+        
+        Args:
+            handbook_path: Company_Handbook.md
+            config_path: mcp_config.json
+            check_interval: Minimum seconds between mtime checks
+        """
+        self.handbook_path = handbook_path
+        self.config_path = config_path
+        self.check_interval = check_interval
+        self.logger = logging.getLogger(self.__class__.__name__)
+        
+        self._lock = threading.Lock()
+        self._reloading = False
+        self._next_check = time.monotonic() + check_interval
+        self.reloads = 0
+        self._mtimes = self._stat()
+        self._rules = self._load()
+    
+    def _stat(self) -> Tuple[Optional[int], Optional[int]]:
+        """mtime_ns of each source file (None if missing)."""
+        mtimes = []
+        for path in (self.handbook_path, self.config_path):
+            try:
+                mtimes.append(path.stat().st_mtime_ns if path is not None else None)
+            except FileNotFoundError:
+                mtimes.append(None)
+        return tuple(mtimes)
+    
+    def _load(self) -> RuleSet:
+        try:
+            return load_rules(self.handbook_path, self.config_path)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Could not load rules ({e}) - using defaults")
+            return RuleSet({}, {})
+    
+    def get(self) -> RuleSet:
+        """Current rules; schedules a background reload if a source changed."""
+        now = time.monotonic()
+        if now >= self._next_check:
+            with self._lock:
+                if now >= self._next_check and not self._reloading:
+                    self._next_check = now + self.check_interval
+                    mtimes = self._stat()
+                    if mtimes != self._mtimes:
+                        self._reloading = True
+                        threading.Thread(
+                            target=self._reload, args=(mtimes,), name='RuleReload', daemon=True
+                        ).start()
+        return self._rules
+    
+    def _reload(self, mtimes: Tuple[Optional[int], Optional[int]]):
+        try:
+            rules = load_rules(self.handbook_path, self.config_path)
+        except (OSError, ValueError) as e:
+            # Keep serving the previous rules - e.g. a half-edited JSON file
+            self.logger.warning(f"Rule reload failed, keeping previous rules: {e}")
+            rules = None
+        with self._lock:
+            # Recorded on failure too: retry only once the file changes again
+            self._mtimes = mtimes
+            if rules is not None:
+                self._rules = rules
+                self.reloads += 1
+            self._reloading = False
+        if rules is not None:
+            self.logger.info(f"Reloaded rules: {rules.to_dict()}")
+    
+    def reload(self):
+        """Reload synchronously (e.g. from tests or a CLI)."""
+        mtimes = self._stat()
+        with self._lock:
+            self._reloading = True
+        self._reload(mtimes)
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    
+    parser = argparse.ArgumentParser(description='Handbook rules')
+    parser.add_argument('vault', nargs='?', default=str(Path(__file__).parent / 'Vault'),
+                        help='Vault folder (default: ./Vault)')
+    parser.add_argument('--config', default=str(Path(__file__).parent / 'mcp_config.json'),
+                        help='MCP config file (default: ./mcp_config.json)')
+    parser.add_argument('--bench', action='store_true', help='Measure evaluation throughput')
+    args = parser.parse_args()
+    
+    engine = RuleEngine(Path(args.vault) / 'Company_Handbook.md', Path(args.config))
+    rules = engine.get()
+    
+    print("\n" + "="*60)
+    print("HANDBOOK RULES")
+    print("="*60)
+    for key, value in rules.to_dict().items():
+        print(f"  {key:<24} {value}")
+    
+    if args.bench:
+        samples = [(('payment',), 750.0), (('invoice', 'payment'), 80.0), ((), None), (('payment',), 20.0)]
+        count = 200_000
+        start = time.perf_counter()
+        for i in range(count):
+            kinds, amount = samples[i & 3]
+            engine.get().evaluate(kinds, amount)
+        elapsed = time.perf_counter() - start
+        print(f"\n  Evaluated {count:,} tasks in {elapsed:.3f}s ({count / elapsed:,.0f} tasks/s)")
+    
+    print("\n" + "="*60 + "\n")
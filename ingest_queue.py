@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ingest Queue - GOLD TIER
+Personal AI Employee Hackathon 0
+
+Bounded in-process queue between the watchers and the reasoner.
+
+When the orchestrator runs watchers and the reasoner in one process, the
+watchers put rendered action files here instead of writing them to
+Needs_Action/ themselves, and the reasoner writes them out only as fast
+as it takes on tasks - so a burst never turns into tens of thousands of
+files in Needs_Action/.
+
+- high watermark: at this depth `paused` turns True and the watchers skip
+  polling; it turns False again once the reasoner has drained the queue
+  to the low watermark
+- durability: put() writes every item through to
+  Vault/.state/ingest_spill/ before it returns, so a watcher may commit
+  its seen ids right after; the file is deleted by ack() once the
+  reasoner has written it to Needs_Action/. Whatever is left there - a
+  crash, a kill or a normal shutdown - is queued again, oldest first, on
+  the next start
+- maxsize: items that still arrive at a full queue (a poll already in
+  flight) are kept only on disk and read back, oldest first, once the
+  queue is below the low watermark. While any item is disk-only new
+  items are too, so order is kept
+- lag: seconds from put() to get_batch() (avg, p95, max), plus depth,
+  oldest item age, spilled/refilled counts and time spent paused
+
+Separate processes have no shared memory; there the reasoner raises the
+backpressure flag (see task_pipeline.py) when its backlog passes its
+high watermark instead.
+
+Usage:
+    ingest = IngestQueue(vault_path, maxsize=500)
+    watcher = GmailWatcher(vault, ingest=ingest)      # producer
+    reasoner = QwenReasoner(vault_path, ingest=ingest)  # consumer
+    
+    for item in ingest.get_batch(20):
+        atomic_write_text(needs_action / item.name, item.content)
+        ingest.ack(item.name)
+
+Benchmark:
+    python ingest_queue.py
+"""
+
+import os
+import time
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, NamedTuple, Optional
+import sys
+
+from atomic_writer import atomic_write_text
+
+# Fix Windows console encoding
+if sys.platform == 'win32':
+    os.system('chcp 65001 > nul')
+
+
+SPILL_FOLDER = 'ingest_spill'
+
+
+class IngestItem(NamedTuple):
+    """One rendered action file waiting for the reasoner."""
+    name: str
+    content: str
+    source: str
+    enqueued_at: float  # time.time(), kept across a restart as the file mtime
+
+
+class IngestQueue:
+    """Bounded, disk-backed FIFO of action files with watermark-based pausing."""
+    
+    def __init__(
+        self,
+        vault_path: Path,
+        maxsize: int = 500,
+        high_watermark: Optional[int] = None,
+        low_watermark: Optional[int] = None,
+        fsync: bool = True
+    ):
+        """
+        Initialize queue.
+        
+        Args:
+            vault_path: Path to Obsidian vault (items go to .state/ingest_spill)
+            maxsize: Items kept in memory; more are read back from disk later
+            high_watermark: Depth that pauses the producers (default 80% of maxsize)
+            low_watermark: Depth that resumes them (default 50% of maxsize)
+            fsync: Flush each item to disk before put() returns
+        """
+        self.maxsize = max(1, maxsize)
+        self.high_watermark = high_watermark if high_watermark is not None else max(1, self.maxsize * 4 // 5)
+        self.low_watermark = low_watermark if low_watermark is not None else self.maxsize // 2
+        if not self.low_watermark < self.high_watermark <= self.maxsize:
+            raise ValueError("Need low_watermark < high_watermark <= maxsize")
+        self.spill_dir = Path(vault_path) / '.state' / SPILL_FOLDER
+        self.spill_dir.mkdir(parents=True, exist_ok=True)
+        self.fsync = fsync
+        
+        self._lock = threading.Lock()
+        self._items: Deque[IngestItem] = deque()
+        self._paused = False
+        self._paused_at = 0.0
+        
+        # Disk-only item names, oldest first - including everything not
+        # acked in the last run
+        self._spilled: Deque[str] = deque()
+        leftovers = [entry for entry in os.scandir(self.spill_dir) if entry.name.endswith('.md')]
+        leftovers.sort(key=lambda entry: entry.stat().st_mtime)
+        self._spilled.extend(entry.name for entry in leftovers)
+        
+        self.put_count = 0
+        self.get_count = 0
+        self.spill_count = 0
+        self.refill_count = 0
+        self.max_depth = 0
+        self.pause_count = 0
+        self.paused_time = 0.0
+        self.lags: Deque[float] = deque(maxlen=1000)
+        self.sources: Dict[str, int] = {}
+    
+    def __len__(self) -> int:
+        return len(self._items) + len(self._spilled)
+    
+    @property
+    def paused(self) -> bool:
+        """True from the high watermark until the queue is back to the low one."""
+        return self._paused
+    
+    def _update_pause(self):
+        """Apply the watermarks (caller holds the lock)."""
+        depth = len(self._items) + len(self._spilled)
+        if not self._paused and depth >= self.high_watermark:
+            self._paused = True
+            self._paused_at = time.monotonic()
+            self.pause_count += 1
+        elif self._paused and depth <= self.low_watermark:
+            self._paused = False
+            self.paused_time += time.monotonic() - self._paused_at
+    
+    def _write_through(self, item: IngestItem):
+        """Persist one item to the spill folder until it is acked."""
+        path = self.spill_dir / item.name
+        atomic_write_text(path, item.content, fsync=self.fsync)
+        # The mtime carries the enqueue time, so order and lag survive a restart
+        os.utime(path, (item.enqueued_at, item.enqueued_at))
+    
+    def _refill(self):
+        """Read disk-only items back while memory is below the low watermark (caller holds the lock)."""
+        while self._spilled and len(self._items) < self.low_watermark:
+            name = self._spilled.popleft()
+            path = self.spill_dir / name
+            try:
+                content = path.read_text(encoding='utf-8')
+                enqueued_at = path.stat().st_mtime
+            except FileNotFoundError:
+                continue
+            self._items.append(IngestItem(name, content, 'spill', enqueued_at))
+            self.refill_count += 1
+    
+    def put(self, name: str, content: str, source: str = '') -> bool:
+        """
+        Queue one action file. Never blocks on the consumer.
+        
+        The item is on disk when this returns, so the producer may mark it
+        as handled (seen ids, sync cursor) straight away.
+        
+        Args:
+            name: File name it will get in Needs_Action/
+            content: Rendered file content
+            source: Producer name (for metrics)
+        
+        Returns:
+            True if also held in memory, False if only on disk
+        """
+        item = IngestItem(name, content, source, time.time())
+        self._write_through(item)
+        with self._lock:
+            self.put_count += 1
+            self.sources[source] = self.sources.get(source, 0) + 1
+            if self._spilled or len(self._items) >= self.maxsize:
+                self._spilled.append(item.name)
+                self.spill_count += 1
+                kept = False
+            else:
+                self._items.append(item)
+                kept = True
+            self.max_depth = max(self.max_depth, len(self._items) + len(self._spilled))
+            self._update_pause()
+        return kept
+    
+    def get_batch(self, limit: int) -> List[IngestItem]:
+        """
+        Take up to `limit` items, oldest first.
+        
+        Each item stays on disk until ack(); one taken but never acked
+        (the process died first) is delivered again after a restart.
+        
+        Args:
+            limit: Maximum items to take
+        
+        Returns:
+            Items in arrival order (possibly empty)
+        """
+        batch: List[IngestItem] = []
+        if limit <= 0:
+            return batch
+        now = time.time()
+        with self._lock:
+            self._refill()
+            while self._items and len(batch) < limit:
+                item = self._items.popleft()
+                self.lags.append(now - item.enqueued_at)
+                batch.append(item)
+                if not self._items:
+                    self._refill()
+            self._refill()
+            self.get_count += len(batch)
+            self._update_pause()
+        return batch
+    
+    def ack(self, name: str):
+        """
+        Forget an item once the consumer has written it to Needs_Action/.
+        
+        Args:
+            name: IngestItem.name from get_batch()
+        """
+        try:
+            (self.spill_dir / name).unlink()
+        except FileNotFoundError:
+            pass
+    
+    def close(self) -> int:
+        """
+        Drop the in-memory copies (call on shutdown); their files stay in
+        the spill folder and are queued again on the next start.
+        
+        Returns:
+            Number of items left for the next start
+        """
+        with self._lock:
+            # Keep order: memory items are older than anything disk-only
+            self._spilled.extendleft(item.name for item in reversed(self._items))
+            self._items.clear()
+            self._update_pause()
+            return len(self._spilled)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Depth, lag (recent items) and spill/pause counters."""
+        with self._lock:
+            lags = sorted(self.lags)
+            oldest = self._items[0].enqueued_at if self._items else None
+            paused_time = self.paused_time + (time.monotonic() - self._paused_at if self._paused else 0.0)
+            return {
+                'depth': len(self._items) + len(self._spilled),
+                'in_memory': len(self._items),
+                'spilled': len(self._spilled),
+                'max_depth': self.max_depth,
+                'paused': self._paused,
+                'pauses': self.pause_count,
+                'paused_s': round(paused_time, 1),
+                'put': self.put_count,
+                'taken': self.get_count,
+                'spill_writes': self.spill_count,
+                'refills': self.refill_count,
+                'oldest_age_s': round(time.time() - oldest, 1) if oldest else 0.0,
+                'lag_avg_s': sum(lags) / len(lags) if lags else 0.0,
+                'lag_p95_s': lags[min(len(lags) - 1, int(len(lags) * 0.95))] if lags else 0.0,
+                'lag_max_s': lags[-1] if lags else 0.0,
+                'sources': dict(self.sources)
+            }
+    
+    def format_stats(self) -> str:
+        s = self.get_stats()
+        return (
+            f"depth {s['depth']} ({s['spilled']} spilled, max {s['max_depth']}/{self.maxsize}), "
+            f"{s['put']} in / {s['taken']} out, lag avg {s['lag_avg_s']:.1f}s p95 {s['lag_p95_s']:.1f}s "
+            f"max {s['lag_max_s']:.1f}s, paused {s['pauses']}x ({s['paused_s']:.0f}s)"
+            + (" [PAUSED]" if s['paused'] else '')
+        )
+
+
+if __name__ == '__main__':
+    import tempfile
+    
+    print("\n" + "="*60)
+    print("INGEST QUEUE BURST BENCHMARK")
+    print("="*60)
+    
+    # A watcher finding 200 items per poll against a reasoner taking 20 per tick
+    BURST, PER_POLL, PER_TICK = 20000, 200, 20
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        # Queue behaviour only - the fsync per put() is the disk's cost, not the queue's
+        ingest = IngestQueue(Path(tmp), maxsize=500, fsync=False)
+        produced, taken, skipped, peak, ticks = 0, [], 0, 0, 0
+        while len(taken) < BURST:
+            ticks += 1
+            if produced < BURST:
+                if ingest.paused:
+                    skipped += 1
+                else:
+                    # A poll already in flight finishes even if it crosses the watermarks
+                    for _ in range(min(PER_POLL, BURST - produced)):
+                        ingest.put(f'EMAIL_{produced:05d}.md', f'item {produced}\n', 'bench')
+                        produced += 1
+            peak = max(peak, len(ingest))
+            for item in ingest.get_batch(PER_TICK):
+                ingest.ack(item.name)
+                taken.append(item.name)
+        
+        unbounded_peak = max(
+            min(BURST, t * PER_POLL) - min(BURST, t * PER_TICK) for t in range(1, ticks + 1)
+        )
+        in_order = taken == [f'EMAIL_{n:05d}.md' for n in range(BURST)]
+        print(f"\n  {BURST} items, {PER_POLL}/poll in, {PER_TICK}/tick out")
+        print(f"  Without a queue: peak backlog {unbounded_peak} files in Needs_Action/")
+        print(f"  With the queue:  peak depth {peak} (maxsize {ingest.maxsize}), "
+              f"{ingest.spill_count} spilled, {skipped} polls skipped")
+        print(f"  {ingest.format_stats()}")
+        print(f"  [{'OK' if in_order else 'FAIL'}] all {len(taken)} items delivered in order")
+        
+        # A restart (clean or not) brings back everything not acked: 30 queued
+        # items plus 5 taken whose Needs_Action/ write never finished
+        for n in range(35):
+            ingest.put(f'LATE_{n:02d}.md', f'late {n}\n', 'bench')
+        ingest.get_batch(5)
+        del ingest  # no close() - as after a kill
+        restarted = IngestQueue(Path(tmp), maxsize=10)
+        names = []
+        while len(restarted):
+            for item in restarted.get_batch(100):
+                restarted.ack(item.name)
+                names.append(item.name)
+        restored = names == [f'LATE_{n:02d}.md' for n in range(35)]
+        print(f"  [{'OK' if restored else 'FAIL'}] restart without close() restored {len(names)} items in order")
+    
+    print("\n" + "="*60 + "\n")
+    sys.exit(0 if in_order and restored else 1)
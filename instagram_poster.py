@@ -9,6 +9,7 @@ import sys, codecs, logging, argparse, time
 from pathlib import Path
 from datetime import datetime
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
+from approval_dispatcher import ApprovalDispatcher
 
 if sys.platform == 'win32':
     sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
@@ -17,7 +18,7 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 logger = logging.getLogger(__name__)
 
 class InstagramPoster:
-    def __init__(self, vault_path: Path):
+    def __init__(self, vault_path: Path, dispatcher: ApprovalDispatcher = None):
         self.vault_path = vault_path
         self.approved = vault_path / 'Approved'
         self.done = vault_path / 'Done'
@@ -25,13 +26,10 @@ class InstagramPoster:
         self.session = vault_path.parent / 'instagram_session'
         for f in [self.approved, self.done, self.logs, self.session]:
             f.mkdir(parents=True, exist_ok=True)
+        self.dispatcher = dispatcher or ApprovalDispatcher(vault_path)
 
     def check_approved(self):
-        files = []
-        for f in self.approved.glob('*.md'):
-            if 'type: instagram' in f.read_text(encoding='utf-8').lower():
-                files.append(f)
-        return files
+        return self.dispatcher.claim('instagram')
 
     def parse_post(self, filepath: Path):
         content = filepath.read_text(encoding='utf-8')
@@ -168,8 +166,7 @@ class InstagramPoster:
             print("  No image specified"); return False
         ok = self.post(data, img, headless)
         if ok:
-            (self.done / filepath.name).write_bytes(filepath.read_bytes())
-            filepath.unlink()
+            self.dispatcher.complete(filepath)
             self.log_post(filepath.name, data['content'], str(img) if img else None)
             print(f"  Moved to Done"); return True
         print("  Failed"); return False
@@ -180,7 +177,9 @@ class InstagramPoster:
         files = self.check_approved()
         if files:
             print(f"Found {len(files)} post(s)")
-            for f in files: self.process(f, headless, image_arg)
+            for f in files:
+                self.process(f, headless, image_arg)
+                if f.exists(): self.dispatcher.release(f)
         else: print("No approved posts")
 
 if __name__ == '__main__':
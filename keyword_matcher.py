@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Keyword Matcher - GOLD TIER
+Personal AI Employee Hackathon 0
+
+Single-pass text classification shared by the reasoner and the watchers.
+
+All keyword sets (financial, urgency, watcher keywords, ...) are compiled
+into one regex. The keywords are merged into a trie first, so the pattern
+branches on one character at a time - the same shape as an Aho-Corasick
+automaton - instead of retrying every keyword at every position, and a
+lookahead on the possible first characters lets the regex engine skip
+everything else. Money amounts are matched by the same pattern, so one scan
+of the text returns every category hit and the amounts. The scan stops as
+soon as every category has a hit and enough amounts have been collected.
+
+Matching is case-insensitive and by substring, like the
+`word in content.lower()` checks it replaces. Hits do not overlap; a
+keyword found inside a longer keyword (e.g. 'pay' inside 'payment') is
+credited to both keywords' categories.
+
+Usage:
+    from keyword_matcher import KeywordMatcher
+    
+    matcher = KeywordMatcher({'financial': ['invoice', 'payment'], 'urgent': ['asap']})
+    result = matcher.classify(text)
+    result['categories']   # {'financial'}
+    result['amounts']      # ['1,250.00', ...]
+
+Benchmark:
+    python keyword_matcher.py --bench
+"""
+
+import re
+import time
+import argparse
+from typing import Any, Dict, Iterable, List, Optional, Set
+import sys
+import os
+
+# Fix Windows console encoding
+if sys.platform == 'win32':
+    os.system('chcp 65001 > nul')
+
+
+FINANCIAL_KEYWORDS = ('payment', 'invoice', 'pay', 'money', '$')
+URGENCY_KEYWORDS = ('urgent', 'asap', 'emergency', 'critical')
+
+# Same amount syntax the reasoner has always used ($ optional, group = number)
+AMOUNT_PATTERN = r'\$?(\d+(?:,\d{3})*(?:\.\d{2})?)'
+_AMOUNT_PATTERN = r'\$?(?P<amount>[0-9]+(?:,[0-9]{3})*(?:\.[0-9]{2})?)'
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Regex for a set of literal words, factored into a prefix trie."""
+    trie: Dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = True
+    
+    def build(node: Dict[str, Any]) -> str:
+        end = '' in node
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        if end:
+            # Optional tail is greedy, so the longest keyword wins
+            return '(?:' + '|'.join(branches) + ')?'
+        return branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    
+    return build(trie)
+
+
+class KeywordMatcher:
+    """Compiled multi-category keyword and amount matcher."""
+    
+    def __init__(self, categories: Dict[str, Iterable[str]], amounts: bool = True):
+        """
+        Compile keyword sets.
+        
+        Args:
+            categories: Category name -> keywords (matched case-insensitively)
+            amounts: Also extract money amounts
+        """
+        self.categories = {name: tuple(words) for name, words in categories.items()}
+        
+        # keyword -> categories it signals (including those of keywords it contains)
+        self._keyword_categories: Dict[str, Set[str]] = {}
+        for name, words in self.categories.items():
+            for word in words:
+                self._keyword_categories.setdefault(word.lower(), set()).add(name)
+        for word, names in self._keyword_categories.items():
+            for other, other_names in self._keyword_categories.items():
+                if other != word and other in word:
+                    names |= other_names
+        
+        # Patterns run on lowercased text - much faster than re.IGNORECASE
+        keyword_pattern = _trie_pattern(self._keyword_categories) or '(?!)'
+        first_chars = ''.join(sorted({re.escape(word[0]) for word in self._keyword_categories}))
+        self._keyword_pattern = re.compile(keyword_pattern)
+        self.amounts = amounts
+        if amounts:
+            # Keywords first: a '$' keyword still matches in front of an amount
+            first_chars += '$0-9'
+            self.pattern = re.compile(
+                f'(?=[{first_chars}])(?:(?P<keyword>{keyword_pattern})|{_AMOUNT_PATTERN})'
+            )
+        else:
+            self.pattern = self._keyword_pattern
+    
+    def classify(self, text: str, max_amounts: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Find category hits and amounts in one pass.
+        
+        Args:
+            text: Text to scan
+            max_amounts: Stop collecting amounts after this many (None = all)
+        
+        Returns:
+            Dict with 'categories' (set), 'keywords' (set of the keywords seen
+            before the scan could stop) and 'amounts' (number strings in
+            order of appearance)
+        """
+        text = text.lower()
+        keywords: Set[str] = set()
+        categories: Set[str] = set()
+        amounts: List[str] = []
+        total = len(self.categories)
+        keyword_categories = self._keyword_categories
+        pos = 0
+        
+        if self.amounts and (max_amounts is None or max_amounts > 0):
+            for match in self.pattern.finditer(text):
+                keyword = match.group('keyword')
+                if keyword is not None:
+                    if keyword not in keywords:
+                        keywords.add(keyword)
+                        categories |= keyword_categories[keyword]
+                    continue
+                amounts.append(match.group('amount'))
+                if max_amounts is not None and len(amounts) >= max_amounts:
+                    pos = match.end()
+                    break
+            else:
+                pos = len(text)
+        
+        # Amounts done - finish with the keyword-only pattern until every
+        # category has a hit
+        if len(categories) < total:
+            for match in self._keyword_pattern.finditer(text, pos):
+                keyword = match.group()
+                if keyword not in keywords:
+                    keywords.add(keyword)
+                    categories |= keyword_categories[keyword]
+                    if len(categories) == total:
+                        break
+        
+        return {'categories': categories, 'keywords': keywords, 'amounts': amounts}
+    
+    def search(self, text: str) -> Optional[str]:
+        """
+        First keyword in the text (lowercase), or None - stops at the first hit.
+        
+        Args:
+            text: Text to scan
+        """
+        match = self._keyword_pattern.search(text.lower())
+        return match.group() if match else None
+
+
+def _legacy_analyze(content: str):
+    """The reasoner's original scans (analyze_task + create_approval_request)."""
+    lowered = content.lower()
+    financial = any(word in lowered for word in FINANCIAL_KEYWORDS)
+    amount = None
+    if financial:
+        amount_match = re.search(AMOUNT_PATTERN, lowered)
+        if amount_match:
+            amount = amount_match.group(1)
+    urgent = any(word in lowered for word in URGENCY_KEYWORDS)
+    if financial:
+        re.search(AMOUNT_PATTERN, content)
+    return financial, urgent, amount
+
+
+def _sample_text(size: int, task: bool) -> str:
+    """
+    Email-like benchmark text.
+    
+    Args:
+        size: Length in characters
+        task: Vault task layout (frontmatter first, keywords in the subject);
+            otherwise keywords and amounts only appear at the very end
+    """
+    filler = ("Hello team, following up on the quarterly review notes and the "
+              "meeting agenda for next week. Please find the attached summary. ")
+    tail = " Invoice INV-2041 for $1,250.00 is due - please pay ASAP."
+    if task:
+        head = ("---\ntype: email\nfrom: billing@example.com\nsubject: Urgent: invoice due\n"
+                "received: 2026-01-07T10:00:00\n---\n\n")
+        tail = ""
+    else:
+        head = ""
+    body = filler * (size // len(filler) + 1)
+    return head + body[:size - len(head) - len(tail)] + tail
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Keyword Matcher benchmark')
+    parser.add_argument('--bench', action='store_true', help='Run the benchmark')
+    parser.add_argument('--repeat', type=int, default=20, help='Runs per size')
+    args = parser.parse_args()
+    
+    matcher = KeywordMatcher({'financial': FINANCIAL_KEYWORDS, 'urgent': URGENCY_KEYWORDS})
+    
+    print("\n" + "="*60)
+    print("KEYWORD MATCHER" + (" BENCHMARK" if args.bench else " SELF-TEST"))
+    print("="*60)
+    
+    sample = "URGENT: please PAY invoice #12 of $2,400.50 by Friday"
+    result = matcher.classify(sample)
+    print(f"\n  Pattern:    {matcher.pattern.pattern[:70]}...")
+    print(f"  Sample:     {sample}")
+    print(f"  Categories: {sorted(result['categories'])}")
+    print(f"  Keywords:   {sorted(result['keywords'])}")
+    print(f"  Amounts:    {result['amounts']}")
+    
+    if args.bench:
+        for task in (True, False):
+            print(f"\n  {'Task file (keywords up front)' if task else 'Keywords only at the end'}")
+            print(f"  {'Size':>8}  {'legacy':>10}  {'matcher':>10}  {'matcher (1 amount)':>18}")
+            for size in (10_000, 100_000, 1_000_000):
+                text = _sample_text(size, task)
+                timings = []
+                for fn in (
+                    lambda: _legacy_analyze(text),
+                    lambda: matcher.classify(text),
+                    lambda: matcher.classify(text, max_amounts=1)
+                ):
+                    start = time.perf_counter()
+                    for _ in range(args.repeat):
+                        fn()
+                    timings.append((time.perf_counter() - start) / args.repeat * 1000)
+                print(f"  {size // 1000:>6} KB  {timings[0]:>8.3f}ms  {timings[1]:>8.3f}ms  {timings[2]:>16.3f}ms")
+    
+    print("\n" + "="*60 + "\n")
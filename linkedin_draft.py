@@ -13,12 +13,15 @@ Usage: python linkedin_draft.py
 """
 
 import re
+import itertools
 import logging
 import sys
 import codecs
 from pathlib import Path
 from datetime import datetime
 
+from atomic_writer import atomic_write_text
+
 # Fix Windows console encoding for Unicode characters
 if sys.platform == 'win32':
     sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
@@ -71,9 +74,10 @@ class LinkedInDraftGenerator:
         # Extract projects
         project_section = re.search(r'## 🚀 Active Projects.*?(?=##|\Z)', content, re.DOTALL)
         if project_section:
-            # Look for completed projects in Done folder
-            done_files = list(self.done.glob('*.md'))
-            data['projects_completed'] = [f.name for f in done_files[:5]]
+            # Look for completed projects in Done folder (first 5 only -
+            # no need to list the whole history)
+            done_files = itertools.islice(self.done.glob('*.md'), 5)
+            data['projects_completed'] = [f.name for f in done_files]
         
         # Extract metrics
         metrics_match = re.search(r'\| Metric \|.*?\| Response Time \|.*?\| <(\d+)h \|', content, re.DOTALL)
@@ -198,7 +202,7 @@ platform: LinkedIn
 '''
         
         draft_path = self.plans / f'LINKEDIN_draft_{timestamp}.md'
-        draft_path.write_text(draft_content, encoding='utf-8')
+        atomic_write_text(draft_path, draft_content)
 
         self.logger.info(f"Created LinkedIn draft: {draft_path.name}")
         
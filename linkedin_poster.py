@@ -32,6 +32,7 @@ import argparse  # FIX 1: Proper argument parsing
 from pathlib import Path
 from datetime import datetime
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
+from approval_dispatcher import ApprovalDispatcher
 
 # Fix Windows console encoding for Unicode characters
 if sys.platform == 'win32':
@@ -48,7 +49,7 @@ logger = logging.getLogger(__name__)
 class LinkedInPoster:
     """Post content to LinkedIn via browser automation."""
 
-    def __init__(self, vault_path: Path, session_path: Path = None):
+    def __init__(self, vault_path: Path, session_path: Path = None, dispatcher: ApprovalDispatcher = None):
         self.vault_path = vault_path
         self.approved_folder = vault_path / 'Approved'
         self.done_folder = vault_path / 'Done'
@@ -60,6 +61,7 @@ class LinkedInPoster:
         self.done_folder.mkdir(parents=True, exist_ok=True)
         self.session_path.mkdir(parents=True, exist_ok=True)
 
+        self.dispatcher = dispatcher or ApprovalDispatcher(vault_path)
         logger.info("LinkedIn Poster initialized")
 
     def edit_post_content(self, content: str) -> str:
@@ -148,17 +150,8 @@ class LinkedInPoster:
         return None
 
     def check_approved_posts(self) -> list:
-        """Check for approved LinkedIn post files."""
-        approved_files = []
-
-        for f in self.approved_folder.glob('*.md'):
-            content = f.read_text(encoding='utf-8')
-
-            # Check if it's a LinkedIn draft/post
-            if 'type: linkedin_draft' in content or 'type:linkedin_draft' in content:
-                approved_files.append(f)
-
-        return approved_files
+        """Claim approved LinkedIn post files."""
+        return self.dispatcher.claim('linkedin_draft')
 
     def parse_post_file(self, filepath: Path) -> dict:
         """Parse LinkedIn post file and extract content."""
@@ -523,6 +516,9 @@ class LinkedInPoster:
                         edit_mode=edit_mode,
                         image_arg=image_arg
                     )
+                    # Not posted - hand it back for the next run
+                    if filepath.exists():
+                        self.dispatcher.release(filepath)
             else:
                 print("No approved LinkedIn posts found")
                 print()
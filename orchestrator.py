@@ -0,0 +1,617 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Orchestrator - GOLD TIER
+Personal AI Employee Hackathon 0
+
+Runs the watchers, the reasoner and the senders in ONE process.
+
+Every component is a supervised asyncio task. Its blocking work (Gmail
+API calls, file scans, Playwright) runs in a single-thread executor of its
+own, so a component always runs on the same thread - Playwright sync
+objects and SQLite connections do not move between threads - while the
+event loop only sleeps between polls.
+
+Each component is built by a factory (modules are imported on first use, so
+disabled components cost nothing), polled with a step function that
+returns the seconds to sleep, and closed on shutdown or before a restart.
+
+Supervision:
+- a step that raises closes the component and rebuilds it after an
+  exponential backoff (5s, 10s, 20s ... up to 5 min)
+- more than `max_restarts` crashes within `restart_window` seconds marks
+  the component failed; the others keep running
+- a missing dependency (ImportError) or a sys.exit() (e.g. no
+  token.json) fails the component at once
+
+Logging and metrics are shared: one logging setup (the thread name is the
+component name), and a metrics snapshot - status, restarts, polls, step
+time, last error, the watcher's scheduler stats and process memory -
+logged and written to Vault/.state/orchestrator_metrics.json every
+`metrics_interval` seconds.
+
+With --ingest-queue N the Gmail/WhatsApp watchers hand their action files
+to the reasoner through a bounded IngestQueue (see ingest_queue.py)
+instead of writing Needs_Action/ directly: polling pauses at its high
+watermark, every item stays on disk until the reasoner has written it,
+and its depth and lag are part of the metrics.
+
+Approved/ is routed by one shared ApprovalDispatcher: every
+`dispatch_interval` seconds the orchestrator scans Approved/ once, claims
+files for the routes its consumers (reasoner, email_reply, posters) have
+asked for, and each consumer only drains its own queue. The same pass
+returns claims abandoned longer than the claim timeout to Approved/.
+
+Usage:
+    python orchestrator.py                            # default components
+    python orchestrator.py --enable whatsapp,twitter  # add components
+    python orchestrator.py --disable gmail            # drop components
+    python orchestrator.py --list                     # show components
+    python orchestrator.py --ingest-queue 500         # bounded watcher -> reasoner queue
+    python orchestrator.py --self-test                # supervision demo
+"""
+
+import asyncio
+import json
+import time
+import signal
+import logging
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+import sys
+import os
+
+from approval_dispatcher import ApprovalDispatcher
+from atomic_writer import atomic_write_text
+from ingest_queue import IngestQueue
+from vault_index import VaultIndex
+
+# Fix Windows console encoding
+if sys.platform == 'win32':
+    os.system('chcp 65001 > nul')
+
+try:
+    import resource
+except ImportError:
+    resource = None  # Windows
+
+
+LOG_FORMAT = '%(asctime)s - %(threadName)s - %(name)s - %(levelname)s - %(message)s'
+METRICS_FILE = 'orchestrator_metrics.json'
+
+
+def setup_logging(level: int = logging.INFO, log_file: Optional[Path] = None):
+    """
+    One logging configuration for every component.
+    
+    Component modules call logging.basicConfig() at import time; configuring
+    the root logger first turns those calls into no-ops.
+    
+    Args:
+        level: Root log level
+        log_file: Also append log lines to this file
+    """
+    handlers: List[logging.Handler] = [logging.StreamHandler()]
+    if log_file is not None:
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        handlers.append(logging.FileHandler(log_file, encoding='utf-8'))
+    logging.basicConfig(level=level, format=LOG_FORMAT, handlers=handlers, force=True)
+
+
+def process_memory_mb() -> Optional[float]:
+    """Peak resident memory of this process in MB (None where unsupported)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+class Component:
+    """A supervised unit: how to build it, poll it and close it."""
+    
+    def __init__(
+        self,
+        name: str,
+        factory: Callable[[], Any],
+        step: Callable[[Any], Optional[float]],
+        close: Optional[Callable[[Any], None]] = None,
+        interval: float = 60.0,
+        enabled: bool = True,
+        description: str = ''
+    ):
+        """
+        Initialize component.
+        
+        Args:
+            name: Component name (flags, thread name, metrics key)
+            factory: Builds the component instance (runs on its thread)
+            step: instance -> seconds to sleep (None = `interval`)
+            close: Releases the instance (on shutdown and before restarts)
+            interval: Sleep between steps when step returns None
+            enabled: Started unless disabled on the command line
+            description: One line for --list
+        """
+        self.name = name
+        self.factory = factory
+        self.step = step
+        self.close = close
+        self.interval = interval
+        self.enabled = enabled
+        self.description = description
+
+
+class ComponentState:
+    """Supervision state and metrics of one running component."""
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.status = 'pending'
+        self.instance: Any = None
+        self.started_at: Optional[float] = None
+        self.restarts = 0
+        self.crashes: List[float] = []
+        self.polls = 0
+        self.step_time = 0.0
+        self.last_poll: Optional[str] = None
+        self.last_error: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            'status': self.status,
+            'uptime_s': round(time.monotonic() - self.started_at) if self.started_at and self.status == 'running' else 0,
+            'restarts': self.restarts,
+            'polls': self.polls,
+            'avg_step_ms': round(self.step_time / self.polls * 1000, 1) if self.polls else 0.0,
+            'last_poll': self.last_poll,
+            'last_error': self.last_error
+        }
+        scheduler = getattr(self.instance, 'scheduler', None)
+        if scheduler is not None:
+            data['scheduler'] = scheduler.get_stats()
+        return data
+
+
+class Orchestrator:
+    """Runs components as supervised tasks on one event loop."""
+    
+    def __init__(
+        self,
+        components: List[Component],
+        state_dir: Optional[Path] = None,
+        max_restarts: int = 5,
+        restart_window: float = 600.0,
+        backoff_base: float = 5.0,
+        backoff_max: float = 300.0,
+        metrics_interval: float = 60.0,
+        ingest: Optional[IngestQueue] = None,
+        dispatcher: Optional[ApprovalDispatcher] = None,
+        dispatch_interval: float = 5.0
+    ):
+        """
+        Initialize orchestrator.
+        
+        Args:
+            components: Components to run (enabled ones only)
+            state_dir: Where the metrics snapshot is written (None = not written)
+            max_restarts: Crashes allowed within `restart_window` before giving up
+            restart_window: Seconds over which crashes are counted
+            backoff_base: First restart delay; doubles with each recent crash
+            backoff_max: Longest restart delay
+            metrics_interval: Seconds between metrics snapshots
+            ingest: Watcher -> reasoner queue (reported in metrics, kept on disk until written)
+            dispatcher: Central approval dispatcher fed on a timer
+            dispatch_interval: Seconds between scans of Approved/
+        """
+        self.components = [c for c in components if c.enabled]
+        self.state_dir = state_dir
+        self.max_restarts = max_restarts
+        self.restart_window = restart_window
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.metrics_interval = metrics_interval
+        self.ingest = ingest
+        self.dispatcher = dispatcher
+        self.dispatch_interval = dispatch_interval
+        self.logger = logging.getLogger(self.__class__.__name__)
+        
+        self.states: Dict[str, ComponentState] = {c.name: ComponentState(c.name) for c in self.components}
+        self.started_at = time.monotonic()
+        self._stopping: Optional[asyncio.Event] = None
+    
+    def stop(self):
+        """Ask every component to finish its current step and shut down."""
+        if self._stopping is not None:
+            self._stopping.set()
+    
+    async def _sleep(self, seconds: float) -> bool:
+        """Sleep unless stopping; returns True if a stop was requested."""
+        try:
+            await asyncio.wait_for(self._stopping.wait(), timeout=max(0.0, seconds))
+            return True
+        except asyncio.TimeoutError:
+            return False
+    
+    def _restart_delay(self, state: ComponentState) -> Optional[float]:
+        """Record a crash; returns the backoff before the restart, or None to give up."""
+        now = time.monotonic()
+        state.crashes = [t for t in state.crashes if now - t < self.restart_window] + [now]
+        if len(state.crashes) > self.max_restarts:
+            return None
+        return min(self.backoff_max, self.backoff_base * 2 ** (len(state.crashes) - 1))
+    
+    async def _supervise(self, component: Component):
+        """Build, poll, and on failure close and rebuild one component."""
+        loop = asyncio.get_running_loop()
+        state = self.states[component.name]
+        # One thread per component: its objects never change threads
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=component.name)
+        
+        try:
+            while not self._stopping.is_set():
+                try:
+                    state.status = 'starting'
+                    state.instance = await loop.run_in_executor(executor, component.factory)
+                    state.status = 'running'
+                    state.started_at = time.monotonic()
+                    self.logger.info(f"{component.name} started")
+                    
+                    while not self._stopping.is_set():
+                        started = time.perf_counter()
+                        delay = await loop.run_in_executor(executor, component.step, state.instance)
+                        state.polls += 1
+                        state.step_time += time.perf_counter() - started
+                        state.last_poll = datetime.now().isoformat(timespec='seconds')
+                        if await self._sleep(component.interval if delay is None else delay):
+                            break
+                
+                except ImportError as e:
+                    state.status = 'failed'
+                    state.last_error = f"missing dependency: {e}"
+                    self.logger.error(f"{component.name} cannot start - {state.last_error}")
+                    return
+                except SystemExit as e:
+                    # Standalone scripts sys.exit() on bad setup (e.g. no
+                    # token.json) - that must not end the whole event loop
+                    state.status = 'failed'
+                    state.last_error = f"exited (code {e.code})"
+                    self.logger.error(f"{component.name} {state.last_error} - not restarting")
+                    return
+                except Exception as e:
+                    state.last_error = f"{type(e).__name__}: {e}"
+                    self.logger.error(f"{component.name} crashed: {state.last_error}")
+                finally:
+                    if state.instance is not None and component.close is not None:
+                        try:
+                            await loop.run_in_executor(executor, component.close, state.instance)
+                        except Exception as e:
+                            self.logger.error(f"{component.name} close failed: {e}")
+                    state.instance = None
+                
+                if self._stopping.is_set():
+                    break
+                delay = self._restart_delay(state)
+                if delay is None:
+                    state.status = 'failed'
+                    self.logger.error(
+                        f"{component.name} crashed {len(state.crashes)} times in "
+                        f"{self.restart_window:.0f}s - giving up"
+                    )
+                    return
+                state.status = 'restarting'
+                state.restarts += 1
+                self.logger.info(f"Restarting {component.name} in {delay:g}s")
+                await self._sleep(delay)
+        finally:
+            executor.shutdown(wait=False)
+            if state.status != 'failed':
+                state.status = 'stopped'
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Snapshot of every component plus process-wide figures."""
+        metrics = {
+            'updated': datetime.now().isoformat(timespec='seconds'),
+            'uptime_s': round(time.monotonic() - self.started_at),
+            'memory_peak_mb': process_memory_mb(),
+            'components': {name: state.to_dict() for name, state in self.states.items()}
+        }
+        if self.ingest is not None:
+            metrics['ingest'] = self.ingest.get_stats()
+        return metrics
+    
+    def format_metrics(self) -> List[str]:
+        """One line per component."""
+        lines = []
+        for name, m in self.get_metrics()['components'].items():
+            line = (f"{name:<12} {m['status']:<10} {m['polls']:>6} polls  "
+                    f"step {m['avg_step_ms']:8.1f} ms  {m['restarts']} restart(s)")
+            if 'scheduler' in m:
+                line += f"  {m['scheduler']['items_per_poll']:.2f} items/poll"
+            if m['last_error'] and m['status'] != 'running':
+                line += f"  last error: {m['last_error']}"
+            lines.append(line)
+        return lines
+    
+    def write_metrics(self):
+        if self.state_dir is None:
+            return
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(self.state_dir / METRICS_FILE, json.dumps(self.get_metrics(), indent=2))
+    
+    def log_metrics(self):
+        memory = process_memory_mb()
+        self.logger.info("Components" + (f" (peak memory {memory:.0f} MB)" if memory else '') + ":")
+        for line in self.format_metrics():
+            self.logger.info(f"  {line}")
+        if self.ingest is not None:
+            self.logger.info(f"  {'ingest':<12} {self.ingest.format_stats()}")
+    
+    async def _report(self):
+        while not await self._sleep(self.metrics_interval):
+            try:
+                self.write_metrics()
+                self.log_metrics()
+            except Exception as e:
+                self.logger.error(f"Metrics snapshot failed: {e}")
+    
+    async def _dispatch(self):
+        """Feed the consumers' approval queues: one scan of Approved/ per interval."""
+        loop = asyncio.get_running_loop()
+        while not await self._sleep(self.dispatch_interval):
+            try:
+                await loop.run_in_executor(None, self.dispatcher.feed)
+            except Exception as e:
+                self.logger.error(f"Approval dispatch failed: {e}")
+    
+    async def run(self):
+        """Run until stop() (or SIGINT/SIGTERM), then shut every component down."""
+        self._stopping = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self.stop)
+            except (NotImplementedError, RuntimeError):
+                pass  # Windows: Ctrl+C arrives as KeyboardInterrupt
+        
+        self.logger.info(f"Starting {len(self.components)} component(s): "
+                         f"{', '.join(c.name for c in self.components)}")
+        supervisors = [asyncio.create_task(self._supervise(c), name=c.name) for c in self.components]
+        reporter = asyncio.create_task(self._report(), name='metrics')
+        feeder = asyncio.create_task(self._dispatch(), name='dispatch') if self.dispatcher else None
+        try:
+            await asyncio.gather(*supervisors)
+        finally:
+            self.stop()
+            await reporter
+            if feeder is not None:
+                await feeder
+            if self.ingest is not None:
+                left = self.ingest.close()
+                if left:
+                    self.logger.info(f"{left} queued item(s) kept on disk for the next start")
+            self.write_metrics()
+            self.log_metrics()
+
+
+def default_components(
+    vault_path: Path,
+    headless: bool = True,
+    ingest: Optional[IngestQueue] = None,
+    index: Optional[VaultIndex] = None,
+    dispatcher: Optional[ApprovalDispatcher] = None
+) -> List[Component]:
+    """
+    Every component the project ships, importing each module lazily.
+    
+    Args:
+        vault_path: Path to Obsidian vault
+        headless: Run the browser-based components without a window
+        ingest: Queue between the Gmail/WhatsApp watchers and the reasoner
+        index: Shared, started vault index (queries skip the folder re-scan)
+        dispatcher: Shared approval dispatcher feeding the approval consumers
+    
+    Returns:
+        Components (browser-based ones disabled by default)
+    """
+    vault = str(vault_path)
+    
+    def filesystem():
+        from filesystem_watcher import FileSystemWatcher
+        watcher = FileSystemWatcher(vault)
+        watcher.start()
+        return watcher
+    
+    def filesystem_step(watcher) -> float:
+        # Events are handled on the observer's own thread; just check it is alive
+        if not watcher.observer.is_alive():
+            raise RuntimeError("file system observer stopped")
+        return 10.0
+    
+    def gmail():
+        from gmail_watcher import GmailWatcher
+        return GmailWatcher(vault, ingest=ingest)
+    
+    def whatsapp():
+        from whatsapp_watcher import WhatsAppWatcher
+        return WhatsAppWatcher(vault, ingest=ingest)
+    
+    def reasoner():
+        from qwen_reasoner import QwenReasoner
+        return QwenReasoner(vault_path, ingest=ingest, index=index, dispatcher=dispatcher)
+    
+    def email_reply():
+        from email_reply import EmailReplySender
+        return EmailReplySender(vault_path, dispatcher=dispatcher)
+    
+    def poster(module: str, cls: str):
+        def factory():
+            return getattr(__import__(module), cls)(vault_path, dispatcher=dispatcher)
+        return factory
+    
+    def post_step(instance) -> None:
+        instance.run(headless=headless)
+    
+    poll = lambda instance: instance.poll_once()
+    close = lambda instance: instance.close()
+    
+    return [
+        Component('filesystem', filesystem, filesystem_step, lambda w: w.stop(),
+                  description='Inbox/ drop folder -> Needs_Action/'),
+        Component('gmail', gmail, poll, close,
+                  description='Gmail -> Needs_Action/ (adaptive polling)'),
+        Component('whatsapp', whatsapp, poll, close, enabled=False,
+                  description='WhatsApp Web -> Needs_Action/ (browser)'),
+        Component('reasoner', reasoner, poll, close,
+                  description='Needs_Action/ -> Plans/, approvals'),
+        Component('email_reply', email_reply, lambda sender: sender.run(), interval=60.0,
+                  description='Approved email replies -> Gmail'),
+        Component('linkedin', poster('linkedin_poster', 'LinkedInPoster'), post_step,
+                  interval=300.0, enabled=False, description='Approved LinkedIn posts (browser)'),
+        Component('twitter', poster('twitter_poster', 'TwitterPoster'), post_step,
+                  interval=300.0, enabled=False, description='Approved tweets (browser)'),
+        Component('facebook', poster('facebook_poster', 'FacebookPoster'), post_step,
+                  interval=300.0, enabled=False, description='Approved Facebook posts (browser)'),
+        Component('instagram', poster('instagram_poster', 'InstagramPoster'), post_step,
+                  interval=300.0, enabled=False, description='Approved Instagram posts (browser)'),
+    ]
+
+
+def select_components(components: List[Component], enable: str = '', disable: str = '') -> List[Component]:
+    """
+    Apply comma-separated --enable/--disable lists to the defaults.
+    
+    Raises:
+        ValueError: For an unknown component name
+    """
+    known = {c.name: c for c in components}
+    for names, enabled in ((enable, True), (disable, False)):
+        for name in filter(None, (n.strip() for n in names.split(','))):
+            if name not in known:
+                raise ValueError(f"Unknown component: {name} (known: {', '.join(known)})")
+            known[name].enabled = enabled
+    return components
+
+
+def _self_test() -> bool:
+    """Supervise a flaky and a steady component for a few seconds."""
+    attempts = {'flaky': 0}
+    
+    class Steady:
+        def __init__(self):
+            self.closed = False
+    
+    def flaky():
+        attempts['flaky'] += 1
+        return attempts['flaky']
+    
+    def flaky_step(attempt) -> float:
+        if attempt < 3:
+            raise RuntimeError(f"simulated crash #{attempt}")
+        return 0.05
+    
+    def missing():
+        import not_installed_module  # noqa: F401
+    
+    def exits():
+        sys.exit(1)
+    
+    steady = []
+    components = [
+        Component('steady', lambda: steady.append(Steady()) or steady[-1], lambda s: 0.05,
+                  lambda s: setattr(s, 'closed', True)),
+        Component('flaky', flaky, flaky_step),
+        Component('missing', missing, lambda m: 1.0),
+        Component('exits', exits, lambda m: 1.0),
+        Component('off', lambda: None, lambda m: 1.0, enabled=False),
+    ]
+    orchestrator = Orchestrator(components, backoff_base=0.1, metrics_interval=0.5)
+    
+    async def run_briefly():
+        async def stop_later():
+            await asyncio.sleep(1.5)
+            orchestrator.stop()
+        asyncio.ensure_future(stop_later())
+        await orchestrator.run()
+    
+    asyncio.run(run_briefly())
+    m = orchestrator.get_metrics()['components']
+    checks = {
+        'disabled component not started': 'off' not in m,
+        'flaky restarted twice, then ran': m['flaky']['restarts'] == 2 and m['flaky']['polls'] > 0,
+        'missing dependency fails at once': m['missing']['status'] == 'failed' and m['missing']['restarts'] == 0,
+        'sys.exit() fails only that component': m['exits']['status'] == 'failed' and m['steady']['polls'] > 0,
+        'steady closed on shutdown': len(steady) == 1 and steady[0].closed and m['steady']['status'] == 'stopped',
+    }
+    print()
+    for label, ok in checks.items():
+        print(f"  [{'OK' if ok else 'FAIL'}] {label}")
+    return all(checks.values())
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run watchers, reasoner and senders in one process')
+    parser.add_argument('--enable', default='', help='Comma-separated components to add (e.g. whatsapp,twitter)')
+    parser.add_argument('--disable', default='', help='Comma-separated components to leave out')
+    parser.add_argument('--list', action='store_true', help='Show components and exit')
+    parser.add_argument('--headed', action='store_true', help='Show browser windows for browser components')
+    parser.add_argument('--max-restarts', type=int, default=5, help='Crashes within 10 min before a component is given up')
+    parser.add_argument('--metrics-interval', type=float, default=60.0, help='Seconds between metrics snapshots')
+    parser.add_argument('--log-file', type=str, default=None, help='Also write logs to this file')
+    parser.add_argument('--ingest-queue', type=int, default=0, metavar='N',
+                        help='Pass watcher output to the reasoner through a bounded queue of N items (default: off)')
+    parser.add_argument('--self-test', action='store_true', help='Run the supervision self-test')
+    args = parser.parse_args()
+    
+    setup_logging(log_file=Path(args.log_file) if args.log_file else None)
+    
+    if args.self_test:
+        print("\n" + "="*60)
+        print("ORCHESTRATOR SELF-TEST")
+        print("="*60)
+        passed = _self_test()
+        print("\n" + "="*60 + "\n")
+        sys.exit(0 if passed else 1)
+    
+    vault_path = Path(__file__).parent / 'Vault'
+    if not vault_path.exists():
+        print(f"ERROR: Vault folder not found: {vault_path}")
+        sys.exit(1)
+    
+    ingest = IngestQueue(vault_path, maxsize=args.ingest_queue) if args.ingest_queue > 0 else None
+    index = VaultIndex(vault_path)
+    dispatcher = ApprovalDispatcher(vault_path, index=index, central=True)
+    try:
+        components = select_components(
+            default_components(vault_path, headless=not args.headed, ingest=ingest,
+                               index=index, dispatcher=dispatcher),
+            args.enable, args.disable
+        )
+    except ValueError as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+    
+    if args.list:
+        for c in components:
+            print(f"  [{'on ' if c.enabled else 'off'}] {c.name:<12} {c.description}")
+        sys.exit(0)
+    
+    # One watched index for every component in this process
+    index.start()
+    
+    orchestrator = Orchestrator(
+        components,
+        state_dir=vault_path / '.state',
+        max_restarts=args.max_restarts,
+        metrics_interval=args.metrics_interval,
+        ingest=ingest,
+        dispatcher=dispatcher
+    )
+    try:
+        asyncio.run(orchestrator.run())
+    except KeyboardInterrupt:
+        print("\nOrchestrator stopped.")
+    finally:
+        index.close()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Poll Scheduler - GOLD TIER
+Personal AI Employee Hackathon 0
+
+Decides how long a watcher sleeps between polls.
+
+FixedScheduler keeps the old behaviour (always `check_interval`).
+AdaptiveScheduler follows the traffic:
+- items found: the interval shrinks by `speedup` per poll, down to
+  `min_interval`, so a flood is drained quickly
+- nothing found: the interval returns to the base, then doubles
+  (`backoff`) per idle poll up to `max_interval`
+- quiet hours (e.g. 23-7): never poll more often than `quiet_interval`
+- jitter: each delay is spread by +/- `jitter` so watchers started
+  together do not hit their APIs in lockstep
+
+Both record items per poll, poll latency (check + action files) and the
+intervals used, so API quota use can be weighed against freshness.
+
+Usage:
+    scheduler = AdaptiveScheduler(120, quiet_hours=(23, 7))
+    while True:
+        started = time.perf_counter()
+        items = poll()
+        time.sleep(scheduler.record(len(items), time.perf_counter() - started))
+
+Self-test:
+    python poll_scheduler.py
+"""
+
+import random
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+import sys
+import os
+
+# Fix Windows console encoding
+if sys.platform == 'win32':
+    os.system('chcp 65001 > nul')
+
+
+def parse_quiet_hours(value: Optional[str]) -> Optional[Tuple[int, int]]:
+    """'23-7' -> (23, 7); None or '' -> None."""
+    if not value:
+        return None
+    start, _, end = value.partition('-')
+    hours = (int(start), int(end))
+    if not all(0 <= hour < 24 for hour in hours):
+        raise ValueError(f"Quiet hours must be 0-23: {value}")
+    return hours
+
+
+class FixedScheduler:
+    """Constant interval between polls."""
+    
+    def __init__(self, interval: float):
+        """
+        Initialize scheduler.
+        
+        Args:
+            interval: Seconds between polls
+        """
+        self.interval = interval
+        self.polls = 0
+        self.items = 0
+        self.latencies: deque = deque(maxlen=500)
+        self.delays: deque = deque(maxlen=500)
+    
+    def next_delay(self, items: int, now: datetime) -> float:
+        return self.interval
+    
+    def record(self, items: int, latency: float, now: Optional[datetime] = None) -> float:
+        """
+        Record one poll and pick the sleep before the next.
+        
+        Args:
+            items: New items the poll found
+            latency: Seconds the poll took (check + action files)
+            now: Wall-clock time (for quiet hours; default now)
+        
+        Returns:
+            Seconds to sleep
+        """
+        self.polls += 1
+        self.items += items
+        self.latencies.append(latency)
+        delay = self.next_delay(items, now or datetime.now())
+        self.delays.append(delay)
+        return delay
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Items per poll, poll latency and interval (recent polls)."""
+        latencies = sorted(self.latencies)
+        delays = list(self.delays)
+        return {
+            'polls': self.polls,
+            'items': self.items,
+            'items_per_poll': self.items / self.polls if self.polls else 0.0,
+            'latency_avg_ms': sum(latencies) / len(latencies) * 1000 if latencies else 0.0,
+            'latency_p95_ms': latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000 if latencies else 0.0,
+            'interval_avg_s': sum(delays) / len(delays) if delays else self.interval,
+            'interval_s': delays[-1] if delays else self.interval
+        }
+    
+    def format_stats(self) -> str:
+        stats = self.get_stats()
+        return (
+            f"{stats['polls']} polls, {stats['items']} items ({stats['items_per_poll']:.2f}/poll), "
+            f"latency avg {stats['latency_avg_ms']:.0f} ms / p95 {stats['latency_p95_ms']:.0f} ms, "
+            f"interval avg {stats['interval_avg_s']:.0f}s (now {stats['interval_s']:.0f}s)"
+        )
+
+
+class AdaptiveScheduler(FixedScheduler):
+    """Polls faster while items arrive, backs off when idle, slows down in quiet hours."""
+    
+    def __init__(
+        self,
+        interval: float,
+        min_interval: Optional[float] = None,
+        max_interval: Optional[float] = None,
+        speedup: float = 0.5,
+        backoff: float = 2.0,
+        jitter: float = 0.1,
+        quiet_hours: Optional[Tuple[int, int]] = None,
+        quiet_interval: Optional[float] = None
+    ):
+        """
+        Initialize scheduler.
+        
+        Args:
+            interval: Base seconds between polls (the old check_interval)
+            min_interval: Fastest polling while busy (default interval / 8, at least 5 s)
+            max_interval: Slowest polling when idle (default interval * 8)
+            speedup: Interval factor after a poll that found items
+            backoff: Interval factor after each idle poll beyond the base
+            jitter: Random spread of each delay (0.1 = +/-10%)
+            quiet_hours: (start, end) local hours, may wrap midnight
+            quiet_interval: Minimum delay in quiet hours (default max_interval)
+        """
+        super().__init__(interval)
+        self.base_interval = interval
+        self.min_interval = min_interval if min_interval is not None else max(5.0, interval / 8)
+        self.max_interval = max_interval if max_interval is not None else interval * 8
+        self.speedup = speedup
+        self.backoff = backoff
+        self.jitter = jitter
+        self.quiet_hours = quiet_hours
+        self.quiet_interval = quiet_interval if quiet_interval is not None else self.max_interval
+        self.quiet_polls = 0
+    
+    def in_quiet_hours(self, now: datetime) -> bool:
+        if self.quiet_hours is None:
+            return False
+        start, end = self.quiet_hours
+        if start <= end:
+            return start <= now.hour < end
+        return now.hour >= start or now.hour < end
+    
+    def next_delay(self, items: int, now: datetime) -> float:
+        if items:
+            # Busy: resume from the base at most, then keep shortening
+            self.interval = max(self.min_interval, min(self.interval, self.base_interval) * self.speedup)
+        elif self.interval < self.base_interval:
+            self.interval = self.base_interval
+        else:
+            self.interval = min(self.max_interval, self.interval * self.backoff)
+        
+        delay = self.interval
+        if self.in_quiet_hours(now):
+            self.quiet_polls += 1
+            delay = max(delay, self.quiet_interval)
+        if self.jitter:
+            delay *= 1 + random.uniform(-self.jitter, self.jitter)
+        return delay
+
+
+if __name__ == '__main__':
+    print("\n" + "="*60)
+    print("POLL SCHEDULER SELF-TEST")
+    print("="*60)
+    
+    day = datetime(2026, 1, 7, 14, 0)
+    night = datetime(2026, 1, 7, 3, 0)
+    scheduler = AdaptiveScheduler(120, jitter=0, quiet_hours=parse_quiet_hours('23-7'))
+    
+    # A burst of mail, then silence
+    pattern: List[int] = [0, 0, 5, 12, 9, 3, 0, 0, 0, 0, 0, 0]
+    delays = [scheduler.record(items, 0.2, day) for items in pattern]
+    print("\n  Daytime (items found -> next delay):")
+    print("  " + "  ".join(f"{items}->{delay:.0f}s" for items, delay in zip(pattern, delays)))
+    
+    quiet = scheduler.record(4, 0.2, night)
+    print(f"\n  Quiet hours, 4 items found -> next delay {quiet:.0f}s")
+    
+    jittered = AdaptiveScheduler(120)
+    spread = [jittered.record(0, 0.1, day) for _ in range(3)]
+    print(f"  With jitter: {', '.join(f'{d:.1f}s' for d in spread)}")
+    
+    print(f"\n  Stats: {scheduler.format_stats()}")
+    
+    ok = (delays[:2] == [240, 480] and delays[2] == 60 and delays[3] == 30 and delays[4] == 15
+          and delays[6] == 120 and delays[-1] == scheduler.max_interval and quiet == scheduler.quiet_interval)
+    print(f"\n  [{'OK' if ok else 'FAIL'}] speed-up, reset, backoff and quiet hours")
+    
+    print("\n" + "="*60 + "\n")
+    sys.exit(0 if ok else 1)
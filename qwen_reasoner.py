@@ -10,156 +10,226 @@ This script:
 5. Creates reply drafts for emails/WhatsApp
 6. Moves processed files to appropriate folders
 
-Usage: python qwen_reasoner.py
+By default the reasoner is event-driven: watchdog events for Needs_Action/
+and Approved/ are handled as soon as the file settles, with a low-frequency
+reconcile scan as a safety net. Pickup latency (file mtime -> processing
+start) is reported per task and on shutdown.
+
+Dashboard queue depths are kept in memory - seeded by one scan at startup and
+adjusted on every file event - and the "AI Processing Status" section is
+rewritten by a background thread at most once per --dashboard-interval.
+
+With --workers N, tasks are planned on a thread (or process) pool. Each task
+is claimed once, so no two workers plan the same file, and throughput in
+tasks/second is logged whenever a backlog drains.
+
+Pending tasks are handed out in priority order rather than arrival order:
+frontmatter `priority:` and urgency keywords put a task in the high, medium
+or low queue, and every --age-step seconds of waiting promotes it one level
+so low-priority work cannot starve. Queue wait per priority is logged on
+shutdown.
+
+With --worker-id several reasoners can share one vault: each task is
+claimed by renaming it into In_Progress/<worker-id>/ under a heartbeat
+lease (see task_lease.py), moved on to Planned/ once planned, and tasks
+held by a worker whose lease expired are returned to Needs_Action/ by the
+others.
+
+With --pipeline each task flows through parse -> classify -> plan render ->
+draft render -> write stages connected by bounded queues (see
+task_pipeline.py), each with its own --stage-workers count. A full stage
+stalls the ones before it; when the whole pipeline is full and tasks are
+still waiting, the watchers are told to stop polling until it drains.
+Per-stage throughput and queue depth are logged when a backlog drains and
+on shutdown.
+
+Usage:
+    python qwen_reasoner.py                          # event-driven
+    python qwen_reasoner.py --poll                   # legacy 10 s polling
+    python qwen_reasoner.py --reconcile-interval 120
+    python qwen_reasoner.py --dashboard-interval 10
+    python qwen_reasoner.py --workers 8              # parallel task planning
+    python qwen_reasoner.py --workers 4 --processes
+    python qwen_reasoner.py --age-step 600           # slower priority aging
+    python qwen_reasoner.py --worker-id node-a       # share the vault with other nodes
+    python qwen_reasoner.py --pipeline --stage-workers plan=2,write=2
 """
 
+import os
 import time
 import logging
-import re
+import queue
+import threading
+import argparse
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
+
+from approval_dispatcher import ApprovalDispatcher
+from vault_index import VaultIndex
+from seen_store import SeenStore
+from atomic_writer import atomic_write_text
+from frontmatter_reader import parse_frontmatter
+from keyword_matcher import KeywordMatcher, FINANCIAL_KEYWORDS, URGENCY_KEYWORDS
+from handbook_rules import RuleEngine
+from approval_engine import ApprovalEngine
+from task_lease import TaskLease
+from task_model import Task, Analysis, Approval
+from task_pipeline import TaskPipeline, Stage, signal_backpressure, BACKPRESSURE_MAX_AGE
+from ingest_queue import IngestQueue
+from task_queue import PriorityTaskQueue, PRIORITY_HIGH, PRIORITY_MEDIUM, PRIORITY_VALUES, PRIORITY_NAMES
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:  # Event mode needs watchdog - polling still works
+    Observer = None
+    FileSystemEventHandler = object
+
+
+DASHBOARD_SECTION = '## 🔄 AI Processing Status'
+_BATCH_TOKEN = '<batch>'  # In-flight placeholder - never a vault file name
+PRIORITY_PEEK_BYTES = 8192  # Enough for frontmatter plus the start of the body
+PIPELINE_STAGES = ('parse', 'classify', 'plan', 'draft', 'write')
+
+# Every keyword category and the first amount in one scan of the task
+TASK_MATCHER = KeywordMatcher({
+    'financial': FINANCIAL_KEYWORDS,
+    'invoice': ('invoice',),
+    'urgent': URGENCY_KEYWORDS
+})
+URGENCY_MATCHER = KeywordMatcher({'urgent': URGENCY_KEYWORDS}, amounts=False)
+
+
+class ReasonerEventHandler(FileSystemEventHandler):
+    """Forwards vault file events to the reasoner loop as (kind, path, present)."""
+
+    def __init__(self, reasoner: 'QwenReasoner', events: queue.Queue):
+        super().__init__()
+        self.folders = {
+            reasoner.needs_action: 'task',
+            reasoner.approved: 'approval',
+            reasoner.plans: 'plan',
+            reasoner.pending_approval: 'pending_approval'
+        }
+        self.events = events
 
-class QwenReasoner:
-    """AI Reasoning engine for task processing."""
+    def _forward(self, path: str, present: bool = True):
+        path = Path(path)
+        if path.suffix != '.md' or path.name.startswith('.'):
+            return
+        kind = self.folders.get(path.parent)
+        if kind:
+            self.events.put((kind, path, present))
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self._forward(event.src_path)
+
+    def on_modified(self, event):
+        # Still being written - pushes back the settle deadline
+        if not event.is_directory:
+            self._forward(event.src_path)
+
+    def on_moved(self, event):
+        if not event.is_directory:
+            self._forward(event.src_path, present=False)
+            self._forward(event.dest_path)
+
+    def on_deleted(self, event):
+        if not event.is_directory:
+            self._forward(event.src_path, present=False)
+
+
+class TaskPlanner:
+    """
+    Reads, classifies and plans tasks - the part of the reasoner that only
+    needs the rules and writes new files.
+    
+    Process-pool workers use this on its own: it opens no seen-store
+    journal, vault index, dispatcher or audit log, so workers share no
+    state with the main process.
+    """
 
     def __init__(self, vault_path: Path):
         self.vault_path = vault_path
         self.needs_action = vault_path / 'Needs_Action'
         self.plans = vault_path / 'Plans'
-        self.done = vault_path / 'Done'
         self.pending_approval = vault_path / 'Pending_Approval'
-        self.dashboard = vault_path / 'Dashboard.md'
         self.handbook = vault_path / 'Company_Handbook.md'
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        # Approval rules from the handbook and mcp_config.json (hot-reloaded)
+        self.rules = RuleEngine(self.handbook, vault_path.parent / 'mcp_config.json')
 
         # Ensure folders exist
         self.plans.mkdir(parents=True, exist_ok=True)
         self.pending_approval.mkdir(parents=True, exist_ok=True)
-        self.approved = vault_path / 'Approved'
-        self.approved.mkdir(parents=True, exist_ok=True)
-
-        # Track processed files
-        self.processed_files = set()
-
-        # Load existing processed files
-        self._load_processed_files()
-
-        self.logger = logging.getLogger(self.__class__.__name__)
-
-    def _load_processed_files(self):
-        """Load already processed files from Done folder."""
-        for f in self.done.glob('*.md'):
-            self.processed_files.add(f.name)
-        for f in self.needs_action.glob('*.md'):
-            self.processed_files.add(f.name)
 
-    def check_for_new_tasks(self) -> List[Path]:
-        """Check for new task files in Needs_Action folder."""
-        new_tasks = []
-        
-        for f in self.needs_action.glob('*.md'):
-            if f.name not in self.processed_files:
-                # Skip if file is too new (still being written)
-                try:
-                    mtime = datetime.fromtimestamp(f.stat().st_mtime)
-                    age = (datetime.now() - mtime).total_seconds()
-                    if age > 2:  # File is at least 2 seconds old
-                        new_tasks.append(f)
-                except:
-                    pass
-        
-        return new_tasks
-
-    def read_task_file(self, filepath: Path) -> Dict:
-        """Read and parse a task file."""
-        content = filepath.read_text()
-        
-        # Extract frontmatter
-        task_data = {
-            'filepath': filepath,
-            'content': content,
-            'type': 'unknown',
-            'from': 'unknown',
-            'subject': 'unknown',
-            'priority': 'medium',
-            'status': 'pending'
-        }
-        
-        # Parse YAML frontmatter
-        frontmatter_match = re.search(r'---\n(.*?)\n---', content, re.DOTALL)
-        if frontmatter_match:
-            frontmatter = frontmatter_match.group(1)
-            for line in frontmatter.split('\n'):
-                if ':' in line:
-                    key, value = line.split(':', 1)
-                    task_data[key.strip()] = value.strip()
-        
-        # Extract body content
-        body_match = re.search(r'---\n.*?\n---\n(.*)', content, re.DOTALL)
-        if body_match:
-            task_data['body'] = body_match.group(1)
-        
-        return task_data
+    def read_task_file(self, filepath: Path) -> Task:
+        """Read and parse a task file (the body is loaded on demand)."""
+        return Task.from_file(filepath)
 
-    def analyze_task(self, task_data: Dict) -> Dict:
+    def analyze_task(self, task_data: Task) -> Analysis:
         """Analyze task and determine required actions."""
-        analysis = {
-            'requires_approval': False,
-            'approval_reason': None,
-            'actions': [],
-            'category': 'general',
-            'urgency': 'normal'
-        }
-        
-        content = task_data.get('content', '').lower()
-        task_type = task_data.get('type', 'unknown')
+        analysis = Analysis()
         
-        # Load handbook rules
-        approval_threshold = 500.0  # Default from handbook
+        task_type = task_data.type
+        matches = TASK_MATCHER.classify(task_data.content, max_amounts=1)
+        analysis.amounts = tuple(matches['amounts'])
         
-        # Check for payment/financial tasks
-        if any(word in content for word in ['payment', 'invoice', 'pay', 'money', '$']):
-            analysis['category'] = 'financial'
+        # Check for payment/financial tasks against the handbook rules
+        if 'financial' in matches['categories']:
+            analysis.category = 'financial'
             
             # Extract amount if present
-            amount_match = re.search(r'\$?(\d+(?:,\d{3})*(?:\.\d{2})?)', content)
-            if amount_match:
+            amount = None
+            if matches['amounts']:
                 try:
-                    amount = float(amount_match.group(1).replace(',', ''))
-                    if amount > approval_threshold:
-                        analysis['requires_approval'] = True
-                        analysis['approval_reason'] = f'Payment over ${approval_threshold}'
-                except:
+                    amount = float(matches['amounts'][0].replace(',', ''))
+                except ValueError:
                     pass
+            kinds = ('invoice', 'payment') if 'invoice' in matches['categories'] else ('payment',)
+            decision = self.rules.get().evaluate(kinds, amount)
+            analysis.requires_approval = decision['requires_approval']
+            analysis.approval_reason = decision['approval_reason']
+            analysis.approval_kind = decision['kind']
         
         # Check for email tasks
         if task_type == 'email':
-            analysis['category'] = 'communication'
-            analysis['actions'].append('reply_to_sender')
+            analysis.category = 'communication'
+            analysis.add_action('reply_to_sender')
         
         # Check for WhatsApp tasks
         if task_type == 'whatsapp':
-            analysis['category'] = 'communication'
-            analysis['actions'].append('reply_to_sender')
+            analysis.category = 'communication'
+            analysis.add_action('reply_to_sender')
         
         # Check for urgent keywords
-        if any(word in content for word in ['urgent', 'asap', 'emergency', 'critical']):
-            analysis['urgency'] = 'high'
+        if 'urgent' in matches['categories']:
+            analysis.urgency = 'high'
         
         # Check for file drop tasks
         if task_type == 'file_drop':
-            analysis['category'] = 'file_processing'
-            analysis['actions'].append('review_file')
+            analysis.category = 'file_processing'
+            analysis.add_action('review_file')
         
         return analysis
 
-    def create_plan(self, task_data: Dict, analysis: Dict) -> Path:
+    def create_plan(self, task_data: Task, analysis: Analysis) -> Path:
         """Create a Plan.md file for the task."""
-        task_name = task_data['filepath'].stem
+        return self._write_output(self.render_plan(task_data, analysis), 'plan')
+
+    def render_plan(self, task_data: Task, analysis: Analysis) -> Tuple[Path, str]:
+        """Build the Plan.md path and content for a task (nothing is written)."""
+        task_name = task_data.filepath.stem
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
         # Determine actions based on analysis
-        actions = analysis.get('actions', [])
+        actions = analysis.actions
         if not actions:
             actions = ['review_task', 'take_appropriate_action']
         
@@ -167,23 +237,23 @@ class QwenReasoner:
         action_items = '\n'.join([f'- [ ] {action.replace("_", " ").title()}' for action in actions])
         
         # Add category-specific actions
-        if analysis['category'] == 'financial':
+        if analysis.category == 'financial':
             action_items += '\n- [ ] Verify payment details'
             action_items += '\n- [ ] Record in accounting system'
         
-        if analysis['category'] == 'communication':
+        if analysis.category == 'communication':
             action_items += '\n- [ ] Draft response'
             action_items += '\n- [ ] Review before sending'
         
         # Determine if approval is needed
-        approval_status = "Required" if analysis['requires_approval'] else "Not Required"
+        approval_status = "Required" if analysis.requires_approval else "Not Required"
         
         plan_content = f'''---
 type: action_plan
-task_source: {task_data['filepath'].name}
+task_source: {task_data.filepath.name}
 created: {timestamp}
-category: {analysis['category']}
-urgency: {analysis['urgency']}
+category: {analysis.category}
+urgency: {analysis.urgency}
 approval_required: {approval_status}
 status: pending
 ---
@@ -191,15 +261,15 @@ status: pending
 # Action Plan: {task_name}
 
 ## Task Summary
-- **Type:** {task_data.get('type', 'Unknown')}
-- **From:** {task_data.get('from', 'Unknown')}
-- **Subject:** {task_data.get('subject', 'Unknown')}
-- **Priority:** {task_data.get('priority', 'Medium')}
-- **Category:** {analysis['category'].title()}
-- **Urgency:** {analysis['urgency'].title()}
+- **Type:** {task_data.type}
+- **From:** {task_data.sender}
+- **Subject:** {task_data.subject}
+- **Priority:** {task_data.priority}
+- **Category:** {analysis.category.title()}
+- **Urgency:** {analysis.urgency.title()}
 
 ## Objective
-Process and complete the task identified in {task_data['filepath'].name}
+Process and complete the task identified in {task_data.filepath.name}
 
 ## Required Actions
 {action_items}
@@ -208,9 +278,9 @@ Process and complete the task identified in {task_data['filepath'].name}
 - **Human Approval:** {approval_status}
 '''
         
-        if analysis['requires_approval']:
+        if analysis.requires_approval:
             plan_content += f'''
-- **Reason:** {analysis['approval_reason']}
+- **Reason:** {analysis.approval_reason}
 - **Next Step:** Wait for approval before proceeding
 '''
         else:
@@ -228,57 +298,64 @@ Process and complete the task identified in {task_data['filepath'].name}
 *Generated: {timestamp}*
 '''
         
-        # Save plan file
-        plan_path = self.plans / f'PLAN_{task_name}.md'
-        plan_path.write_text(plan_content)
-        
-        self.logger.info(f"Created plan: {plan_path.name}")
-        
-        return plan_path
+        return self.plans / f'PLAN_{task_name}.md', plan_content
 
-    def create_approval_request(self, task_data: Dict, analysis: Dict) -> Optional[Path]:
+    def create_approval_request(self, task_data: Task, analysis: Analysis) -> Optional[Path]:
         """Create an approval request file for sensitive actions."""
-        if not analysis['requires_approval']:
+        return self._write_output(self.render_approval_request(task_data, analysis), 'approval request')
+
+    def render_approval_request(self, task_data: Task, analysis: Analysis) -> Optional[Tuple[Path, str]]:
+        """Build the approval request path and content (None if not needed)."""
+        if not analysis.requires_approval:
             return None
 
-        task_name = task_data['filepath'].stem
+        task_name = task_data.filepath.stem
         timestamp = datetime.now().isoformat()
         expires = datetime.now().replace(hour=23, minute=59).isoformat()
 
-        # Extract details
-        amount = "Unknown"
-        recipient = task_data.get('from', 'Unknown')
-        reason = task_data.get('subject', 'Unknown')
-
-        amount_match = re.search(r'\$?(\d+(?:,\d{3})*(?:\.\d{2})?)', task_data.get('content', ''))
-        if amount_match:
-            amount = f"${amount_match.group(1)}"
+        # Extract details - the action is the kind the amount rule matched
+        kind = analysis.approval_kind or 'payment'
+        approval = Approval(
+            kind,
+            amount=f"${analysis.amounts[0]}" if analysis.amounts else "Unknown",
+            recipient=task_data.sender,
+            reason=task_data.subject,
+            source_task=task_data.filepath.name,
+            created=timestamp,
+            expires=expires
+        )
+
+        # Current thresholds (Company_Handbook.md / mcp_config.json)
+        handbook_rules = '\n'.join(
+            f"- {name.capitalize()}s over ${limit:,g} require explicit approval"
+            for name, limit in sorted(self.rules.get().approval_over.items())
+        )
 
         approval_content = f'''---
 type: approval_request
-action: payment
-amount: {amount}
-recipient: {recipient}
-reason: {reason}
-created: {timestamp}
-expires: {expires}
-status: pending
-source_task: {task_data['filepath'].name}
+action: {approval.action}
+amount: {approval.amount}
+recipient: {approval.recipient}
+reason: {approval.reason}
+created: {approval.created}
+expires: {approval.expires}
+status: {approval.status}
+source_task: {approval.source_task}
 ---
 
 # Approval Required
 
-## Payment Details
-- **Amount:** {amount}
-- **To:** {recipient}
-- **Reference:** {reason}
-- **Source:** {task_data['filepath'].name}
+## {kind.capitalize()} Details
+- **Amount:** {approval.amount}
+- **To:** {approval.recipient}
+- **Reference:** {approval.reason}
+- **Source:** {approval.source_task}
 
 ## Why Approval is Required
-{analysis['approval_reason']}
+{analysis.approval_reason}
 
 ## Company Handbook Rules
-- Payments over $500 require explicit approval
+{handbook_rules}
 - Verify recipient details before approving
 - Check invoice/reference number
 
@@ -297,27 +374,27 @@ source_task: {task_data['filepath'].name}
 '''
 
         approval_path = self.pending_approval / f'APPROVAL_{task_name}_{datetime.now().strftime("%Y%m%d")}.md'
-        approval_path.write_text(approval_content)
-
-        self.logger.info(f"Created approval request: {approval_path.name}")
-
-        return approval_path
+        return approval_path, approval_content
 
-    def create_reply_draft(self, task_data: Dict) -> Optional[Path]:
+    def create_reply_draft(self, task_data: Task) -> Optional[Path]:
         """Create a reply draft for email/WhatsApp messages."""
-        task_type = task_data.get('type', '')
+        return self._write_output(self.render_reply_draft(task_data), 'reply draft')
+
+    def render_reply_draft(self, task_data: Task) -> Optional[Tuple[Path, str]]:
+        """Build the reply draft path and content (None for non-messages)."""
+        task_type = task_data.type
         
         # Only create reply drafts for communication tasks
         if task_type not in ['email', 'whatsapp']:
             return None
         
         # Extract reply details
-        to_address = task_data.get('from', 'Unknown')
-        subject = task_data.get('subject', 'Re: Your Message')
-        content = task_data.get('content', '')
-        original_file = task_data['filepath'].name
+        to_address = task_data.sender
+        subject = task_data.subject
+        original_file = task_data.filepath.name
         
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        # Task stem keeps names unique when several tasks finish in the same second
+        timestamp = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{task_data.filepath.stem}"
         
         if task_type == 'email':
             # Create email reply draft
@@ -325,7 +402,7 @@ source_task: {task_data['filepath'].name}
 type: email_reply
 to: {to_address}
 subject: Re: {subject}
-in_reply_to: {task_data['filepath'].stem}
+in_reply_to: {task_data.filepath.stem}
 created: {datetime.now().isoformat()}
 status: pending_approval
 ---
@@ -370,10 +447,7 @@ AI Employee
 *Created: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}*
 '''
             
-            filepath = self.pending_approval / f'EMAIL_REPLY_{timestamp}.md'
-            filepath.write_text(draft_content, encoding='utf-8')
-            self.logger.info(f"Created email reply draft: {filepath.name}")
-            return filepath
+            return self.pending_approval / f'EMAIL_REPLY_{timestamp}.md', draft_content
             
         elif task_type == 'whatsapp':
             # Create WhatsApp reply draft
@@ -415,70 +489,615 @@ status: pending_approval
 *Created: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}*
 '''
             
-            filepath = self.pending_approval / f'WHATSAPP_REPLY_{timestamp}.md'
-            filepath.write_text(draft_content, encoding='utf-8')
-            self.logger.info(f"Created WhatsApp reply draft: {filepath.name}")
-            return filepath
+            return self.pending_approval / f'WHATSAPP_REPLY_{timestamp}.md', draft_content
         
         return None
 
-    def process_task(self, filepath: Path):
-        """Process a single task file."""
-        self.logger.info(f"Processing task: {filepath.name}")
+    def _write_output(self, rendered: Optional[Tuple[Path, str]], label: str) -> Optional[Path]:
+        """Write a rendered (path, content) file; returns the path."""
+        if rendered is None:
+            return None
+        path, content = rendered
+        atomic_write_text(path, content)
+        self.logger.info(f"Created {label}: {path.name}")
+        return path
+
+    def _plan_task(self, filepath: Path) -> Dict[str, Optional[Path]]:
+        """
+        Read, analyze and write the plan/approval/reply files for a task.
+        
+        Safe to run on a worker thread or process - it only writes new
+        files and touches no shared state.
+        
+        Returns:
+            Paths of the created 'plan', 'approval' and 'reply' files
+        """
+        # Read task
+        task_data = self.read_task_file(filepath)
+
+        # Analyze task
+        analysis = self.analyze_task(task_data)
+
+        # Create plan
+        plan_path = self.create_plan(task_data, analysis)
+
+        # Create approval request if needed
+        approval_path = None
+        if analysis.requires_approval:
+            approval_path = self.create_approval_request(task_data, analysis)
+
+        # Create reply draft for communication tasks
+        reply_draft = self.create_reply_draft(task_data)
+
+        return {'plan': plan_path, 'approval': approval_path, 'reply': reply_draft}
 
-        try:
-            # Read task
-            task_data = self.read_task_file(filepath)
 
-            # Analyze task
-            analysis = self.analyze_task(task_data)
+class QwenReasoner(TaskPlanner):
+    """AI Reasoning engine for task processing."""
+
+    def __init__(
+        self,
+        vault_path: Path,
+        dashboard_interval: float = 5.0,
+        workers: int = 1,
+        use_processes: bool = False,
+        age_step: float = 300.0,
+        worker_id: Optional[str] = None,
+        lease_ttl: float = 30.0,
+        pipeline: Optional[Dict[str, int]] = None,
+        stage_queue: int = 32,
+        high_watermark: Optional[int] = None,
+        low_watermark: Optional[int] = None,
+        ingest: Optional[IngestQueue] = None,
+        ingest_batch: int = 64,
+        index: Optional[VaultIndex] = None,
+        dispatcher: Optional[ApprovalDispatcher] = None
+    ):
+        super().__init__(vault_path)
+        self.done = vault_path / 'Done'
+        self.dashboard = vault_path / 'Dashboard.md'
 
-            # Create plan
-            plan_path = self.create_plan(task_data, analysis)
+        self.approved = vault_path / 'Approved'
+        self.approved.mkdir(parents=True, exist_ok=True)
+        # Long-running: keep the vault index current from file events rather
+        # than re-scanning a folder on every query. A shared index or
+        # dispatcher passed in (orchestrator) is started and closed by its owner.
+        self._owns_index = index is None and dispatcher is None
+        if dispatcher is None:
+            if index is None:
+                index = VaultIndex(vault_path)
+                if Observer is not None:
+                    index.start()
+            dispatcher = ApprovalDispatcher(vault_path, index=index)
+        self.dispatcher = dispatcher
+        self.approvals = ApprovalEngine(vault_path, self.rules, index=self.dispatcher.index)
+
+        # Shared-vault mode: tasks are claimed by rename under a worker lease
+        self.lease: Optional[TaskLease] = None
+        if worker_id:
+            self.lease = TaskLease(vault_path, worker_id, ttl=lease_ttl)
+            self.lease.start()
+
+        # Track processed files (persistent - no folder scan on restart)
+        store_name = f'reasoner_processed_{worker_id}' if worker_id else 'reasoner_processed'
+        self.processed_files = SeenStore(vault_path / '.state', store_name)
+
+        # Pickup latency samples (seconds from file mtime to processing)
+        self.pickup_latencies = deque(maxlen=1000)
+
+        # First run only: treat what is already in Done/Needs_Action as processed
+        # (not with a lease - claimed tasks leave Needs_Action, so what is
+        # still there has not been processed by anyone)
+        if self.processed_files.is_new and self.lease is None:
+            self._load_processed_files()
 
-            # Create approval request if needed
-            if analysis['requires_approval']:
-                approval_path = self.create_approval_request(task_data, analysis)
-                print(f"  [!] Approval required: {approval_path.name}")
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        # Queue depths shown on the dashboard: file names per folder,
+        # seeded once and then adjusted from events and our own writes
+        self._depth_folders = {
+            self.needs_action: 'pending',
+            self.plans: 'plans',
+            self.pending_approval: 'awaiting_approval'
+        }
+        self.queue_depth: Dict[str, set] = {key: set() for key in self._depth_folders.values()}
+        self._depth_lock = threading.Lock()
+        self._seed_queue_depth()
+
+        # Debounced dashboard writer (runs off the task-processing path)
+        self.dashboard_interval = dashboard_interval
+        self._dashboard_dirty = threading.Event()
+        self._dashboard_lock = threading.Lock()
+        self._dashboard_written_at = 0.0
+        self._dashboard_thread: Optional[threading.Thread] = None
+
+        # Task worker pool (workers=1 processes inline on the loop thread)
+        self.workers = max(1, workers)
+        self.use_processes = use_processes
+        self._executor = None
+        if self.workers > 1 and pipeline is None:
+            if use_processes:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    initializer=_init_worker,
+                    initargs=(vault_path,)
+                )
             else:
-                print(f"  [OK] Plan created: {plan_path.name}")
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers,
+                    thread_name_prefix='TaskWorker'
+                )
+        self._inflight: set = set()
+        self._inflight_lock = threading.Lock()
+        self._batch_started = 0.0
+        self._batch_done = 0
+        
+        # Staged pipeline (replaces the worker pool when configured)
+        self.pipeline: Optional[TaskPipeline] = None
+        if pipeline is not None:
+            self.pipeline = TaskPipeline(
+                self._pipeline_stages(pipeline, stage_queue),
+                on_done=lambda item: self._task_completed(item['filepath']),
+                on_error=self._on_stage_error
+            )
+            self.pipeline.start()
+        self._backpressure = False
+        self._backpressure_at = 0.0
+        self._backpressure_lock = threading.Lock()
+        
+        # Backlog watermarks: watchers in other processes pause (via the
+        # backpressure flag) from `high_watermark` waiting tasks until the
+        # backlog is back down to `low_watermark`
+        self.high_watermark = high_watermark
+        self.low_watermark = low_watermark if low_watermark is not None else (high_watermark or 0) // 2
+        
+        # In-process watchers hand over action files through this queue;
+        # they are written to Needs_Action/ only `ingest_batch` at a time
+        self.ingest = ingest
+        self.ingest_batch = ingest_batch
+        
+        # Pending tasks in urgency order; _running counts tasks handed to
+        # workers (or in the pipeline - kept below its queue slots so a full
+        # pipeline cannot block its own write stage)
+        self.task_queue = PriorityTaskQueue(age_step=age_step)
+        self._running = 0
+        self._max_running = self.pipeline.capacity if self.pipeline else self.workers
+        self._stopping = False
 
-            # Create reply draft for communication tasks
-            reply_draft = self.create_reply_draft(task_data)
-            if reply_draft:
-                print(f"  [REPLY] Reply draft created: {reply_draft.name}")
-                print(f"          Move to Approved/ to send the reply")
+    def _load_processed_files(self):
+        """Seed processed files from the Done and Needs_Action folders."""
+        self.processed_files.update(f.name for f in self.done.glob('*.md'))
+        self.processed_files.update(f.name for f in self.needs_action.glob('*.md'))
+
+    def _seed_queue_depth(self) -> bool:
+        """Count each dashboard folder with one directory scan; True if anything changed."""
+        changed = False
+        for folder, key in self._depth_folders.items():
+            names = set()
+            if folder.exists():
+                with os.scandir(folder) as entries:
+                    names = {
+                        entry.name for entry in entries
+                        if entry.name.endswith('.md') and not entry.name.startswith('.')
+                    }
+            if key == 'pending':
+                names = {name for name in names if name not in self.processed_files}
+            with self._depth_lock:
+                changed = changed or self.queue_depth[key] != names
+                self.queue_depth[key] = names
+        return changed
+
+    def _track_file(self, path: Path, present: bool = True):
+        """Adjust queue depth for a file created in or moved out of a tracked folder."""
+        key = self._depth_folders.get(path.parent)
+        if key is None:
+            return
+        with self._depth_lock:
+            names = self.queue_depth[key]
+            if present and not (key == 'pending' and path.name in self.processed_files):
+                if path.name in names:
+                    return
+                names.add(path.name)
+            elif path.name in names:
+                names.discard(path.name)
+            else:
+                return
+        self.update_dashboard()
 
-            # Mark as processed
-            self.processed_files.add(filepath.name)
+    def check_for_new_tasks(self) -> List[Path]:
+        """Check for new task files in Needs_Action folder.
+        
+        Producers write with atomic_write_text(), so any *.md file present
+        is complete and can be picked up immediately.
+        """
+        return [
+            f for f in self.needs_action.glob('*.md')
+            if f.name not in self.processed_files
+        ]
+
+    def _record_pickup(self, filepath: Path) -> Optional[float]:
+        """Record how long a task waited between its last write and pickup."""
+        try:
+            latency = max(0.0, time.time() - filepath.stat().st_mtime)
+        except FileNotFoundError:
+            return None
+        self.pickup_latencies.append(latency)
+        return latency
+
+    def get_latency_stats(self) -> Dict[str, float]:
+        """Summarize pickup latency in milliseconds."""
+        samples = sorted(self.pickup_latencies)
+        if not samples:
+            return {'count': 0}
+        return {
+            'count': len(samples),
+            'avg_ms': sum(samples) / len(samples) * 1000,
+            'p50_ms': samples[len(samples) // 2] * 1000,
+            'p95_ms': samples[min(len(samples) - 1, int(len(samples) * 0.95))] * 1000,
+            'max_ms': samples[-1] * 1000
+        }
 
-            # Update dashboard (increment pending count)
-            self.update_dashboard()
+    def process_task(self, filepath: Path):
+        """Process a single task file."""
+        self.logger.info(f"Processing task: {filepath.name}")
 
+        try:
+            created = self._plan_task(filepath)
+            self._finish_task(filepath, created)
         except Exception as e:
             self.logger.error(f"Error processing task {filepath.name}: {e}")
+            if self.lease is not None:
+                self.lease.release(filepath)
 
-    def update_dashboard(self):
-        """Update the dashboard with current task counts."""
+    def _pipeline_stages(self, workers: Dict[str, int], queue_size: int) -> List[Stage]:
+        """
+        The _plan_task steps as pipeline stages.
+        
+        Items are dicts that each stage extends: filepath -> task ->
+        analysis -> outputs (rendered but unwritten) -> files on disk.
+        
+        Args:
+            workers: Stage name -> worker threads (missing stages get 1)
+            queue_size: Input queue bound of every stage
+        """
+        unknown = set(workers) - set(PIPELINE_STAGES)
+        if unknown:
+            raise ValueError(f"Unknown pipeline stage(s): {', '.join(sorted(unknown))}")
+        
+        def parse(item):
+            item['task'] = self.read_task_file(item['filepath'])
+            return item
+        
+        def classify(item):
+            item['analysis'] = self.analyze_task(item['task'])
+            return item
+        
+        def plan(item):
+            item['outputs'] = {'plan': self.render_plan(item['task'], item['analysis'])}
+            return item
+        
+        def draft(item):
+            item['outputs']['approval'] = self.render_approval_request(item['task'], item['analysis'])
+            item['outputs']['reply'] = self.render_reply_draft(item['task'])
+            return item
+        
+        def write(item):
+            outputs = item['outputs']
+            created = {
+                'plan': self._write_output(outputs['plan'], 'plan'),
+                'approval': self._write_output(outputs['approval'], 'approval request'),
+                'reply': self._write_output(outputs['reply'], 'reply draft')
+            }
+            self._finish_task(item['filepath'], created)
+            return item
+        
+        steps = {'parse': parse, 'classify': classify, 'plan': plan, 'draft': draft, 'write': write}
+        return [Stage(name, steps[name], workers.get(name, 1), queue_size) for name in PIPELINE_STAGES]
+
+    def _finish_task(self, filepath: Path, created: Dict[str, Optional[Path]]):
+        """Report a planned task and update processed/dashboard state."""
+        if self.lease is not None and not self.lease.complete(filepath):
+            return  # Claim recovered by another worker, which re-plans the task
+        
+        # Policy fast path - drafts the rules allow skip the human queue
+        for key in ('approval', 'reply'):
+            if created[key]:
+                approved = self.approvals.process(created[key])
+                if approved:
+                    print(f"  [AUTO] Approved by policy: {approved.name}")
+                    created[key] = approved
+        
+        if created['approval'] and created['approval'].parent == self.pending_approval:
+            print(f"  [!] Approval required: {created['approval'].name}")
+        else:
+            print(f"  [OK] Plan created: {created['plan'].name}")
+        if created['reply'] and created['reply'].parent == self.pending_approval:
+            print(f"  [REPLY] Reply draft created: {created['reply'].name}")
+            print(f"          Move to Approved/ to send the reply")
+
+        # Mark as processed
+        self.processed_files.add(filepath.name)
+
+        # Update dashboard counters (the write itself is debounced)
+        self._track_file(filepath, present=False)
+        for path in created.values():
+            if path:
+                self._track_file(path)
+
+    def _task_priority(self, filepath: Path) -> int:
+        """
+        Queue priority for a task from its frontmatter and urgency keywords.
+        
+        Only the first few KB are read - the full task is parsed later by
+        the worker that plans it.
+        """
         try:
-            if not self.dashboard.exists():
-                return
-            
-            # Count pending tasks
-            pending_count = len([f for f in self.needs_action.glob('*.md') if f.name not in self.processed_files])
-            plans_count = len(list(self.plans.glob('*.md')))
-            approval_count = len(list(self.pending_approval.glob('*.md')))
-            
-            content = self.dashboard.read_text()
-            
-            # Update pending messages section
-            if '## 📬 Pending Messages' in content:
-                # Find the section and update
-                pass  # Simple count update
+            with open(filepath, 'rb') as f:
+                head = f.read(PRIORITY_PEEK_BYTES).decode('utf-8', errors='ignore')
+        except OSError:
+            return PRIORITY_MEDIUM
+        
+        priority = PRIORITY_VALUES.get(
+            str(parse_frontmatter(head).get('priority', '')).lower(), PRIORITY_MEDIUM
+        )
+        if priority != PRIORITY_HIGH and URGENCY_MATCHER.search(head):
+            priority = PRIORITY_HIGH
+        return priority
+
+    def enqueue_task(self, filepath: Path) -> bool:
+        """
+        Add a pending task to the priority queue.
+        
+        Returns:
+            True if the task was queued (False if already queued, in flight or processed)
+        """
+        if filepath.name in self.processed_files or filepath.name in self._inflight:
+            return False
+        if filepath in self.task_queue:
+            return False
+        priority = self._task_priority(filepath)
+        if not self.task_queue.push(filepath, priority):
+            return False
+        latency = self._record_pickup(filepath)
+        if latency is not None:
+            print(f"\n[{self._get_timestamp()}] New task: {filepath.name} "
+                  f"[{PRIORITY_NAMES[priority]}] (picked up in {latency * 1000:.1f} ms)")
+        return True
+
+    def drain_queue(self, limit: Optional[int] = None) -> int:
+        """
+        Submit queued tasks, most urgent first, while a worker is free.
+        
+        With a pool only `workers` tasks are handed out at a time, so the
+        rest stay in the queue where a later urgent arrival can overtake
+        them; completions pull the next task.
+        
+        Args:
+            limit: Maximum tasks to submit (None = until queue empty or workers busy)
+        
+        Returns:
+            Number of tasks submitted
+        """
+        submitted = 0
+        while limit is None or submitted < limit:
+            with self._inflight_lock:
+                if self._stopping or self._running >= self._max_running:
+                    break
+                filepath = self.task_queue.pop()
+                if filepath is None:
+                    break
+                self._running += 1
+            if self.high_watermark:
+                # Keeps the flag fresh through a long inline drain
+                self._update_backpressure()
             
-            # Add quick stats
-            stats_section = f'''
-## 🔄 AI Processing Status
+            queued = False
+            try:
+                if self.submit_task(filepath):
+                    submitted += 1
+                    queued = self._executor is not None or self.pipeline is not None
+            finally:
+                if not queued:
+                    with self._inflight_lock:
+                        self._running -= 1
+        if self.pipeline is not None or self.high_watermark:
+            self._update_backpressure()
+        return submitted
+
+    def _update_backpressure(self):
+        """Hold the watchers off while the pipeline is full or the backlog is past its watermark."""
+        waiting = len(self.task_queue)
+        active = self.pipeline is not None and self._running >= self._max_running and waiting > 0
+        if self.high_watermark:
+            # Hysteresis: pause at the high watermark, resume at the low one
+            limit = self.low_watermark if self._backpressure else self.high_watermark - 1
+            active = active or waiting > limit
+        now = time.monotonic()
+        with self._backpressure_lock:
+            changed = active != self._backpressure
+            # Refresh well before watchers treat the flag as stale
+            if not changed and not (active and now - self._backpressure_at > BACKPRESSURE_MAX_AGE / 3):
+                return
+            self._backpressure = active
+            self._backpressure_at = now
+            signal_backpressure(self.vault_path / '.state', active)
+        if changed:
+            self.logger.info(
+                f"Reasoner backlogged - {waiting} task(s) waiting, watchers paused"
+                if active else "Reasoner caught up - watchers resumed"
+            )
+
+    def log_wait_stats(self):
+        """Log queue wait time per priority."""
+        for line in self.task_queue.format_wait_report():
+            self.logger.info(f"Queue wait {line}")
+
+    def log_pipeline_stats(self):
+        """Log throughput and queue depth per pipeline stage."""
+        if self.pipeline is None:
+            return
+        for line in self.pipeline.format_metrics():
+            self.logger.info(f"Stage {line}")
+
+    def submit_task(self, filepath: Path) -> bool:
+        """
+        Claim a task and process it inline or on the worker pool.
+        
+        A task is claimed once - it is skipped while in flight and after it
+        has been processed, so two workers never plan the same file.
+        
+        Returns:
+            True if the task was claimed
+        """
+        with self._inflight_lock:
+            if filepath.name in self._inflight or filepath.name in self.processed_files:
+                return False
+            self._claim(filepath.name)
+
+        if self.lease is not None:
+            claimed = self.lease.claim(filepath)
+            if claimed is None:
+                # Another worker took it
+                self._release_task(filepath.name, counted=False)
+                return False
+            self._track_file(filepath, present=False)
+            filepath = claimed
+
+        if self.pipeline is not None:
+            self.logger.info(f"Queued task: {filepath.name}")
+            self.pipeline.submit({'filepath': filepath})
+            return True
+
+        if self._executor is None:
+            self.process_task(filepath)
+            self._release_task(filepath.name)
+            return True
+
+        self.logger.info(f"Queued task: {filepath.name}")
+        if self.use_processes:
+            future = self._executor.submit(_plan_in_worker, filepath)
+        else:
+            future = self._executor.submit(self._plan_task, filepath)
+        future.add_done_callback(lambda f, path=filepath: self._on_task_done(path, f))
+        return True
+
+    def _on_task_done(self, filepath: Path, future):
+        """Worker-pool completion callback."""
+        try:
+            self._finish_task(filepath, future.result())
+        except Exception as e:
+            self.logger.error(f"Error processing task {filepath.name}: {e}")
+            if self.lease is not None:
+                self.lease.release(filepath)
+        finally:
+            self._task_completed(filepath)
+
+    def _on_stage_error(self, item: Dict, error: Exception, stage: str):
+        """Pipeline failure callback - the task is dropped (or returned to its lease)."""
+        filepath = item['filepath']
+        self.logger.error(f"Error processing task {filepath.name} in {stage} stage: {error}")
+        if self.lease is not None:
+            self.lease.release(filepath)
+        self._task_completed(filepath)
+
+    def _task_completed(self, filepath: Path):
+        """Free a worker slot after a pooled or pipelined task."""
+        # Hand out the next task before releasing this claim, so the
+        # in-flight set does not empty (and end the batch) mid-backlog
+        with self._inflight_lock:
+            self._running -= 1
+        self.drain_queue()
+        self._release_task(filepath.name)
+
+    def _claim(self, name: str):
+        """Add to the in-flight set (caller holds _inflight_lock)."""
+        if not self._inflight:
+            self._batch_started = time.perf_counter()
+            self._batch_done = 0
+        self._inflight.add(name)
+
+    @contextmanager
+    def _task_batch(self):
+        """Group submissions so throughput is reported once for the whole backlog."""
+        with self._inflight_lock:
+            self._claim(_BATCH_TOKEN)
+        try:
+            yield
+        finally:
+            self._release_task(_BATCH_TOKEN, counted=False)
+
+    def _release_task(self, name: str, counted: bool = True):
+        """Drop a claim; report throughput when a backlog drains."""
+        with self._inflight_lock:
+            self._inflight.discard(name)
+            if counted:
+                self._batch_done += 1
+            if self._inflight:
+                return
+            elapsed = time.perf_counter() - self._batch_started
+            done = self._batch_done
+        if done > 1:
+            workers = 'pipeline' if self.pipeline else f'{self.workers} worker(s)'
+            self.logger.info(
+                f"Processed {done} tasks in {elapsed:.2f}s "
+                f"({done / elapsed:.1f} tasks/s, {workers})"
+            )
+            self.log_pipeline_stats()
+
+    def shutdown_workers(self):
+        """Wait for in-flight tasks and stop the worker pool.
+        
+        Tasks still queued are left in Needs_Action/ for the next start.
+        """
+        self._stopping = True
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self.pipeline is not None:
+            self.pipeline.stop(wait=True)
+            self.log_pipeline_stats()
+            signal_backpressure(self.vault_path / '.state', False)
+
+    def update_dashboard(self):
+        """Schedule a dashboard refresh - never blocks task processing."""
+        self._dashboard_dirty.set()
+        if self._dashboard_thread is None:
+            self._dashboard_thread = threading.Thread(
+                target=self._dashboard_loop,
+                name='DashboardWriter',
+                daemon=True
+            )
+            self._dashboard_thread.start()
+
+    def _dashboard_loop(self):
+        """Write the dashboard at most once per dashboard_interval."""
+        while True:
+            self._dashboard_dirty.wait()
+            delay = self._dashboard_written_at + self.dashboard_interval - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            self._dashboard_dirty.clear()
+            self._write_dashboard()
+
+    def flush_dashboard(self):
+        """Write any pending dashboard update now (used on shutdown)."""
+        if self._dashboard_dirty.is_set():
+            self._dashboard_dirty.clear()
+            self._write_dashboard()
+
+    def _write_dashboard(self):
+        """Rewrite only the AI Processing Status section of Dashboard.md."""
+        with self._dashboard_lock:
+            try:
+                if not self.dashboard.exists():
+                    return
+
+                with self._depth_lock:
+                    pending_count = len(self.queue_depth['pending'])
+                    plans_count = len(self.queue_depth['plans'])
+                    approval_count = len(self.queue_depth['awaiting_approval'])
+
+                stats_section = f'''{DASHBOARD_SECTION}
 | Metric | Count |
 |--------|-------|
 | Pending Tasks | {pending_count} |
@@ -487,42 +1106,41 @@ status: pending_approval
 
 *Last updated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}*
 '''
-            
-            # Append stats if not present
-            if '## 🔄 AI Processing Status' not in content:
-                content += '\n' + stats_section
-                self.dashboard.write_text(content)
-            
-        except Exception as e:
-            self.logger.error(f"Error updating dashboard: {e}")
 
-    def check_approvals(self):
-        """Check for approved files - DO NOT auto-move reply files."""
-        approved_folder = self.vault_path / 'Approved'
+                content = self.dashboard.read_text(encoding='utf-8')
+                start = content.find(DASHBOARD_SECTION)
+                if start == -1:
+                    content = content.rstrip('\n') + '\n\n' + stats_section
+                else:
+                    # Replace up to the next heading, keep everything else
+                    end = content.find('\n## ', start + len(DASHBOARD_SECTION))
+                    rest = '\n' + content[end + 1:] if end != -1 else ''
+                    content = content[:start] + stats_section + rest
 
-        if not approved_folder.exists():
-            return
+                atomic_write_text(self.dashboard, content)
 
-        for f in approved_folder.glob('*.md'):
-            content = f.read_text()
-            
-            # DO NOT auto-move email/whatsapp reply files
-            # These need to be processed by their respective reply scripts
-            if 'type: email_reply' in content or 'type:email_reply' in content:
-                self.logger.info(f"Email reply waiting in Approved/: {f.name}")
-                continue
-            if 'type: whatsapp_reply' in content or 'type:whatsapp_reply' in content:
-                self.logger.info(f"WhatsApp reply waiting in Approved/: {f.name}")
-                continue
-            
-            # Only move non-reply approved files
-            self.logger.info(f"Processing approved file: {f.name}")
-            dest = self.done / f.name
-            try:
-                f.rename(dest)
-                self.logger.info(f"Moved approved file to Done: {f.name}")
             except Exception as e:
-                self.logger.error(f"Error moving approved file: {e}")
+                self.logger.error(f"Error updating dashboard: {e}")
+            finally:
+                self._dashboard_written_at = time.monotonic()
+
+    def check_approvals(self):
+        """Complete approved files no other consumer handles.
+        
+        Replies and social posts are routed to their own scripts by the
+        dispatcher and are never touched here.
+        """
+        counts = self.dispatcher.run_handlers({
+            'payment': self._complete_approval,
+            'default': self._complete_approval,
+        })
+        for route, count in counts.items():
+            self.logger.info(f"Moved {count} approved {route} file(s) to Done")
+
+    def _complete_approval(self, filepath: Path) -> bool:
+        """Record an approved file as done."""
+        self.logger.info(f"Processing approved file: {filepath.name}")
+        return True
 
     def run(self):
         """Run the reasoner loop."""
@@ -542,28 +1160,236 @@ status: pending_approval
         
         while True:
             try:
-                # Check for new tasks
-                new_tasks = self.check_for_new_tasks()
-                
-                if new_tasks:
-                    print(f"\n[{self._get_timestamp()}] Found {len(new_tasks)} new task(s)")
-                    for task in new_tasks:
-                        self.process_task(task)
-                else:
-                    print(f"[{self._get_timestamp()}] No new tasks")
-                
-                # Check for approved files
-                self.check_approvals()
-                
-            except Exception as e:
-                self.logger.error(f"Error in reasoner loop: {e}")
+                time.sleep(self.poll_once())
+            except KeyboardInterrupt:
+                self.close()
+                raise
+
+    def poll_once(self) -> float:
+        """
+        One pass of the polling loop: new tasks, leases, approvals, dashboard.
+        
+        Returns:
+            Seconds to sleep before the next pass
+        """
+        try:
+            # Write out queued watcher items as far as the backlog allows
+            self._pull_ingest()
+            
+            # Check for new tasks
+            new_tasks = self.check_for_new_tasks()
             
-            time.sleep(10)  # Check every 10 seconds
+            if new_tasks:
+                print(f"\n[{self._get_timestamp()}] Found {len(new_tasks)} new task(s)")
+                for task in new_tasks:
+                    self._track_file(task)
+                    self.enqueue_task(task)
+                with self._task_batch():
+                    self.drain_queue()
+            else:
+                print(f"[{self._get_timestamp()}] No new tasks")
+            
+            # Return tasks held by crashed workers (shared-vault mode)
+            if self.lease is not None:
+                self.lease.recover()
+            
+            # Auto-approve by policy and expire stale approvals, then act
+            self.approvals.sweep()
+            self.check_approvals()
+            
+            # No file events in polling mode - recount (names only, no reads)
+            if self._seed_queue_depth():
+                self.update_dashboard()
+            
+        except Exception as e:
+            self.logger.error(f"Error in reasoner loop: {e}")
+        
+        if self.ingest is not None and len(self.ingest):
+            return 1.0  # Keep draining the ingest queue
+        return 10.0  # Check every 10 seconds
+
+    def _pull_ingest(self) -> int:
+        """
+        Move items from the ingest queue into Needs_Action/, keeping at most
+        `ingest_batch` tasks waiting in the priority queue. Each item is
+        acked only after its file is written, so a crash in between
+        delivers it again instead of losing it.
+        
+        Returns:
+            Number of action files written
+        """
+        if self.ingest is None:
+            return 0
+        items = self.ingest.get_batch(self.ingest_batch - len(self.task_queue))
+        for item in items:
+            atomic_write_text(self.needs_action / item.name, item.content)
+            self.ingest.ack(item.name)
+        if items:
+            self.logger.info(f"Ingested {len(items)} item(s), {len(self.ingest)} still queued")
+        return len(items)
+
+    def log_ingest_stats(self):
+        """Log ingest queue depth and lag."""
+        if self.ingest is not None:
+            self.logger.info(f"Ingest queue: {self.ingest.format_stats()}")
+
+    def close(self):
+        """Stop workers and leases, flush state and log stats."""
+        self.shutdown_workers()
+        if self.lease is not None:
+            self.lease.stop()
+        self.flush_dashboard()
+        self.processed_files.close()
+        self.log_wait_stats()
+        self.log_ingest_stats()
+        self.approvals.log_stats()
+        self.approvals.close()
+        if self._owns_index:
+            self.dispatcher.index.close()
+
+    def run_events(self, reconcile_interval: float = 60.0, settle_delay: float = 0.0):
+        """
+        Run the reasoner from file events instead of polling.
+        
+        Args:
+            reconcile_interval: Seconds between safety-net folder scans
+            settle_delay: Quiet period after the last write before a file is read.
+                Vault producers write atomically, so the default is 0; raise
+                it if non-atomic external tools drop files into Needs_Action/
+        """
+        if Observer is None:
+            self.logger.warning("watchdog not installed - falling back to polling")
+            return self.run()
+
+        self.logger.info('Starting Qwen Reasoner (event-driven)')
+        print()
+        print("=" * 60)
+        print("Qwen Reasoner - AI Reasoning Loop (event-driven)")
+        print("=" * 60)
+        print(f"Vault: {self.vault_path}")
+        print(f"Monitoring: {self.needs_action}, {self.approved}")
+        print(f"Reconcile scan: every {reconcile_interval:.0f}s")
+        print()
+        print("Waiting for new tasks...")
+        print("Press Ctrl+C to stop")
+        print("-" * 60)
+
+        self.needs_action.mkdir(parents=True, exist_ok=True)
+        events: queue.Queue = queue.Queue()
+        handler = ReasonerEventHandler(self, events)
+        observer = Observer()
+        observer.schedule(handler, str(self.needs_action), recursive=False)
+        observer.schedule(handler, str(self.approved), recursive=False)
+        observer.schedule(handler, str(self.plans), recursive=False)
+        observer.schedule(handler, str(self.pending_approval), recursive=False)
+        observer.start()
+
+        # Path -> time of its last event; processed once it has settled
+        pending: Dict[Path, float] = {}
+        approvals_at: Optional[float] = None
+        next_reconcile = time.monotonic()
+
+        def take_events(timeout: float):
+            """Apply queued file events; block up to `timeout` for the first."""
+            nonlocal approvals_at
+            try:
+                kind, path, present = events.get(timeout=timeout)
+                while True:
+                    self._track_file(path, present)
+                    if present and kind == 'task':
+                        pending[path] = time.monotonic()
+                    elif present and kind == 'approval':
+                        self.approvals.record_approved(path)
+                        approvals_at = time.monotonic()
+                    elif present and kind == 'pending_approval':
+                        # Drafts from other producers (posters, email_reply)
+                        self.approvals.process(path)
+                    kind, path, present = events.get_nowait()
+            except queue.Empty:
+                pass
+
+        def enqueue_settled():
+            """Move settled task files into the priority queue."""
+            now = time.monotonic()
+            for path in [p for p, t in pending.items() if now - t >= settle_delay]:
+                del pending[path]
+                if path.exists():
+                    self.enqueue_task(path)
+
+        try:
+            while True:
+                now = time.monotonic()
+                deadlines = [t + settle_delay for t in pending.values()]
+                if approvals_at is not None:
+                    deadlines.append(approvals_at + settle_delay)
+                timeout = max(0.0, min(deadlines + [next_reconcile]) - now)
+                take_events(timeout)
+
+                try:
+                    enqueue_settled()
+                    with self._task_batch():
+                        if self._executor is None and self.pipeline is None:
+                            # Inline: one task at a time, picking up new
+                            # arrivals in between so urgent work jumps ahead
+                            while self.drain_queue(limit=1):
+                                take_events(0)
+                                enqueue_settled()
+                        else:
+                            self.drain_queue()
+
+                    now = time.monotonic()
+                    if approvals_at is not None and now - approvals_at >= settle_delay:
+                        approvals_at = None
+                        self.check_approvals()
+
+                    if now >= next_reconcile:
+                        # Safety net for events the observer missed
+                        if self.lease is not None:
+                            self.lease.recover()
+                        if self._seed_queue_depth():
+                            self.update_dashboard()
+                        for task in self.check_for_new_tasks():
+                            if task not in pending:
+                                self.enqueue_task(task)
+                        with self._task_batch():
+                            self.drain_queue()
+                        self.approvals.sweep()
+                        self.check_approvals()
+                        next_reconcile = now + reconcile_interval
+                except Exception as e:
+                    self.logger.error(f"Error in reasoner loop: {e}")
+
+        except KeyboardInterrupt:
+            pass
+        finally:
+            observer.stop()
+            observer.join()
+            self.close()
+            stats = self.get_latency_stats()
+            if stats['count']:
+                self.logger.info(
+                    f"Pickup latency over {stats['count']} task(s): "
+                    f"avg {stats['avg_ms']:.1f} ms, p50 {stats['p50_ms']:.1f} ms, "
+                    f"p95 {stats['p95_ms']:.1f} ms, max {stats['max_ms']:.1f} ms"
+                )
     
     def _get_timestamp(self):
         return datetime.now().strftime('%H:%M:%S')
 
 
+# Process-pool workers plan tasks with a planner of their own (no shared state)
+_worker_planner: Optional[TaskPlanner] = None
+
+
+def _init_worker(vault_path: Path):
+    global _worker_planner
+    _worker_planner = TaskPlanner(vault_path)
+
+
+def _plan_in_worker(filepath: Path) -> Dict[str, Optional[Path]]:
+    return _worker_planner._plan_task(filepath)
+
+
 if __name__ == '__main__':
     # Setup logging
     logging.basicConfig(
@@ -579,6 +1405,57 @@ if __name__ == '__main__':
         import sys
         sys.exit(1)
     
+    parser = argparse.ArgumentParser(description='Qwen Reasoner')
+    parser.add_argument('--poll', action='store_true',
+                        help='Poll every 10 seconds instead of reacting to file events')
+    parser.add_argument('--reconcile-interval', type=float, default=60.0,
+                        help='Seconds between safety-net scans in event mode (default: 60)')
+    parser.add_argument('--dashboard-interval', type=float, default=5.0,
+                        help='Minimum seconds between Dashboard.md rewrites (default: 5)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Parallel task workers (default: 1, inline)')
+    parser.add_argument('--processes', action='store_true',
+                        help='Use worker processes instead of threads')
+    parser.add_argument('--age-step', type=float, default=300.0,
+                        help='Seconds of queue wait that raise a task one priority level (default: 300)')
+    parser.add_argument('--worker-id',
+                        help='Share the vault with other reasoners: claim tasks under this lease id')
+    parser.add_argument('--lease-ttl', type=float, default=30.0,
+                        help='Seconds before a silent worker\'s tasks are recovered (default: 30)')
+    parser.add_argument('--pipeline', action='store_true',
+                        help='Process tasks in parse/classify/plan/draft/write stages')
+    parser.add_argument('--stage-workers', default='',
+                        help='Threads per pipeline stage, e.g. plan=2,write=2 (implies --pipeline)')
+    parser.add_argument('--stage-queue', type=int, default=32,
+                        help='Bounded queue size in front of each pipeline stage (default: 32)')
+    parser.add_argument('--high-watermark', type=int, default=None,
+                        help='Pause the watchers while this many tasks are waiting (default: off)')
+    parser.add_argument('--low-watermark', type=int, default=None,
+                        help='Resume the watchers at this many waiting tasks (default: half the high watermark)')
+    args = parser.parse_args()
+    
+    stage_workers = None
+    if args.pipeline or args.stage_workers:
+        stage_workers = {}
+        for spec in filter(None, args.stage_workers.split(',')):
+            name, _, count = spec.partition('=')
+            stage_workers[name.strip()] = int(count or 1)
+    
     # Create and run reasoner
-    reasoner = QwenReasoner(vault_path)
-    reasoner.run()
+    reasoner = QwenReasoner(
+        vault_path,
+        dashboard_interval=args.dashboard_interval,
+        workers=args.workers,
+        use_processes=args.processes,
+        age_step=args.age_step,
+        worker_id=args.worker_id,
+        lease_ttl=args.lease_ttl,
+        pipeline=stage_workers,
+        stage_queue=args.stage_queue,
+        high_watermark=args.high_watermark,
+        low_watermark=args.low_watermark
+    )
+    if args.poll:
+        reasoner.run()
+    else:
+        reasoner.run_events(reconcile_interval=args.reconcile_interval)
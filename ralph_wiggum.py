@@ -26,6 +26,7 @@ Usage:
 """
 
 import logging
+import re
 import time
 from pathlib import Path
 from datetime import datetime
@@ -34,6 +35,9 @@ import json
 import sys
 import os
 
+from atomic_writer import atomic_write_text
+from task_model import LoopTask
+
 # Fix Windows console encoding
 if sys.platform == 'win32':
     os.system('chcp 65001 > nul')
@@ -100,7 +104,7 @@ class RalphWiggumLoop:
         self._setup_logging()
         
         # Task tracking
-        self.active_tasks: Dict[str, Dict[str, Any]] = {}
+        self.active_tasks: Dict[str, LoopTask] = {}
         self.iteration_counts: Dict[str, int] = {}
         
         # Load task history
@@ -210,7 +214,7 @@ actor: {self.actor}
 ## Notes
 '''
         
-        state_file.write_text(content, encoding='utf-8')
+        atomic_write_text(state_file, content)
         
         # Move from source folder if specified
         if source_folder:
@@ -219,14 +223,14 @@ actor: {self.actor}
                 source_file.rename(state_file)
         
         # Track task
-        self.active_tasks[task_id] = {
-            'state_file': state_file,
-            'prompt': prompt,
-            'completion_criteria': completion_criteria,
-            'status': TaskStatus.IN_PROGRESS,
-            'iteration': 0,
-            'created': timestamp
-        }
+        self.active_tasks[task_id] = LoopTask(
+            task_id,
+            state_file,
+            prompt,
+            completion_criteria,
+            TaskStatus.IN_PROGRESS,
+            created=timestamp
+        )
         
         self.iteration_counts[task_id] = 0
         self._save_task_history()
@@ -256,12 +260,12 @@ actor: {self.actor}
             return
         
         task = self.active_tasks[task_id]
-        task['iteration'] += 1
-        self.iteration_counts[task_id] = task['iteration']
+        task.iteration += 1
+        self.iteration_counts[task_id] = task.iteration
         self._save_task_history()
         
         # Update state file
-        state_file = task['state_file']
+        state_file = task.state_file
         
         if state_file.exists():
             content = state_file.read_text(encoding='utf-8')
@@ -276,20 +280,28 @@ actor: {self.actor}
             else:
                 content += f'\n\n## Actions Taken{action_log}'
             
-            # Update iteration count
+            # Update iteration count (body and frontmatter, so scanners
+            # can read it from the header alone)
             content = content.replace(
-                f"- Iteration: {task['iteration'] - 1} /",
-                f"- Iteration: {task['iteration']} /"
+                f"- Iteration: {task.iteration - 1} /",
+                f"- Iteration: {task.iteration} /"
+            )
+            content = re.sub(
+                r'^iteration: \d+$',
+                f"iteration: {task.iteration}",
+                content,
+                count=1,
+                flags=re.MULTILINE
             )
             
             # Add next action if provided
             if next_action:
                 content += f'\n\n## Next Action\n{next_action}'
             
-            state_file.write_text(content, encoding='utf-8')
+            atomic_write_text(state_file, content)
         
         self.logger.info(
-            f"[ITER {task['iteration']}] {task_id}: {action_taken} -> {result}"
+            f"[ITER {task.iteration}] {task_id}: {action_taken} -> {result}"
         )
     
     def check_completion(self, task_id: str) -> bool:
@@ -309,26 +321,26 @@ actor: {self.actor}
             return False
         
         task = self.active_tasks[task_id]
-        state_file = task['state_file']
+        state_file = task.state_file
         
         # Check if file moved to Done
         done_file = self.done / state_file.name
         if done_file.exists():
-            task['status'] = TaskStatus.COMPLETED
+            task.status = TaskStatus.COMPLETED
             self.logger.info(f"[COMPLETE] Task {task_id} moved to Done/")
             return True
         
         # Check if file moved to Rejected
         rejected_file = self.rejected / state_file.name
         if rejected_file.exists():
-            task['status'] = TaskStatus.FAILED
+            task.status = TaskStatus.FAILED
             self.logger.info(f"[REJECTED] Task {task_id} moved to Rejected/")
             return True
         
         # Check if waiting for approval
         pending_file = self.pending_approval / state_file.name
         if pending_file.exists():
-            task['status'] = TaskStatus.WAITING_APPROVAL
+            task.status = TaskStatus.WAITING_APPROVAL
             self.logger.info(f"[WAITING] Task {task_id} in Pending_Approval/")
             return False
         
@@ -339,7 +351,7 @@ actor: {self.actor}
             return False
         
         # Still in progress
-        return state_file.exists() and task['iteration'] > 0
+        return state_file.exists() and task.iteration > 0
     
     def should_continue(self, task_id: str) -> bool:
         """
@@ -361,8 +373,8 @@ actor: {self.actor}
             return False
         
         # Check iteration limit
-        if task['iteration'] >= self.max_iterations:
-            task['status'] = TaskStatus.MAX_ITERATIONS
+        if task.iteration >= self.max_iterations:
+            task.status = TaskStatus.MAX_ITERATIONS
             self.logger.warning(
                 f"[MAX ITER] Task {task_id} reached {self.max_iterations} iterations"
             )
@@ -384,7 +396,8 @@ actor: {self.actor}
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         escalation_file = self.needs_action / f'ESCALATION_RALPH_{timestamp}.md'
         
-        task = self.active_tasks.get(task_id, {})
+        task = self.active_tasks.get(task_id)
+        iterations = task.iteration if task else 0
         
         content = f'''---
 type: escalation
@@ -393,7 +406,7 @@ priority: high
 status: pending
 task_id: {task_id}
 reason: {reason}
-iterations: {task.get('iteration', 0)}
+iterations: {iterations}
 ---
 
 # Ralph Wiggum Loop - Human Intervention Required
@@ -403,8 +416,8 @@ The autonomous task completion loop is stuck and needs human help.
 
 ## Task Details
 - **Task ID:** {task_id}
-- **Prompt:** {task.get('prompt', 'Unknown')}
-- **Iterations:** {task.get('iteration', 0)} / {self.max_iterations}
+- **Prompt:** {task.prompt if task else 'Unknown'}
+- **Iterations:** {iterations} / {self.max_iterations}
 - **Reason:** {reason}
 
 ## Current State
@@ -423,7 +436,7 @@ Check /Vault/In_Progress/ for the task state file.
 4. File movement blocked
 '''
         
-        escalation_file.write_text(content, encoding='utf-8')
+        atomic_write_text(escalation_file, content)
         
         self.logger.critical(f"[ESCALATE] Task {task_id}: {reason}")
         
@@ -441,7 +454,7 @@ Check /Vault/In_Progress/ for the task state file.
             return
         
         task = self.active_tasks[task_id]
-        state_file = task['state_file']
+        state_file = task.state_file
         
         # Update state file with completion
         if state_file.exists():
@@ -459,10 +472,10 @@ Check /Vault/In_Progress/ for the task state file.
             
             # Move to Done
             done_file = self.done / state_file.name
-            done_file.write_text(content, encoding='utf-8')
+            atomic_write_text(done_file, content)
             state_file.unlink()
         
-        task['status'] = TaskStatus.COMPLETED
+        task.status = TaskStatus.COMPLETED
         del self.active_tasks[task_id]
         
         self.logger.info(f"[DONE] Task {task_id} completed successfully")
@@ -493,7 +506,7 @@ Check /Vault/In_Progress/ for the task state file.
         # Run iterations
         while self.should_continue(task_id):
             task = self.active_tasks[task_id]
-            iteration = task['iteration']
+            iteration = task.iteration
             
             # Call processor
             try:
@@ -529,20 +542,20 @@ Check /Vault/In_Progress/ for the task state file.
             return True
         else:
             # Escalate to human
-            task = self.active_tasks.get(task_id, {})
-            reason = f"Task did not complete after {task.get('iteration', 0)} iterations"
+            task = self.active_tasks.get(task_id)
+            reason = f"Task did not complete after {task.iteration if task else 0} iterations"
             self.escalate_to_human(task_id, reason)
             return False
     
     def get_active_tasks(self) -> List[Dict[str, Any]]:
         """Get list of active tasks."""
-        return list(self.active_tasks.values())
+        return [task.to_dict() for task in self.active_tasks.values()]
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get Ralph Wiggum loop statistics."""
         return {
             'active_tasks': len(self.active_tasks),
-            'total_iterations': sum(t['iteration'] for t in self.active_tasks.values()),
+            'total_iterations': sum(t.iteration for t in self.active_tasks.values()),
             'max_iterations_configured': self.max_iterations,
             'iteration_delay': self.iteration_delay
         }
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Seen Store - GOLD TIER
+Personal AI Employee Hackathon 0
+
+Compact persistent "already seen" set for watchers and the reasoner
+(processed email IDs, WhatsApp chat keys, processed task file names).
+
+Storage (per store, in Vault/.state/):
+    <name>.snapshot   Sorted 64-bit key hashes (+ optional Bloom filter bits)
+    <name>.journal    Append-only 64-bit hashes added since the last snapshot
+
+Keys are stored as 8-byte BLAKE2b hashes, so memory is ~8 bytes per entry
+regardless of key length, and startup is a single read of the snapshot
+(no per-entry parsing). Lookups check the recent-adds set and then binary
+search the snapshot array; the optional Bloom filter answers most "never
+seen" lookups with a few bit tests. The journal is folded into a new
+snapshot every `compact_every` adds and on close().
+
+Usage:
+    from seen_store import SeenStore
+    
+    seen = SeenStore(vault / '.state', 'gmail_ids')
+    if seen.add(message_id):     # True if it was new
+        ...
+    seen.close()
+
+Benchmark:
+    python seen_store.py --bench 1000000
+"""
+
+import os
+import time
+import struct
+import bisect
+import hashlib
+import logging
+import argparse
+import tempfile
+import threading
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+import sys
+import math
+
+from atomic_writer import atomic_write_bytes
+
+# Fix Windows console encoding
+if sys.platform == 'win32':
+    os.system('chcp 65001 > nul')
+
+
+SNAPSHOT_MAGIC = b'SEEN0001'
+_HEADER = struct.Struct('<8sQQQ')  # magic, entries, bloom bytes, bloom hashes
+_HASH = struct.Struct('<Q')
+
+
+def _hash_key(key: str) -> int:
+    """64-bit hash of a key (collision odds ~1e-8 at a million entries)."""
+    return _HASH.unpack(hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest())[0]
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over precomputed 64-bit hashes."""
+    
+    def __init__(self, capacity: int, error_rate: float = 0.01, bits: Optional[bytearray] = None,
+                 num_hashes: Optional[int] = None):
+        """
+        Initialize Bloom filter.
+        
+        Args:
+            capacity: Expected number of entries
+            error_rate: Target false-positive rate at capacity
+            bits: Existing bit array (when loading from a snapshot)
+            num_hashes: Hash count matching `bits`
+        """
+        if bits is not None:
+            self.bits = bits
+            self.num_hashes = num_hashes
+        else:
+            num_bits = max(64, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+            self.bits = bytearray((num_bits + 7) // 8)
+            self.num_hashes = max(1, round(num_bits / max(capacity, 1) * math.log(2)))
+        self.num_bits = len(self.bits) * 8
+    
+    def _positions(self, h: int):
+        # Double hashing from the two 32-bit halves
+        h1 = h & 0xFFFFFFFF
+        h2 = (h >> 32) | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+    
+    def add(self, h: int):
+        for pos in self._positions(h):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+    
+    def __contains__(self, h: int) -> bool:
+        bits = self.bits
+        for pos in self._positions(h):
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+
+class SeenStore:
+    """Persistent set of seen keys: snapshot + append-only journal."""
+    
+    def __init__(
+        self,
+        folder: Path,
+        name: str,
+        bloom: bool = False,
+        bloom_capacity: int = 1_000_000,
+        bloom_error_rate: float = 0.01,
+        compact_every: int = 50_000,
+        fsync: bool = False
+    ):
+        """
+        Open (or create) a seen store.
+        
+        Args:
+            folder: Directory holding the store files (e.g. Vault/.state)
+            name: Store name (file prefix)
+            bloom: Keep a Bloom filter in front of the exact lookup
+            bloom_capacity: Bloom filter size in expected entries
+            bloom_error_rate: Bloom filter false-positive rate at capacity
+            compact_every: Journal entries that trigger a new snapshot
+            fsync: fsync the journal after every add
+        """
+        self.folder = Path(folder)
+        self.folder.mkdir(parents=True, exist_ok=True)
+        self.name = name
+        self.snapshot_file = self.folder / f'{name}.snapshot'
+        self.journal_file = self.folder / f'{name}.journal'
+        self.compact_every = compact_every
+        self.fsync = fsync
+        self.bloom_enabled = bloom
+        self.bloom_capacity = bloom_capacity
+        self.bloom_error_rate = bloom_error_rate
+        self.logger = logging.getLogger(self.__class__.__name__)
+        
+        self._lock = threading.Lock()
+        self._snapshot = array('Q')
+        self._recent: set = set()
+        self._bloom: Optional[BloomFilter] = None
+        
+        self.is_new = not self.snapshot_file.exists() and not self.journal_file.exists()
+        self._load()
+        self._journal = open(self.journal_file, 'ab', buffering=0)
+    
+    def _load(self):
+        """Load the snapshot and replay the journal."""
+        if self.snapshot_file.exists():
+            data = self.snapshot_file.read_bytes()
+            magic, entries, bloom_bytes, bloom_hashes = _HEADER.unpack_from(data)
+            if magic != SNAPSHOT_MAGIC:
+                raise ValueError(f"Not a seen-store snapshot: {self.snapshot_file}")
+            start = _HEADER.size
+            self._snapshot.frombytes(data[start:start + entries * 8])
+            if self.bloom_enabled and bloom_bytes:
+                bits = bytearray(data[start + entries * 8:start + entries * 8 + bloom_bytes])
+                self._bloom = BloomFilter(0, bits=bits, num_hashes=bloom_hashes)
+        
+        if self.bloom_enabled and self._bloom is None:
+            self._rebuild_bloom()
+        
+        if self.journal_file.exists():
+            data = self.journal_file.read_bytes()
+            # Ignore a torn final record from a crash mid-write
+            usable = len(data) - len(data) % 8
+            journal = array('Q')
+            journal.frombytes(data[:usable])
+            for h in journal:
+                if not self._contains_hash(h):
+                    self._add_hash(h)
+    
+    def _rebuild_bloom(self):
+        """Size a fresh Bloom filter for the current contents and fill it."""
+        capacity = max(self.bloom_capacity, 2 * len(self._snapshot))
+        self._bloom = BloomFilter(capacity, self.bloom_error_rate)
+        for h in self._snapshot:
+            self._bloom.add(h)
+        for h in self._recent:
+            self._bloom.add(h)
+    
+    def _contains_hash(self, h: int) -> bool:
+        if self._bloom is not None and h not in self._bloom:
+            return False
+        if h in self._recent:
+            return True
+        i = bisect.bisect_left(self._snapshot, h)
+        return i < len(self._snapshot) and self._snapshot[i] == h
+    
+    def _add_hash(self, h: int):
+        self._recent.add(h)
+        if self._bloom is not None:
+            self._bloom.add(h)
+    
+    def __contains__(self, key: str) -> bool:
+        return self._contains_hash(_hash_key(key))
+    
+    def __len__(self) -> int:
+        return len(self._snapshot) + len(self._recent)
+    
+    def add(self, key: str) -> bool:
+        """
+        Mark a key as seen.
+        
+        Args:
+            key: Key to add
+        
+        Returns:
+            True if the key was new
+        """
+        return self.update([key]) == 1
+    
+    def update(self, keys: Iterable[str]) -> int:
+        """
+        Mark many keys as seen with a single journal write.
+        
+        Args:
+            keys: Keys to add
+        
+        Returns:
+            Number of keys that were new
+        """
+        added = array('Q')
+        with self._lock:
+            for key in keys:
+                h = _hash_key(key)
+                if not self._contains_hash(h):
+                    self._add_hash(h)
+                    added.append(h)
+            if added:
+                self._journal.write(added.tobytes())
+                if self.fsync:
+                    os.fsync(self._journal.fileno())
+            if len(self._recent) >= self.compact_every:
+                self._compact()
+        return len(added)
+    
+    def compact(self):
+        """Fold the journal into a new snapshot."""
+        with self._lock:
+            self._compact()
+    
+    def _compact(self):
+        if not self._recent and self.snapshot_file.exists():
+            return
+        
+        # Mostly-sorted input - timsort merges the two runs cheaply
+        merged = array('Q', sorted(self._snapshot.tolist() + list(self._recent)))
+        
+        if self._bloom is not None and len(merged) > self._bloom_capacity_for():
+            self._snapshot, self._recent = merged, set()
+            self._rebuild_bloom()
+        
+        bloom_bits = self._bloom.bits if self._bloom is not None else b''
+        bloom_hashes = self._bloom.num_hashes if self._bloom is not None else 0
+        header = _HEADER.pack(SNAPSHOT_MAGIC, len(merged), len(bloom_bits), bloom_hashes)
+        atomic_write_bytes(self.snapshot_file, header + merged.tobytes() + bytes(bloom_bits))
+        
+        # The snapshot now holds everything - start an empty journal
+        self._journal.close()
+        self._journal = open(self.journal_file, 'wb', buffering=0)
+        self._snapshot = merged
+        self._recent = set()
+        self.logger.debug(f"Compacted {self.name}: {len(merged):,} entries")
+    
+    def _bloom_capacity_for(self) -> int:
+        """Entries the current Bloom filter was sized for."""
+        if self._bloom is None:
+            return 0
+        return int(self._bloom.num_bits * (math.log(2) ** 2) / -math.log(self.bloom_error_rate))
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Entry counts and approximate memory use."""
+        return {
+            'entries': len(self),
+            'snapshot_entries': len(self._snapshot),
+            'journal_entries': len(self._recent),
+            'snapshot_bytes': len(self._snapshot) * 8,
+            'bloom_bytes': len(self._bloom.bits) if self._bloom is not None else 0
+        }
+    
+    def close(self):
+        """Compact and close the journal."""
+        with self._lock:
+            if self._journal.closed:
+                return
+            self._compact()
+            self._journal.close()
+
+
+def _max_rss_mb() -> Optional[float]:
+    """Peak RSS in MB (POSIX only)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Seen Store benchmark')
+    parser.add_argument('--bench', type=int, default=1_000_000, help='Number of keys')
+    parser.add_argument('--bloom', action='store_true', help='Enable the Bloom filter')
+    args = parser.parse_args()
+    
+    print("\n" + "="*60)
+    print("SEEN STORE BENCHMARK")
+    print("="*60)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        keys = [f'18c{n:013x}' for n in range(args.bench)]
+        
+        store = SeenStore(Path(tmp), 'bench', bloom=args.bloom, compact_every=args.bench + 1)
+        start = time.perf_counter()
+        store.update(keys)
+        print(f"\n  Add {args.bench:,} keys:     {(time.perf_counter() - start) * 1000:8.1f} ms")
+        
+        start = time.perf_counter()
+        store.close()
+        print(f"  Compact snapshot:     {(time.perf_counter() - start) * 1000:8.1f} ms")
+        del store
+        
+        start = time.perf_counter()
+        store = SeenStore(Path(tmp), 'bench', bloom=args.bloom)
+        print(f"  Reopen (startup):     {(time.perf_counter() - start) * 1000:8.1f} ms")
+        
+        probes = 100_000
+        start = time.perf_counter()
+        hits = sum(1 for key in keys[:probes] if key in store)
+        hit_us = (time.perf_counter() - start) / probes * 1e6
+        start = time.perf_counter()
+        misses = sum(1 for n in range(probes) if f'unseen{n}' in store)
+        miss_us = (time.perf_counter() - start) / probes * 1e6
+        print(f"  Lookup (seen):        {hit_us:8.2f} us  ({hits:,} hits)")
+        print(f"  Lookup (unseen):      {miss_us:8.2f} us  ({misses:,} false positives)")
+        
+        stats = store.get_stats()
+        print(f"  Snapshot size:        {stats['snapshot_bytes'] + stats['bloom_bytes']:>10,} bytes")
+        rss = _max_rss_mb()
+        if rss is not None:
+            print(f"  Peak RSS:             {rss:8.1f} MB (includes the benchmark key list)")
+        store.close()
+    
+    print("\n" + "="*60 + "\n")
@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Task Lease - GOLD TIER
+Personal AI Employee Hackathon 0
+
+Lease-based task claiming so several reasoner processes (on one machine or
+on several machines sharing the vault) never plan the same task.
+
+Protocol:
+    claim      os.rename(Needs_Action/X.md, In_Progress/<worker-id>/X.md).
+               A rename succeeds exactly once, so only one worker gets X.
+    lease      In_Progress/<worker-id>/.lease.json holds the worker's host,
+               pid and an expiry time; a heartbeat thread renews it every
+               ttl/3 seconds.
+    complete   Rename the claimed file on to Planned/ (planned, waiting for
+               a human to finish it - kept out of Needs_Action/ so no other
+               worker claims it again, and out of In_Progress/, which is
+               Ralph's working folder). If the rename fails the claim was
+               recovered by another worker and the result is discarded.
+    recover    Any worker that finds a lease past its expiry renames that
+               worker's claimed files back to Needs_Action/.
+
+Folders under In_Progress/ without a lease file (e.g. the approval
+dispatcher's route folders) are never touched.
+
+Usage:
+    lease = TaskLease(vault_path, 'node-a')
+    lease.start()
+    claimed = lease.claim(vault_path / 'Needs_Action' / 'EMAIL_1.md')
+    if claimed:
+        ...                          # plan it
+        lease.complete(claimed)
+    lease.stop()
+
+Harness (N local reasoner workers against a synthetic vault):
+    python task_lease.py --harness 4 --tasks 400 --work-ms 20
+    python task_lease.py --harness 4 --tasks 400 --work-ms 20 --kill
+"""
+
+import os
+import sys
+import json
+import time
+import socket
+import logging
+import argparse
+import tempfile
+import threading
+import subprocess
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from atomic_writer import atomic_write_text
+
+# Fix Windows console encoding
+if sys.platform == 'win32':
+    os.system('chcp 65001 > nul')
+
+
+LEASE_FILE = '.lease.json'
+PLANNED_FOLDER = 'Planned'  # Completed claims
+
+
+def default_worker_id() -> str:
+    """Unique id for this process: <host>-<pid>."""
+    return f'{socket.gethostname()}-{os.getpid()}'
+
+
+class TaskLease:
+    """Claims Needs_Action files for one worker under a renewable lease."""
+    
+    def __init__(
+        self,
+        vault_path: Path,
+        worker_id: Optional[str] = None,
+        ttl: float = 30.0,
+        source: str = 'Needs_Action'
+    ):
+        """
+        Initialize lease.
+        
+        Args:
+            vault_path: Path to Obsidian vault
+            worker_id: Stable worker name (default: <host>-<pid>)
+            ttl: Seconds a lease stays valid without a heartbeat
+            source: Folder tasks are claimed from (and returned to)
+        """
+        self.vault_path = Path(vault_path)
+        self.worker_id = worker_id or default_worker_id()
+        self.ttl = ttl
+        self.source = self.vault_path / source
+        self.in_progress = self.vault_path / 'In_Progress'
+        self.folder = self.in_progress / self.worker_id
+        self.planned = self.vault_path / PLANNED_FOLDER
+        self.lease_file = self.folder / LEASE_FILE
+        self.logger = logging.getLogger(self.__class__.__name__)
+        
+        self._stop = threading.Event()
+        self._heartbeat_thread: Optional[threading.Thread] = None
+        self.stats = {'claimed': 0, 'lost': 0, 'completed': 0, 'released': 0, 'recovered': 0}
+    
+    def start(self):
+        """Take the lease, return leftovers from a previous run and start heartbeats."""
+        self.folder.mkdir(parents=True, exist_ok=True)
+        self.planned.mkdir(parents=True, exist_ok=True)
+        self.renew()
+        
+        # Same worker id restarted after a crash - its claims are stale
+        leftovers = self._return_files(self.folder)
+        if leftovers:
+            self.logger.info(f"Returned {leftovers} task(s) left over from a previous run")
+        
+        self._stop.clear()
+        self._heartbeat_thread = threading.Thread(
+            target=self._heartbeat_loop, name='LeaseHeartbeat', daemon=True
+        )
+        self._heartbeat_thread.start()
+    
+    def renew(self):
+        """Write the lease with a fresh expiry."""
+        self.folder.mkdir(parents=True, exist_ok=True)
+        now = time.time()
+        atomic_write_text(self.lease_file, json.dumps({
+            'worker_id': self.worker_id,
+            'host': socket.gethostname(),
+            'pid': os.getpid(),
+            'heartbeat': now,
+            'expires': now + self.ttl
+        }), fsync=False)
+    
+    def _heartbeat_loop(self):
+        while not self._stop.wait(self.ttl / 3):
+            try:
+                self.renew()
+            except OSError as e:
+                self.logger.warning(f"Lease heartbeat failed: {e}")
+    
+    def claim(self, path: Path) -> Optional[Path]:
+        """
+        Atomically take a task.
+        
+        Returns:
+            Claimed path, or None if another worker got it first
+        """
+        dest = self.folder / path.name
+        try:
+            os.rename(path, dest)
+        except FileNotFoundError:
+            if not self.folder.exists():
+                # Our folder was cleaned up by a recovery - recreate and retry once
+                self.renew()
+                try:
+                    os.rename(path, dest)
+                except FileNotFoundError:
+                    return None
+            else:
+                return None
+        self.stats['claimed'] += 1
+        return dest
+    
+    def complete(self, claimed: Path, folder: Optional[Path] = None) -> bool:
+        """
+        Hand a finished task on (default: Planned/).
+        
+        Returns:
+            False if the claim was lost to a recovery in the meantime
+        """
+        dest = (folder or self.planned) / claimed.name
+        try:
+            os.rename(claimed, dest)
+        except FileNotFoundError:
+            self.stats['lost'] += 1
+            self.logger.warning(f"Lease lost before completing {claimed.name} - recovered by another worker")
+            return False
+        self.stats['completed'] += 1
+        return True
+    
+    def release(self, claimed: Path) -> bool:
+        """Return an unfinished task to the source folder."""
+        try:
+            os.rename(claimed, self.source / claimed.name)
+        except FileNotFoundError:
+            return False
+        self.stats['released'] += 1
+        return True
+    
+    def _return_files(self, folder: Path) -> int:
+        """Move every claimed task in a worker folder back to the source folder."""
+        returned = 0
+        for path in folder.glob('*.md'):
+            dest = self.source / path.name
+            if dest.exists():
+                continue
+            try:
+                os.rename(path, dest)
+                returned += 1
+            except FileNotFoundError:
+                pass  # Another worker recovered it first
+        return returned
+    
+    def read_leases(self) -> List[Dict[str, Any]]:
+        """All worker leases under In_Progress/ (corrupt ones have expires=0)."""
+        leases = []
+        if not self.in_progress.exists():
+            return leases
+        for lease_file in self.in_progress.glob(f'*/{LEASE_FILE}'):
+            try:
+                lease = json.loads(lease_file.read_text(encoding='utf-8'))
+            except FileNotFoundError:
+                continue  # Worker stopped (or was recovered) meanwhile
+            except (OSError, ValueError):
+                lease = {'worker_id': lease_file.parent.name, 'expires': 0}
+            lease['folder'] = lease_file.parent
+            leases.append(lease)
+        return leases
+    
+    def recover(self, grace: float = 0.0) -> int:
+        """
+        Return tasks held by workers whose lease has expired.
+        
+        Args:
+            grace: Extra seconds past expiry before a lease counts as abandoned
+                (allowance for clock skew between machines)
+        
+        Returns:
+            Number of tasks returned to the source folder
+        """
+        now = time.time()
+        recovered = 0
+        for lease in self.read_leases():
+            folder = lease['folder']
+            if folder == self.folder or now <= lease.get('expires', 0) + grace:
+                continue
+            count = self._return_files(folder)
+            try:
+                (folder / LEASE_FILE).unlink()
+                folder.rmdir()
+            except OSError:
+                pass  # Raced with another recoverer, or the worker came back
+            if count:
+                self.logger.warning(
+                    f"Recovered {count} task(s) from expired lease of {lease.get('worker_id')}"
+                )
+            recovered += count
+        self.stats['recovered'] += recovered
+        return recovered
+    
+    def stop(self):
+        """Stop heartbeats, return unfinished tasks and drop the lease."""
+        self._stop.set()
+        if self._heartbeat_thread is not None:
+            self._heartbeat_thread.join()
+            self._heartbeat_thread = None
+        self.stats['released'] += self._return_files(self.folder)
+        try:
+            self.lease_file.unlink()
+            self.folder.rmdir()
+        except OSError:
+            pass
+
+
+def _run_worker(vault: Path, worker_id: str, ttl: float, work_ms: float) -> Dict[str, Any]:
+    """Harness worker: a lease-mode reasoner that exits when the vault is drained."""
+    from qwen_reasoner import QwenReasoner
+    
+    reasoner = QwenReasoner(vault, dashboard_interval=3600, worker_id=worker_id, lease_ttl=ttl)
+    if work_ms:
+        plan_task = reasoner._plan_task
+        
+        def slow_plan(path):
+            time.sleep(work_ms / 1000)  # Stand-in for model latency
+            return plan_task(path)
+        reasoner._plan_task = slow_plan
+    
+    lease = reasoner.lease
+    while True:
+        tasks = reasoner.check_for_new_tasks()
+        for task in tasks:
+            reasoner.enqueue_task(task)
+        with reasoner._task_batch():
+            reasoner.drain_queue()
+        if tasks:
+            continue
+        lease.recover()
+        # Done once nothing is queued and no other worker still holds tasks
+        busy = [
+            l for l in lease.read_leases()
+            if l['folder'] != lease.folder and any(l['folder'].glob('*.md'))
+        ]
+        if not busy and not any(reasoner.needs_action.glob('*.md')):
+            break
+        time.sleep(0.05)
+    
+    reasoner.shutdown_workers()
+    reasoner.processed_files.close()
+    lease.stop()
+    return lease.stats
+
+
+def _run_harness(workers: int, tasks: int, work_ms: float, ttl: float, kill: bool) -> bool:
+    """Spawn N workers against a synthetic vault and check every task was planned once."""
+    with tempfile.TemporaryDirectory() as tmp:
+        vault = Path(tmp) / 'Vault'
+        needs_action = vault / 'Needs_Action'
+        needs_action.mkdir(parents=True)
+        for n in range(tasks):
+            kind = ('email', 'file_drop', 'whatsapp')[n % 3]
+            atomic_write_text(needs_action / f'TASK_{n:05d}.md', (
+                f"---\ntype: {kind}\nfrom: sender{n}@example.com\nsubject: Task {n}\n"
+                f"priority: {('high', 'medium', 'low')[n % 3]}\n---\n\nPlease handle item {n}.\n"
+            ), fsync=False)
+        
+        start = time.perf_counter()
+        procs = [
+            subprocess.Popen(
+                [sys.executable, __file__, '--worker', str(vault), '--id', f'w{i}',
+                 '--ttl', str(ttl), '--work-ms', str(work_ms)],
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+            )
+            for i in range(workers)
+        ]
+        if kill and workers > 1:
+            time.sleep(max(0.5, tasks * work_ms / 1000 / workers / 4))
+            procs[0].kill()
+            print(f"  Killed worker w0 (pid {procs[0].pid}) - survivors recover after {ttl:.0f}s")
+        
+        results = {}
+        for i, proc in enumerate(procs):
+            out, _ = proc.communicate()
+            lines = [line for line in out.splitlines() if line.startswith('{')]
+            results[f'w{i}'] = json.loads(lines[-1]) if lines else None
+        elapsed = time.perf_counter() - start
+        
+        planned = sorted(p.name for p in (vault / 'Plans').glob('PLAN_TASK_*.md'))
+        finished = sorted(p.name for p in (vault / PLANNED_FOLDER).glob('TASK_*.md'))
+        left = list(needs_action.glob('*.md'))
+        
+        for worker_id, stats in results.items():
+            print(f"  {worker_id}: {stats if stats else 'killed'}")
+        print(f"\n  Tasks:     {tasks}  planned: {len(planned)}  finished: {len(finished)}  left: {len(left)}")
+        print(f"  Elapsed:   {elapsed:.2f}s  ({tasks / elapsed:.1f} tasks/s with {workers} worker(s))")
+        return len(finished) == tasks and not left
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Task lease harness')
+    parser.add_argument('--harness', type=int, metavar='N', help='Spawn N local workers')
+    parser.add_argument('--tasks', type=int, default=400, help='Synthetic tasks (default: 400)')
+    parser.add_argument('--work-ms', type=float, default=20.0,
+                        help='Simulated model latency per task (default: 20)')
+    parser.add_argument('--ttl', type=float, default=3.0, help='Lease TTL in seconds (default: 3)')
+    parser.add_argument('--kill', action='store_true', help='Kill one worker mid-run')
+    parser.add_argument('--worker', metavar='VAULT', help=argparse.SUPPRESS)
+    parser.add_argument('--id', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    
+    if args.worker:
+        logging.basicConfig(level=logging.WARNING)
+        with open(os.devnull, 'w') as devnull:
+            stdout, sys.stdout = sys.stdout, devnull
+            stats = _run_worker(Path(args.worker), args.id, args.ttl, args.work_ms)
+            sys.stdout = stdout
+        print(json.dumps(stats))
+        sys.exit(0)
+    
+    print("\n" + "="*60)
+    print("TASK LEASE HARNESS")
+    print("="*60)
+    ok = True
+    for count in ([args.harness] if args.harness else [1, 2, 4]):
+        print(f"\n  --- {count} worker(s) ---")
+        ok = _run_harness(count, args.tasks, args.work_ms, args.ttl, args.kill) and ok
+    print(f"\n  {'[OK] every task planned exactly once' if ok else '[FAIL] tasks lost or duplicated'}")
+    print("\n" + "="*60 + "\n")
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Task Model - GOLD TIER
+Personal AI Employee Hackathon 0
+
+Compact records for task state held in memory.
+
+Tasks used to be passed around as dicts carrying the full file text. The
+records here use __slots__ (no per-object __dict__), keep only the
+frontmatter fields, and load the body on demand from the file - a task is
+a path plus the byte offset where its body starts. Building one reads
+only the header (a bounded FrontmatterReader read), so the reasoner's
+read for classification is the only full read of the file. Short values
+that repeat across thousands of tasks (type, status, priority, sender,
+category, ...) are interned, so every task shares one copy.
+
+The records still answer `record['key']` and `record.get('key')` like the
+dicts they replace ('from' maps to `sender`), so existing callers keep
+working while new code uses attributes. The dict-style access covers the
+frontmatter only: `content` and `body` read the file, so they are plain
+properties and never reached through `get()` or `in`.
+
+Usage:
+    from task_model import Task
+    
+    task = Task.from_file(path)
+    task.type, task.sender, task.subject
+    task.body       # read from disk now, not kept
+
+Benchmark:
+    python task_model.py --bench --count 100000
+"""
+
+import re
+import time
+import argparse
+import tempfile
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+import sys
+import os
+
+from frontmatter_reader import FrontmatterReader
+
+# Fix Windows console encoding
+if sys.platform == 'win32':
+    os.system('chcp 65001 > nul')
+
+
+INTERN_MAX_LENGTH = 128  # Longer values are unlikely to repeat
+INTERN_LIMIT = 4096      # Table cap, so unique values cannot grow it forever
+_interned: Dict[str, str] = {}
+
+_MISSING = object()
+
+# Shared by every Task.from_file (its counters show the bytes read for headers)
+HEADER_READER = FrontmatterReader()
+
+
+def intern_value(value: Any) -> Any:
+    """
+    Shared copy of a short, frequently repeated string.
+    
+    Unlike sys.intern the table is bounded; once full, new values are
+    returned as they are.
+    """
+    if not isinstance(value, str) or len(value) > INTERN_MAX_LENGTH:
+        return value
+    shared = _interned.get(value)
+    if shared is None:
+        if len(_interned) >= INTERN_LIMIT:
+            return value
+        shared = _interned.setdefault(value, value)
+    return shared
+
+
+class _Record:
+    """Dict-style read access on top of slots."""
+    
+    __slots__ = ()
+    _aliases: Dict[str, str] = {}
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        name = self._aliases.get(key, key)
+        value = getattr(self, name) if name in self.__slots__ else None
+        return default if value is None else value
+    
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+    
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+    
+    def __repr__(self) -> str:
+        fields = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__[:3])
+        return f'{self.__class__.__name__}({fields})'
+
+
+class Task(_Record):
+    """A Needs_Action task: frontmatter fields plus a lazy body."""
+    
+    __slots__ = ('filepath', 'type', 'sender', 'subject', 'priority', 'status', 'fields', 'body_offset')
+    _aliases = {'from': 'sender'}
+    
+    def __init__(
+        self,
+        filepath: Path,
+        type: str = 'unknown',
+        sender: str = 'unknown',
+        subject: str = 'unknown',
+        priority: str = 'medium',
+        status: str = 'pending',
+        fields: Optional[Dict[str, str]] = None,
+        body_offset: int = -1
+    ):
+        """
+        Initialize task.
+        
+        Args:
+            filepath: Task file
+            type, sender, subject, priority, status: Frontmatter values
+            fields: Any other frontmatter keys (None if there are none)
+            body_offset: Byte offset of the body in the file (-1 = no frontmatter)
+        """
+        self.filepath = filepath
+        self.type = intern_value(type)
+        self.sender = intern_value(sender)
+        self.subject = subject
+        self.priority = intern_value(priority)
+        self.status = intern_value(status)
+        self.fields = fields
+        self.body_offset = body_offset
+    
+    @classmethod
+    def from_file(cls, filepath: Path) -> 'Task':
+        """Parse a task file's frontmatter; the body stays on disk."""
+        header, body_offset = HEADER_READER.read_header(filepath)
+        task = cls(filepath)
+        if header is None:
+            return task
+        
+        fields: Dict[str, str] = {}
+        for line in header.splitlines():
+            if ':' in line:
+                key, value = line.split(':', 1)
+                key, value = key.strip(), value.strip()
+                if key == 'from':
+                    task.sender = intern_value(value)
+                elif key == 'subject':
+                    task.subject = value
+                elif key in ('type', 'priority', 'status'):
+                    setattr(task, key, intern_value(value))
+                else:
+                    fields[intern_value(key)] = intern_value(value)
+        task.fields = fields or None
+        task.body_offset = body_offset
+        return task
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self._aliases or key in self.__slots__:
+            return super().get(key, default)
+        else:
+            value = self.fields.get(key) if self.fields else None
+        return default if value is None else value
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Frontmatter as a flat dict (body not included)."""
+        data = dict(self.fields or {})
+        data.update(filepath=self.filepath, type=self.type, subject=self.subject,
+                    priority=self.priority, status=self.status)
+        data['from'] = self.sender
+        return data
+    
+    @property
+    def content(self) -> str:
+        """Full file text (read on every access)."""
+        return _decode(self.filepath.read_bytes())
+    
+    @property
+    def body(self) -> Optional[str]:
+        """Text after the frontmatter, or None if the file has none."""
+        if self.body_offset < 0:
+            return None
+        with open(self.filepath, 'rb') as f:
+            f.seek(self.body_offset)
+            return _decode(f.read())
+
+
+class Analysis(_Record):
+    """What the reasoner decided about a task."""
+    
+    __slots__ = ('requires_approval', 'approval_reason', 'approval_kind', 'actions', 'category', 'urgency', 'amounts')
+    
+    def __init__(
+        self,
+        requires_approval: bool = False,
+        approval_reason: Optional[str] = None,
+        approval_kind: Optional[str] = None,
+        actions: Tuple[str, ...] = (),
+        category: str = 'general',
+        urgency: str = 'normal',
+        amounts: Tuple[str, ...] = ()
+    ):
+        self.requires_approval = requires_approval
+        self.approval_reason = approval_reason
+        self.approval_kind = intern_value(approval_kind) if approval_kind else None
+        self.actions = actions
+        self.category = intern_value(category)
+        self.urgency = intern_value(urgency)
+        self.amounts = amounts
+    
+    def add_action(self, action: str):
+        self.actions += (intern_value(action),)
+
+
+class Approval(_Record):
+    """An approval request (Pending_Approval/ file header)."""
+    
+    __slots__ = ('action', 'amount', 'recipient', 'reason', 'source_task', 'created', 'expires', 'status')
+    
+    def __init__(
+        self,
+        action: str,
+        amount: str = 'Unknown',
+        recipient: str = 'Unknown',
+        reason: str = 'Unknown',
+        source_task: Optional[str] = None,
+        created: Optional[str] = None,
+        expires: Optional[str] = None,
+        status: str = 'pending'
+    ):
+        self.action = intern_value(action)
+        self.amount = amount
+        self.recipient = intern_value(recipient)
+        self.reason = reason
+        self.source_task = source_task
+        self.created = created
+        self.expires = expires
+        self.status = intern_value(status)
+    
+    @classmethod
+    def from_header(cls, header: Dict[str, Any]) -> 'Approval':
+        """Build from parsed frontmatter."""
+        return cls(
+            str(header.get('action', header.get('type', ''))),
+            amount=str(header.get('amount', 'Unknown')),
+            recipient=str(header.get('recipient', header.get('to', 'Unknown'))),
+            reason=str(header.get('reason', header.get('subject', 'Unknown'))),
+            source_task=header.get('source_task'),
+            created=header.get('created'),
+            expires=header.get('expires'),
+            status=str(header.get('status', 'pending'))
+        )
+
+
+class LoopTask(_Record):
+    """A task tracked by the Ralph Wiggum loop."""
+    
+    __slots__ = ('task_id', 'state_file', 'prompt', 'completion_criteria', 'status', 'iteration', 'created')
+    
+    def __init__(self, task_id: str, state_file: Path, prompt: str, completion_criteria: str,
+                 status: str, iteration: int = 0, created: Optional[Any] = None):
+        self.task_id = task_id
+        self.state_file = state_file
+        self.prompt = prompt
+        self.completion_criteria = intern_value(completion_criteria)
+        self.status = intern_value(status)
+        self.iteration = iteration
+        self.created = created
+
+
+def _decode(raw: bytes) -> str:
+    """Bytes to text with the newline handling of Path.read_text()."""
+    return raw.decode('utf-8', errors='replace').replace('\r\n', '\n')
+
+
+def _legacy_read(filepath: Path) -> Dict[str, Any]:
+    """The reasoner's original read_task_file (full content kept in a dict)."""
+    content = filepath.read_text(encoding='utf-8')
+    task_data = {
+        'filepath': filepath,
+        'content': content,
+        'type': 'unknown',
+        'from': 'unknown',
+        'subject': 'unknown',
+        'priority': 'medium',
+        'status': 'pending'
+    }
+    frontmatter_match = re.search(r'---\n(.*?)\n---', content, re.DOTALL)
+    if frontmatter_match:
+        for line in frontmatter_match.group(1).split('\n'):
+            if ':' in line:
+                key, value = line.split(':', 1)
+                task_data[key.strip()] = value.strip()
+    body_match = re.search(r'---\n.*?\n---\n(.*)', content, re.DOTALL)
+    if body_match:
+        task_data['body'] = body_match.group(1)
+    return task_data
+
+
+def _measure(build, count: int) -> Tuple[float, float]:
+    """(MB held by `count` built objects, seconds to build them)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    held = [build(i) for i in range(count)]
+    elapsed = time.perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del held
+    return size / 1024 / 1024, elapsed
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Task Model benchmark')
+    parser.add_argument('--bench', action='store_true', help='Run the memory benchmark')
+    parser.add_argument('--count', type=int, default=100_000, help='Tasks held in memory')
+    parser.add_argument('--files', type=int, default=200, help='Distinct task files to sample')
+    args = parser.parse_args()
+    
+    print("\n" + "="*60)
+    print("TASK MODEL" + (" BENCHMARK" if args.bench else " SELF-TEST"))
+    print("="*60)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        senders = ['billing@example.com', 'ceo@example.com', '+1 555 0100', 'support@vendor.io']
+        paths = []
+        for n in range(args.files if args.bench else 4):
+            path = Path(tmp) / f'EMAIL_{n}.md'
+            path.write_text(
+                f"---\ntype: {'email' if n % 3 else 'whatsapp'}\nfrom: {senders[n % len(senders)]}\n"
+                f"subject: Invoice INV-{n:05d}\nreceived: 2026-01-07T10:00:00\npriority: high\n"
+                f"status: pending\n---\n\n" + "Please find the invoice attached. " * 60,
+                encoding='utf-8'
+            )
+            paths.append(path)
+        
+        legacy = _legacy_read(paths[1])
+        task = Task.from_file(paths[1])
+        same = (all(task.get(key) == legacy[key] for key in legacy if key not in ('content', 'body'))
+                and task.body == legacy['body'] and task.content == legacy['content']
+                and 'body' not in task)
+        print(f"\n  Task:      {task!r}")
+        print(f"  Fields:    {task.fields}")
+        print(f"  Same as the legacy dict: {same}")
+        print(f"  Header reads: {HEADER_READER.bytes_read} of {paths[1].stat().st_size} bytes")
+        
+        if args.bench:
+            print(f"\n  {args.count:,} tasks from {len(paths)} files (~{paths[0].stat().st_size} bytes each)")
+            rows = [
+                ('dict + content (legacy)', lambda i: _legacy_read(paths[i % len(paths)])),
+                ('Task (lazy body)', lambda i: Task.from_file(paths[i % len(paths)])),
+            ]
+            for label, build in rows:
+                size, elapsed = _measure(build, args.count)
+                print(f"  {label:<24} {size:8.1f} MB  {size * 1024 * 1024 / args.count:7.0f} B/task  "
+                      f"{elapsed:6.2f}s to load")
+            
+            analysis = {'requires_approval': False, 'approval_reason': None, 'approval_kind': None,
+                        'actions': [], 'category': 'communication', 'urgency': 'normal', 'amounts': []}
+            rows = [
+                ('analysis dict', lambda i: dict(analysis, actions=['reply_to_sender'], amounts=[str(i)])),
+                ('Analysis', lambda i: Analysis(actions=('reply_to_sender',), category='communication',
+                                                amounts=(str(i),))),
+            ]
+            for label, build in rows:
+                size, elapsed = _measure(build, args.count)
+                print(f"  {label:<24} {size:8.1f} MB  {size * 1024 * 1024 / args.count:7.0f} B/task")
+    
+    print("\n" + "="*60 + "\n")
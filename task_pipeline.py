@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Task Pipeline - GOLD TIER
+Personal AI Employee Hackathon 0
+
+Staged processing with bounded queues between stages.
+
+Each stage has its own input queue (bounded by `queue_size`) and its own
+worker threads. A worker takes an item, runs the stage function and puts
+the result on the next stage's queue - blocking while that queue is full,
+so a slow stage stalls the stages before it and, finally, submit().
+
+Every stage reports throughput, queue depth (current and max), mean queue
+wait, mean service time and utilization; the busiest stage is the
+bottleneck.
+
+Backpressure leaves the process through a flag file: while the reasoner's
+pipeline is full and work is still waiting (or its backlog is past its
+high watermark) it keeps Vault/.state/reasoner_backpressure fresh, and
+watchers skip polling while `backpressure_active()` is true. A stale flag
+(producer gone) is ignored.
+
+Usage:
+    pipeline = TaskPipeline([
+        Stage('parse', parse, workers=2),
+        Stage('write', write, workers=1, queue_size=32),
+    ], on_done=finish, on_error=fail)
+    pipeline.start()
+    pipeline.submit(item)
+    print('\\n'.join(pipeline.format_metrics()))
+"""
+
+import time
+import queue
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+import sys
+import os
+
+# Fix Windows console encoding
+if sys.platform == 'win32':
+    os.system('chcp 65001 > nul')
+
+
+_STOP = object()  # Queue sentinel that stops one worker thread
+BACKPRESSURE_FILE = 'reasoner_backpressure'
+BACKPRESSURE_MAX_AGE = 60.0  # Seconds before an unrefreshed flag is ignored
+
+
+def signal_backpressure(state_dir: Path, active: bool):
+    """
+    Raise (or refresh) or clear the backpressure flag.
+    
+    Args:
+        state_dir: Vault/.state
+        active: True while producers should hold off
+    """
+    flag = state_dir / BACKPRESSURE_FILE
+    if active:
+        state_dir.mkdir(parents=True, exist_ok=True)
+        flag.write_text(f'{time.time():.0f}\n', encoding='utf-8')
+    else:
+        try:
+            flag.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def backpressure_active(state_dir: Path, max_age: float = BACKPRESSURE_MAX_AGE) -> bool:
+    """True if a consumer raised the flag within the last `max_age` seconds."""
+    try:
+        return time.time() - (state_dir / BACKPRESSURE_FILE).stat().st_mtime < max_age
+    except OSError:
+        return False
+
+
+class Stage:
+    """One pipeline step: a function, its worker count and its input queue bound."""
+    
+    def __init__(self, name: str, fn: Callable[[Any], Any], workers: int = 1, queue_size: int = 64):
+        """
+        Initialize stage.
+        
+        Args:
+            name: Stage name (used in metrics and thread names)
+            fn: item -> item for the next stage (None drops the item)
+            workers: Worker threads for this stage
+            queue_size: Maximum items waiting in front of this stage
+        """
+        self.name = name
+        self.fn = fn
+        self.workers = max(1, workers)
+        self.queue_size = max(1, queue_size)
+        self.queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        self.threads: List[threading.Thread] = []
+        
+        self._lock = threading.Lock()
+        self.processed = 0
+        self.errors = 0
+        self.max_depth = 0
+        self.busy = 0.0
+        self.waited = 0.0
+    
+    def put(self, item: Any):
+        """Queue an item (blocks while the stage is full)."""
+        self.queue.put((time.perf_counter(), item))
+        depth = self.queue.qsize()
+        if depth > self.max_depth:
+            self.max_depth = depth
+    
+    def metrics(self, elapsed: float) -> Dict[str, Any]:
+        with self._lock:
+            processed, errors, busy, waited = self.processed, self.errors, self.busy, self.waited
+        done = processed + errors
+        return {
+            'workers': self.workers,
+            'processed': processed,
+            'errors': errors,
+            'queue_depth': self.queue.qsize(),
+            'max_queue_depth': self.max_depth,
+            'queue_size': self.queue_size,
+            'items_per_s': processed / elapsed if elapsed > 0 else 0.0,
+            'avg_wait_ms': waited / done * 1000 if done else 0.0,
+            'avg_service_ms': busy / done * 1000 if done else 0.0,
+            'utilization': busy / (elapsed * self.workers) if elapsed > 0 else 0.0
+        }
+
+
+class TaskPipeline:
+    """Runs items through a chain of stages connected by bounded queues."""
+    
+    def __init__(
+        self,
+        stages: List[Stage],
+        on_done: Optional[Callable[[Any], None]] = None,
+        on_error: Optional[Callable[[Any, Exception, str], None]] = None
+    ):
+        """
+        Initialize pipeline.
+        
+        Args:
+            stages: Stages in order
+            on_done: Called with the last stage's result (on that stage's thread)
+            on_error: Called with (item, exception, stage name) when a stage raises
+        """
+        if not stages:
+            raise ValueError("A pipeline needs at least one stage")
+        self.stages = stages
+        self.on_done = on_done
+        self.on_error = on_error
+        self.logger = logging.getLogger(self.__class__.__name__)
+        
+        self._inflight = 0
+        self._idle = threading.Condition()
+        self._started_at: Optional[float] = None
+        self._stopped_at: Optional[float] = None
+    
+    @property
+    def capacity(self) -> int:
+        """
+        Queue slots across all stages.
+        
+        Callers that submit from on_done must keep fewer items than this in
+        flight - then a full pipeline can never block its own last stage.
+        """
+        return sum(stage.queue_size for stage in self.stages)
+    
+    @property
+    def inflight(self) -> int:
+        return self._inflight
+    
+    @property
+    def running(self) -> bool:
+        return any(stage.threads for stage in self.stages)
+    
+    def start(self):
+        """Start every stage's worker threads."""
+        if self.running:
+            return
+        self._started_at = time.perf_counter()
+        self._stopped_at = None
+        for index, stage in enumerate(self.stages):
+            for n in range(stage.workers):
+                thread = threading.Thread(
+                    target=self._worker, args=(index,), name=f'Stage-{stage.name}-{n}', daemon=True
+                )
+                stage.threads.append(thread)
+                thread.start()
+    
+    def submit(self, item: Any, timeout: Optional[float] = None) -> bool:
+        """
+        Feed an item into the first stage.
+        
+        Args:
+            item: Work item
+            timeout: Seconds to wait for room (None = wait as long as needed)
+        
+        Returns:
+            False if the pipeline stayed full for `timeout` seconds
+        """
+        with self._idle:
+            self._inflight += 1
+        try:
+            first = self.stages[0]
+            first.queue.put((time.perf_counter(), item), timeout=timeout)
+            first.max_depth = max(first.max_depth, first.queue.qsize())
+            return True
+        except queue.Full:
+            self._item_left()
+            return False
+    
+    def _item_left(self):
+        with self._idle:
+            self._inflight -= 1
+            if self._inflight == 0:
+                self._idle.notify_all()
+    
+    def _worker(self, index: int):
+        stage = self.stages[index]
+        next_stage = self.stages[index + 1] if index + 1 < len(self.stages) else None
+        while True:
+            entry = stage.queue.get()
+            if entry is _STOP:
+                return
+            queued_at, item = entry
+            started = time.perf_counter()
+            try:
+                result = stage.fn(item)
+            except Exception as e:
+                with stage._lock:
+                    stage.errors += 1
+                    stage.waited += started - queued_at
+                    stage.busy += time.perf_counter() - started
+                if self.on_error:
+                    try:
+                        self.on_error(item, e, stage.name)
+                    except Exception as callback_error:
+                        self.logger.error(f"on_error callback failed: {callback_error}")
+                else:
+                    self.logger.error(f"Stage {stage.name} failed: {e}")
+                self._item_left()
+                continue
+            
+            with stage._lock:
+                stage.processed += 1
+                stage.waited += started - queued_at
+                stage.busy += time.perf_counter() - started
+            
+            if result is None:
+                self._item_left()
+            elif next_stage is not None:
+                # Blocks while the next stage is full - this is the backpressure
+                next_stage.put(result)
+            else:
+                try:
+                    if self.on_done:
+                        self.on_done(result)
+                except Exception as e:
+                    self.logger.error(f"on_done callback failed: {e}")
+                finally:
+                    self._item_left()
+    
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every submitted item has left the pipeline.
+        
+        Returns:
+            False on timeout
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self._inflight == 0, timeout=timeout)
+    
+    def stop(self, wait: bool = True):
+        """Finish queued items (if wait) and stop the worker threads."""
+        if not self.running:
+            return
+        if wait:
+            self.join()
+        for stage in self.stages:
+            for _ in stage.threads:
+                stage.queue.put(_STOP)
+        for stage in self.stages:
+            for thread in stage.threads:
+                thread.join()
+            stage.threads = []
+        self._stopped_at = time.perf_counter()
+    
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Per-stage metrics, in pipeline order (rates over the running time)."""
+        elapsed = 0.0
+        if self._started_at is not None:
+            elapsed = (self._stopped_at or time.perf_counter()) - self._started_at
+        return {stage.name: stage.metrics(elapsed) for stage in self.stages}
+    
+    def bottleneck(self) -> Optional[str]:
+        """Name of the stage with the highest utilization."""
+        metrics = self.get_metrics()
+        if not any(m['processed'] for m in metrics.values()):
+            return None
+        return max(metrics, key=lambda name: metrics[name]['utilization'])
+    
+    def format_metrics(self) -> List[str]:
+        """One line per stage, plus the bottleneck."""
+        lines = []
+        for name, m in self.get_metrics().items():
+            lines.append(
+                f"{name:<8} x{m['workers']}  {m['processed']:>6} done  "
+                f"{m['items_per_s']:8.1f}/s  depth {m['queue_depth']:>3}/{m['queue_size']} "
+                f"(max {m['max_queue_depth']:>3})  wait {m['avg_wait_ms']:7.2f} ms  "
+                f"service {m['avg_service_ms']:6.2f} ms  busy {m['utilization']:5.1%}"
+                + (f"  {m['errors']} failed" if m['errors'] else '')
+            )
+        bottleneck = self.bottleneck()
+        if bottleneck:
+            lines.append(f"bottleneck: {bottleneck}")
+        return lines
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    
+    print("\n" + "="*60)
+    print("TASK PIPELINE SELF-TEST")
+    print("="*60)
+    
+    done = []
+    pipeline = TaskPipeline([
+        Stage('fast', lambda n: n + 1, workers=1, queue_size=8),
+        Stage('slow', lambda n: (time.sleep(0.002), n * 2)[1], workers=2, queue_size=8),
+        Stage('sink', lambda n: n, workers=1, queue_size=8),
+    ], on_done=done.append)
+    pipeline.start()
+    start = time.perf_counter()
+    for n in range(500):
+        pipeline.submit(n)
+    pipeline.join()
+    elapsed = time.perf_counter() - start
+    print(f"\n  500 items in {elapsed:.2f}s, {len(done)} done, "
+          f"correct: {sorted(done) == [(n + 1) * 2 for n in range(500)]}")
+    for line in pipeline.format_metrics():
+        print(f"  {line}")
+    pipeline.stop()
+    
+    print("\n" + "="*60 + "\n")
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Task Queue - GOLD TIER
+Personal AI Employee Hackathon 0
+
+Urgency-ordered queue for pending Needs_Action work.
+
+Items wait in one FIFO per priority level (high, medium, low). pop() takes
+the head with the best *effective* priority, where every `age_step` seconds
+of waiting promotes an item by one level - so low-priority work is delayed
+behind urgent work but can never starve. Time spent in the queue is
+recorded per priority in a histogram, so urgent items can be checked
+against an SLA.
+
+Usage:
+    from task_queue import PriorityTaskQueue, PRIORITY_HIGH
+    
+    tasks = PriorityTaskQueue(age_step=300)
+    tasks.push(path, PRIORITY_HIGH)
+    path = tasks.pop()
+    print(tasks.format_wait_report())
+"""
+
+import time
+import bisect
+import threading
+from collections import deque
+from typing import Any, Dict, Hashable, List, Optional
+import sys
+import os
+
+# Fix Windows console encoding
+if sys.platform == 'win32':
+    os.system('chcp 65001 > nul')
+
+
+PRIORITY_HIGH = 0
+PRIORITY_MEDIUM = 1
+PRIORITY_LOW = 2
+PRIORITY_NAMES = {PRIORITY_HIGH: 'high', PRIORITY_MEDIUM: 'medium', PRIORITY_LOW: 'low'}
+
+# Frontmatter `priority:` values -> level
+PRIORITY_VALUES = {
+    'critical': PRIORITY_HIGH,
+    'urgent': PRIORITY_HIGH,
+    'high': PRIORITY_HIGH,
+    'medium': PRIORITY_MEDIUM,
+    'normal': PRIORITY_MEDIUM,
+    'low': PRIORITY_LOW,
+}
+
+# Histogram bucket upper bounds in seconds (last bucket is open-ended)
+WAIT_BUCKETS = (0.1, 0.5, 1, 5, 10, 30, 60, 300, 900, 3600)
+
+
+class WaitHistogram:
+    """Fixed-bucket histogram of queue wait times."""
+    
+    def __init__(self, buckets=WAIT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.total = 0
+        self.sum = 0.0
+        self.max = 0.0
+    
+    def record(self, seconds: float):
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.total += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+    
+    def percentile(self, pct: float) -> Optional[float]:
+        """Upper bound of the bucket holding the given percentile."""
+        if not self.total:
+            return None
+        rank = pct / 100 * self.total
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return self.buckets[i] if i < len(self.buckets) else self.max
+        return self.max
+    
+    def to_dict(self) -> Dict[str, Any]:
+        labels = [f'<={b}s' for b in self.buckets] + [f'>{self.buckets[-1]}s']
+        return {
+            'count': self.total,
+            'avg_s': self.sum / self.total if self.total else 0.0,
+            'max_s': self.max,
+            'p95_s': self.percentile(95),
+            'buckets': dict(zip(labels, self.counts))
+        }
+
+
+class PriorityTaskQueue:
+    """Multi-level FIFO queue with aging and per-priority wait histograms."""
+    
+    def __init__(self, age_step: float = 300.0):
+        """
+        Initialize queue.
+        
+        Args:
+            age_step: Seconds of waiting that promote an item by one level
+        """
+        self.age_step = age_step
+        self._levels: Dict[int, deque] = {level: deque() for level in PRIORITY_NAMES}
+        self._queued: set = set()
+        self._lock = threading.Lock()
+        self.wait_times: Dict[int, WaitHistogram] = {
+            level: WaitHistogram() for level in PRIORITY_NAMES
+        }
+    
+    def __len__(self) -> int:
+        return len(self._queued)
+    
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._queued
+    
+    def push(self, item: Hashable, priority: int = PRIORITY_MEDIUM) -> bool:
+        """
+        Queue an item (ignored if already queued).
+        
+        Args:
+            item: Hashable work item (e.g. a Path)
+            priority: PRIORITY_HIGH, PRIORITY_MEDIUM or PRIORITY_LOW
+        
+        Returns:
+            True if the item was added
+        """
+        with self._lock:
+            if item in self._queued:
+                return False
+            self._queued.add(item)
+            self._levels[priority].append((time.monotonic(), item))
+            return True
+    
+    def pop(self) -> Optional[Hashable]:
+        """
+        Remove and return the most urgent item, or None if empty.
+        
+        Effective priority is level - waited / age_step; ties go to the
+        item that has waited longest.
+        """
+        with self._lock:
+            now = time.monotonic()
+            best = None
+            for level, items in self._levels.items():
+                if not items:
+                    continue
+                queued_at = items[0][0]
+                score = (level - (now - queued_at) / self.age_step, queued_at)
+                if best is None or score < best[0]:
+                    best = (score, level)
+            if best is None:
+                return None
+            
+            level = best[1]
+            queued_at, item = self._levels[level].popleft()
+            self._queued.discard(item)
+            self.wait_times[level].record(now - queued_at)
+            return item
+    
+    def depths(self) -> Dict[str, int]:
+        """Queued items per priority name."""
+        with self._lock:
+            return {PRIORITY_NAMES[level]: len(items) for level, items in self._levels.items()}
+    
+    def get_wait_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Wait-time histogram per priority name."""
+        with self._lock:
+            return {
+                PRIORITY_NAMES[level]: histogram.to_dict()
+                for level, histogram in self.wait_times.items()
+            }
+    
+    def format_wait_report(self) -> List[str]:
+        """One summary line per priority that has seen traffic."""
+        lines = []
+        for name, stats in self.get_wait_stats().items():
+            if not stats['count']:
+                continue
+            lines.append(
+                f"{name:<6} n={stats['count']:<6} avg {stats['avg_s']:.2f}s  "
+                f"p95 <= {stats['p95_s']}s  max {stats['max_s']:.2f}s"
+            )
+        return lines
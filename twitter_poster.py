@@ -22,6 +22,7 @@ from pathlib import Path
 from datetime import datetime
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
 import time
+from approval_dispatcher import ApprovalDispatcher
 
 # Fix Windows console encoding
 if sys.platform == 'win32':
@@ -38,7 +39,7 @@ logger = logging.getLogger(__name__)
 class TwitterPoster:
     """Post to Twitter/X via browser automation - LinkedIn pattern."""
 
-    def __init__(self, vault_path: Path, session_path: Path = None):
+    def __init__(self, vault_path: Path, session_path: Path = None, dispatcher: ApprovalDispatcher = None):
         self.vault_path = vault_path
         self.approved_folder = vault_path / 'Approved'
         self.done_folder = vault_path / 'Done'
@@ -49,18 +50,12 @@ class TwitterPoster:
         for folder in [self.approved_folder, self.done_folder, self.logs_folder, self.session_path]:
             folder.mkdir(parents=True, exist_ok=True)
 
+        self.dispatcher = dispatcher or ApprovalDispatcher(vault_path)
         logger.info("Twitter Poster initialized")
 
     def check_approved_posts(self) -> list:
-        """Check for approved Twitter post files."""
-        approved_files = []
-
-        for f in self.approved_folder.glob('*.md'):
-            content = f.read_text(encoding='utf-8')
-            if 'type: twitter' in content.lower():
-                approved_files.append(f)
-
-        return approved_files
+        """Claim approved Twitter post files."""
+        return self.dispatcher.claim('twitter')
 
     def parse_post_file(self, filepath: Path) -> dict:
         """Parse Twitter post file and extract content."""
@@ -378,6 +373,9 @@ class TwitterPoster:
                         edit_mode=edit_mode,
                         image_arg=image_arg
                     )
+                    # Not posted - hand it back for the next run
+                    if filepath.exists():
+                        self.dispatcher.release(filepath)
             else:
                 print("No approved Twitter posts found")
 
@@ -0,0 +1,454 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Vault Index - GOLD TIER
+Personal AI Employee Hackathon 0
+
+SQLite index of the vault's task folders, so components can ask for
+"approved files of type X" without opening every file in the folder.
+
+Each markdown file is stored as one row:
+    (path, folder, name, type, status, created, mtime, size, frontmatter JSON)
+
+The index is kept current in two ways:
+1. File events (watchdog) update single rows as files are created, moved,
+   modified or deleted - call start() in long-running processes.
+2. reconcile() compares each folder against the index by size/mtime and only
+   re-reads the frontmatter of files that changed. Without a watcher,
+   find() reconciles the queried folder first (a stat-only scan).
+
+Usage:
+    from vault_index import VaultIndex
+    
+    index = VaultIndex(vault_path)
+    for path in index.find('Approved', type='email_reply'):
+        ...
+    
+    python vault_index.py Vault              # reconcile and print counts
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+import sys
+
+from frontmatter_reader import FrontmatterReader
+
+# Fix Windows console encoding
+if sys.platform == 'win32':
+    os.system('chcp 65001 > nul')
+
+
+DEFAULT_FOLDERS = (
+    'Needs_Action',
+    'Plans',
+    'Pending_Approval',
+    'Approved',
+    'Rejected',
+    'In_Progress',
+    'Done',
+    'Errors',
+)
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    folder TEXT NOT NULL,
+    name TEXT NOT NULL,
+    type TEXT,
+    status TEXT,
+    created TEXT,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    frontmatter TEXT NOT NULL DEFAULT '{}'
+);
+CREATE INDEX IF NOT EXISTS idx_files_folder_type ON files(folder, type);
+CREATE INDEX IF NOT EXISTS idx_files_folder_status ON files(folder, status);
+CREATE INDEX IF NOT EXISTS idx_files_folder_name ON files(folder, name);
+'''
+
+
+class VaultIndex:
+    """SQLite-backed index of vault markdown files and their frontmatter."""
+    
+    def __init__(
+        self,
+        vault_path: Path,
+        db_path: Optional[Path] = None,
+        folders: Iterable[str] = DEFAULT_FOLDERS
+    ):
+        """
+        Initialize vault index.
+        
+        Args:
+            vault_path: Path to Obsidian vault
+            db_path: SQLite file (default: Vault/.vault_index.db)
+            folders: Top-level vault folders to index
+        """
+        self.vault_path = Path(vault_path)
+        self.db_path = Path(db_path) if db_path else self.vault_path / '.vault_index.db'
+        self.folders = tuple(folders)
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.reader = FrontmatterReader()
+        
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(
+            str(self.db_path), timeout=30, check_same_thread=False
+        )
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+        
+        # Watcher state
+        self._observer = None
+        self._reconcile_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+    
+    @property
+    def watching(self) -> bool:
+        """True while file events are keeping the index current."""
+        return self._observer is not None
+    
+    def _key(self, path: Path) -> Optional[tuple]:
+        """Get (relative path, folder) for an indexed file, or None."""
+        try:
+            relative = Path(path).relative_to(self.vault_path)
+        except ValueError:
+            return None
+        parts = relative.parts
+        if len(parts) != 2 or parts[0] not in self.folders or relative.suffix != '.md':
+            return None
+        return relative.as_posix(), parts[0]
+    
+    def update_file(self, path: Path, stat: Optional[os.stat_result] = None) -> bool:
+        """
+        Index a single file, re-reading its frontmatter only if it changed.
+        
+        Args:
+            path: Path to file inside an indexed folder
+            stat: Optional stat result (saves a syscall during scans)
+        
+        Returns:
+            True if the row was inserted or updated
+        """
+        key = self._key(path)
+        if key is None:
+            return False
+        rel_path, folder = key
+        
+        try:
+            stat = stat or os.stat(path)
+        except FileNotFoundError:
+            self.remove_file(path)
+            return False
+        
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT mtime_ns, size FROM files WHERE path = ?', (rel_path,)
+            ).fetchone()
+            if row is not None and row == (stat.st_mtime_ns, stat.st_size):
+                return False
+        
+        try:
+            header = self.reader.read(Path(path))
+        except (FileNotFoundError, PermissionError):
+            return False
+        
+        created = header.get('created') or header.get('received') or header.get('timestamp')
+        record = (
+            rel_path,
+            folder,
+            Path(path).name,
+            str(header['type']).lower() if 'type' in header else None,
+            str(header['status']).lower() if 'status' in header else None,
+            str(created) if created is not None else None,
+            stat.st_mtime_ns,
+            stat.st_size,
+            json.dumps(header, ensure_ascii=False, default=str)
+        )
+        
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO files '
+                '(path, folder, name, type, status, created, mtime_ns, size, frontmatter) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                record
+            )
+            self._conn.commit()
+        return True
+    
+    def remove_file(self, path: Path) -> bool:
+        """Remove a file from the index."""
+        key = self._key(path)
+        if key is None:
+            return False
+        with self._lock:
+            cursor = self._conn.execute('DELETE FROM files WHERE path = ?', (key[0],))
+            self._conn.commit()
+        return cursor.rowcount > 0
+    
+    def move_file(self, src: Path, dest: Path):
+        """Record a move/rename between (or out of) indexed folders."""
+        self.remove_file(src)
+        self.update_file(dest)
+    
+    def reconcile(self, folders: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """
+        Bring the index in line with the folders on disk.
+        
+        Unchanged files cost one stat; only new or modified files have
+        their frontmatter read.
+        
+        Args:
+            folders: Folders to reconcile (default: all indexed folders)
+        
+        Returns:
+            Counts of 'scanned', 'updated' and 'removed' files
+        """
+        counts = {'scanned': 0, 'updated': 0, 'removed': 0}
+        
+        for folder in folders or self.folders:
+            folder_path = self.vault_path / folder
+            on_disk = {}
+            if folder_path.is_dir():
+                with os.scandir(folder_path) as entries:
+                    for entry in entries:
+                        if entry.name.endswith('.md') and entry.is_file():
+                            on_disk[entry.name] = entry
+            
+            with self._lock:
+                indexed = dict(
+                    (name, (mtime_ns, size)) for name, mtime_ns, size in self._conn.execute(
+                        'SELECT name, mtime_ns, size FROM files WHERE folder = ?', (folder,)
+                    )
+                )
+            
+            for name, entry in on_disk.items():
+                counts['scanned'] += 1
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                if indexed.get(name) != (stat.st_mtime_ns, stat.st_size):
+                    if self.update_file(Path(entry.path), stat):
+                        counts['updated'] += 1
+            
+            gone = [name for name in indexed if name not in on_disk]
+            if gone:
+                with self._lock:
+                    self._conn.executemany(
+                        'DELETE FROM files WHERE folder = ? AND name = ?',
+                        [(folder, name) for name in gone]
+                    )
+                    self._conn.commit()
+                counts['removed'] += len(gone)
+        
+        return counts
+    
+    def _query(
+        self,
+        columns: str,
+        folder: str,
+        type: Optional[str] = None,
+        type_prefix: Optional[str] = None,
+        status: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+        refresh: Optional[bool] = None
+    ) -> List[tuple]:
+        """Run a filtered query against one folder."""
+        if refresh or (refresh is None and not self.watching):
+            self.reconcile([folder])
+        
+        sql = f'SELECT {columns} FROM files WHERE folder = ?'
+        params: List[Any] = [folder]
+        if type is not None:
+            sql += ' AND type = ?'
+            params.append(type.lower())
+        if type_prefix is not None:
+            # Range scan so the (folder, type) index is used
+            sql += ' AND type >= ? AND type < ?'
+            params += [type_prefix.lower(), type_prefix.lower() + '\uffff']
+        if status is not None:
+            sql += ' AND status = ?'
+            params.append(status.lower())
+        if name_prefix is not None:
+            sql += ' AND name >= ? AND name < ?'
+            params += [name_prefix, name_prefix + '\uffff']
+        sql += ' ORDER BY name'
+        
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+    
+    def find(self, folder: str, **filters) -> List[Path]:
+        """
+        Find files in a folder by indexed fields.
+        
+        Args:
+            folder: Vault folder name (e.g. 'Approved')
+            type: Exact frontmatter type (case-insensitive)
+            type_prefix: Type prefix, e.g. 'twitter' matches 'twitter_post'
+            status: Exact frontmatter status (case-insensitive)
+            name_prefix: File name prefix, e.g. 'ERROR_'
+            refresh: Reconcile the folder first (default: only when not watching)
+        
+        Returns:
+            List of matching file paths
+        """
+        rows = self._query('path', folder, **filters)
+        return [self.vault_path / path for (path,) in rows]
+    
+    def find_records(self, folder: str, **filters) -> List[Dict[str, Any]]:
+        """Like find(), but return full rows with parsed frontmatter."""
+        rows = self._query(
+            'path, name, type, status, created, mtime_ns, size, frontmatter',
+            folder, **filters
+        )
+        return [
+            {
+                'path': self.vault_path / path,
+                'name': name,
+                'type': type_,
+                'status': status,
+                'created': created,
+                'mtime_ns': mtime_ns,
+                'size': size,
+                'frontmatter': json.loads(frontmatter)
+            }
+            for path, name, type_, status, created, mtime_ns, size, frontmatter in rows
+        ]
+    
+    def count_by_type(self, folder: str, refresh: Optional[bool] = None) -> Dict[str, int]:
+        """Count files in a folder grouped by type."""
+        if refresh or (refresh is None and not self.watching):
+            self.reconcile([folder])
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT COALESCE(type, ?), COUNT(*) FROM files WHERE folder = ? GROUP BY type',
+                ('unknown', folder)
+            ).fetchall()
+        return dict(rows)
+    
+    def start(self, reconcile_interval: float = 300.0):
+        """
+        Keep the index current from file events, with a periodic reconcile.
+        
+        Args:
+            reconcile_interval: Seconds between safety-net reconcile scans
+        """
+        if self.watching:
+            return
+        
+        from watchdog.observers import Observer
+        
+        for folder in self.folders:
+            (self.vault_path / folder).mkdir(parents=True, exist_ok=True)
+        
+        self.reconcile()
+        
+        observer = Observer()
+        handler = VaultIndexHandler(self)
+        for folder in self.folders:
+            observer.schedule(handler, str(self.vault_path / folder), recursive=False)
+        observer.start()
+        self._observer = observer
+        
+        self._stop_event.clear()
+        self._reconcile_thread = threading.Thread(
+            target=self._reconcile_loop,
+            args=(reconcile_interval,),
+            name='VaultIndexReconcile',
+            daemon=True
+        )
+        self._reconcile_thread.start()
+        self.logger.info(f"Watching {len(self.folders)} vault folders")
+    
+    def _reconcile_loop(self, interval: float):
+        """Periodic reconcile - catches events the watcher missed."""
+        while not self._stop_event.wait(interval):
+            try:
+                counts = self.reconcile()
+                if counts['updated'] or counts['removed']:
+                    self.logger.info(f"Reconcile fixed {counts['updated']} updated, "
+                                     f"{counts['removed']} removed")
+            except Exception as e:
+                self.logger.error(f"Error reconciling vault index: {e}")
+    
+    def stop(self):
+        """Stop watching file events."""
+        self._stop_event.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+    
+    def close(self):
+        """Stop watching and close the database."""
+        self.stop()
+        with self._lock:
+            self._conn.close()
+
+
+def _make_handler_base():
+    """Use watchdog's handler base class when available."""
+    try:
+        from watchdog.events import FileSystemEventHandler
+        return FileSystemEventHandler
+    except ImportError:
+        return object
+
+
+class VaultIndexHandler(_make_handler_base()):
+    """Applies watchdog file events to a VaultIndex."""
+    
+    def __init__(self, index: VaultIndex):
+        super().__init__()
+        self.index = index
+    
+    def on_created(self, event):
+        if not event.is_directory:
+            self.index.update_file(Path(event.src_path))
+    
+    def on_modified(self, event):
+        if not event.is_directory:
+            self.index.update_file(Path(event.src_path))
+    
+    def on_moved(self, event):
+        if not event.is_directory:
+            self.index.move_file(Path(event.src_path), Path(event.dest_path))
+    
+    def on_deleted(self, event):
+        if not event.is_directory:
+            self.index.remove_file(Path(event.src_path))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print("Usage: python vault_index.py <vault_path>")
+        sys.exit(1)
+    
+    index = VaultIndex(Path(sys.argv[1]))
+    
+    print("\n" + "="*60)
+    print("VAULT INDEX")
+    print("="*60)
+    
+    start = time.perf_counter()
+    counts = index.reconcile()
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"\nReconciled {counts['scanned']} files in {elapsed:.1f} ms "
+          f"({counts['updated']} updated, {counts['removed']} removed, "
+          f"{index.reader.bytes_read:,} frontmatter bytes read)")
+    
+    for folder in index.folders:
+        by_type = index.count_by_type(folder, refresh=False)
+        if by_type:
+            summary = ', '.join(f"{t}: {c}" for t, c in sorted(by_type.items()))
+            print(f"  {folder}: {summary}")
+    
+    print("\n" + "="*60 + "\n")
@@ -491,7 +491,7 @@ logs_folder = vault / 'Logs'
 if audit_logger.exists():
     print(f"  {GREEN}[OK]{RESET} audit_logger.py exists")
 if logs_folder.exists():
-    log_files = list(logs_folder.glob('*.json'))
+    log_files = list(logs_folder.glob('*.json*'))
     if log_files:
         print(f"  {GREEN}[OK]{RESET} {len(log_files)} log files present")
         gold_score += 1
@@ -8,6 +8,8 @@ from pathlib import Path
 import time
 import sys
 
+from approval_dispatcher import ApprovalDispatcher
+
 def find_input_box(page):
     """Try multiple selectors to find WhatsApp message input box"""
     selectors = [
@@ -75,14 +77,15 @@ def main():
     print("WhatsApp Reply Sender - FIXED VERSION 2026")
     print("=" * 60)
 
+    # Claimed replies move to In_Progress/whatsapp_reply/ - only these are read in full
+    dispatcher = ApprovalDispatcher(vault)
     files = []
-    for f in approved.glob('*.md'):
+    for f in dispatcher.claim('whatsapp_reply'):
         try:
-            text = f.read_text(encoding='utf-8')
-            if 'type: whatsapp_reply' in text:
-                files.append((f, text))
+            files.append((f, f.read_text(encoding='utf-8')))
         except Exception as e:
             print(f"[!] Could not read {f.name}: {e}")
+            dispatcher.release(f)
 
     if not files:
         print("No approved WhatsApp replies found")
@@ -243,6 +246,11 @@ def main():
             import traceback
             traceback.print_exc()
 
+    # Anything not sent goes back to Approved/ for the next run
+    for filepath, _ in files:
+        if filepath.exists():
+            dispatcher.release(filepath)
+
     print("\nDone!")
 
 if __name__ == '__main__':
@@ -12,14 +12,15 @@ Note: Be aware of WhatsApp's terms of service when using automation.
 
 from playwright.sync_api import sync_playwright
 from base_watcher import BaseWatcher
+from keyword_matcher import KeywordMatcher
 from pathlib import Path
 from datetime import datetime
 import logging
 import time
 
 class WhatsAppWatcher(BaseWatcher):
-    def __init__(self, vault_path: str, session_path: str = None):
-        super().__init__(vault_path, check_interval=30)
+    def __init__(self, vault_path: str, session_path: str = None, scheduler=None, ingest=None):
+        super().__init__(vault_path, check_interval=30, scheduler=scheduler, ingest=ingest)
         
         # Default session path
         if session_path is None:
@@ -29,9 +30,10 @@ class WhatsAppWatcher(BaseWatcher):
         
         # Keywords to watch for
         self.keywords = ['urgent', 'asap', 'invoice', 'payment', 'help']
+        self.keyword_matcher = KeywordMatcher({'whatsapp': self.keywords}, amounts=False)
         
-        # Track processed chats to avoid duplicates
-        self.processed_chats = set()
+        # Track processed chats to avoid duplicates (persists across restarts)
+        self.processed_chats = self.open_seen_store('whatsapp_processed_chats')
         
         # Browser instance (kept open across cycles)
         self.playwright = None
@@ -156,7 +158,7 @@ class WhatsAppWatcher(BaseWatcher):
                         continue
                     
                     # Check if message contains keywords
-                    if any(kw in text for kw in self.keywords):
+                    if self.keyword_matcher.search(text):
                         # Extract chat name
                         chat_name = "Unknown"
                         try:
@@ -224,7 +226,7 @@ Message matched keywords: {', '.join(self.keywords)}
         filepath = self.needs_action / f'WHATSAPP_{safe_name}_{timestamp}.md'
         
         # Write with UTF-8 encoding to handle special characters
-        filepath.write_text(content, encoding='utf-8')
+        self.write_action_file(filepath, content)
         self.logger.info(f"Created WhatsApp action file: {filepath.name}")
         
         return filepath
@@ -235,7 +237,7 @@ Message matched keywords: {', '.join(self.keywords)}
         print()
         print("=" * 60)
         print("WhatsApp Watcher is running...")
-        print(f"Checking every {self.check_interval} seconds")
+        print(f"Checking every {self.check_interval} seconds (adapts to traffic)")
         print(f"Vault: {self.vault_path}")
         print(f"Output: {self.needs_action}")
         print(f"Keywords: {', '.join(self.keywords)}")
@@ -246,26 +248,52 @@ Message matched keywords: {', '.join(self.keywords)}
         
         try:
             while True:
-                items = self.check_for_updates()
-                if items:
-                    print(f"[{self._get_timestamp()}] Found {len(items)} WhatsApp message(s)")
-                    for item in items:
-                        self.create_action_file(item)
-                else:
-                    print(f"[{self._get_timestamp()}] No new WhatsApp messages")
-                
-                time.sleep(self.check_interval)
+                time.sleep(self.poll_once())
         except KeyboardInterrupt:
             print("\n\nStopping WhatsApp Watcher...")
         finally:
-            self._cleanup()
+            self.close()
             print("WhatsApp Watcher stopped.")
     
+    def poll_once(self) -> float:
+        """
+        Check WhatsApp Web once and write action files for new messages.
+        
+        The browser stays open between polls, so call this from one thread.
+        
+        Returns:
+            Seconds to sleep before the next poll
+        """
+        if self.reasoner_backlogged():
+            return self.check_interval
+        started = time.perf_counter()
+        items = self.check_for_updates()
+        if items:
+            print(f"[{self._get_timestamp()}] Found {len(items)} WhatsApp message(s)")
+            for item in items:
+                self.create_action_file(item)
+        else:
+            print(f"[{self._get_timestamp()}] No new WhatsApp messages")
+        
+        return self.record_poll(len(items), started)
+    
+    def close(self):
+        """Close the browser session."""
+        self._cleanup()
+    
     def _get_timestamp(self):
         return datetime.now().strftime('%H:%M:%S')
 
 
 if __name__ == '__main__':
+    import argparse
+    from poll_scheduler import AdaptiveScheduler, FixedScheduler, parse_quiet_hours
+    
+    parser = argparse.ArgumentParser(description='WhatsApp Watcher')
+    parser.add_argument('--quiet-hours', metavar='START-END', help='Poll rarely between these hours, e.g. 23-7')
+    parser.add_argument('--fixed-interval', action='store_true', help='Always wait check_interval (no adaptive polling)')
+    args = parser.parse_args()
+    
     # Setup logging
     logging.basicConfig(
         level=logging.INFO,
@@ -281,5 +309,9 @@ if __name__ == '__main__':
         sys.exit(1)
     
     # Create and run watcher
-    watcher = WhatsAppWatcher(str(vault_path))
+    if args.fixed_interval:
+        scheduler = FixedScheduler(30)
+    else:
+        scheduler = AdaptiveScheduler(30, quiet_hours=parse_quiet_hours(args.quiet_hours))
+    watcher = WhatsAppWatcher(str(vault_path), scheduler=scheduler)
     watcher.run()